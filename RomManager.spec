@@ -25,6 +25,7 @@ def _resolve_base_dir() -> Path:
 # aunque se invoque desde otro directorio.
 BASE_DIR = _resolve_base_dir()
 ICON_PATH = BASE_DIR / "resources" / "romMan.ico"
+RETROBAT_FOLDERS_PATH = BASE_DIR / "resources" / "retrobat_folders.json"
 
 block_cipher = None
 
@@ -41,7 +42,7 @@ a = Analysis(
     ['rom_manager/main.py'],
     pathex=[str(BASE_DIR)],
     binaries=[],
-    datas=[(str(ICON_PATH), 'resources')],
+    datas=[(str(ICON_PATH), 'resources'), (str(RETROBAT_FOLDERS_PATH), 'resources')],
     hiddenimports=_py7zr_hidden,
     hookspath=[],
     runtime_hooks=[],
@@ -7,9 +7,30 @@ implementación en un módulo dedicado, se mejora la legibilidad del
 código principal de la aplicación y se favorece la reutilización.
 """
 
+import collections
+import logging
 import os
 import sqlite3
-from typing import Optional, List, Tuple
+from pathlib import Path
+from typing import Dict, Optional, List, Sequence, Tuple
+
+# Posición de cada columna en las filas de enlaces. ``search_links``,
+# ``get_links_by_rom`` y ``get_links_by_roms`` usan el mismo SELECT, de modo
+# que los bucles intensivos pueden indexar por entero en lugar de por nombre.
+(
+    LINK_COL_ID,
+    LINK_COL_ROM_ID,
+    LINK_COL_ROM_NAME,
+    LINK_COL_SYSTEM_ID,
+    LINK_COL_SYSTEM_NAME,
+    LINK_COL_SERVER,
+    LINK_COL_FMT,
+    LINK_COL_SIZE,
+    LINK_COL_HASH,
+    LINK_COL_LANGS,
+    LINK_COL_URL,
+    LINK_COL_LABEL,
+) = range(12)
 
 
 class Database:
@@ -30,7 +51,24 @@ class Database:
         """
         if not os.path.exists(self.db_path):
             raise FileNotFoundError(f"No existe la BD: {self.db_path}")
-        self.conn = sqlite3.connect(self.db_path)
+        # La aplicación solo lee de la BD: abrirla en modo de solo lectura evita
+        # bloqueos de escritura y que SQLite prepare transacciones de escritura.
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        self.conn = sqlite3.connect(uri, uri=True)
+        self.conn.execute("PRAGMA query_only=1")
+        # Ajustes de lectura por conexión: temporales en memoria, E/S mapeada
+        # (256 MiB) y 64 MiB de caché de páginas. ``journal_mode``/``synchronous``
+        # solo afectan a escrituras y no pueden cambiarse en modo de solo lectura.
+        self.conn.executescript(
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA mmap_size=268435456;"
+            "PRAGMA cache_size=-65536;"
+        )
+        logging.debug(
+            "Opened %s read-only (journal_mode=%s)",
+            self.db_path,
+            self.conn.execute("PRAGMA journal_mode").fetchone()[0],
+        )
         # Devolver filas como diccionarios para un acceso más cómodo en la UI
         self.conn.row_factory = sqlite3.Row
         # Detectar columnas disponibles en la tabla 'links'
@@ -219,34 +257,63 @@ class Database:
 
     def get_links_by_rom(self, rom_id: int) -> List[sqlite3.Row]:
         """Obtiene todos los links asociados a una ROM específica."""
+        return self.get_links_by_roms([rom_id])
+
+    def get_links_by_roms(self, rom_ids: List[int], chunk_size: int = 900) -> List[sqlite3.Row]:
+        """
+        Obtiene los links de varias ROMs con una consulta por lote.
+
+        Equivale a llamar a :meth:`get_links_by_rom` para cada identificador,
+        pero evita una consulta por ROM. Las filas se devuelven ordenadas por
+        ROM y link para que el llamador pueda agruparlas por ``rom_id``.
+        """
         assert self.conn
+        ids = list(dict.fromkeys(int(r) for r in rom_ids))
+        if not ids:
+            return []
         hash_select = (
             "links.hash          AS hash,"
             if self._has_links_hash
             else "NULL               AS hash,"
         )
-        sql = f"""
-        SELECT
-            links.id            AS link_id,
-            roms.id             AS rom_id,
-            roms.name           AS rom_name,
-            roms.system_id      AS system_id,
-            systems.name        AS system_name,
-            links.server_name   AS server,
-            links.fmt           AS fmt,
-            links.size          AS size,
-            {hash_select}
-            COALESCE(GROUP_CONCAT(languages.code, ','), links.languages) AS langs,
-            links.url           AS url,
-            links.label         AS label
-        FROM links
-        JOIN roms    ON roms.id = links.rom_id
-        JOIN systems ON systems.id = roms.system_id
-        LEFT JOIN link_languages ON link_languages.link_id = links.id
-        LEFT JOIN languages      ON languages.id = link_languages.language_id
-        WHERE roms.id = ?
-        GROUP BY links.id
-        ORDER BY links.id
+        rows: List[sqlite3.Row] = []
+        for i in range(0, len(ids), chunk_size):
+            chunk = ids[i:i + chunk_size]
+            placeholders = ",".join("?" for _ in chunk)
+            sql = f"""
+            SELECT
+                links.id            AS link_id,
+                roms.id             AS rom_id,
+                roms.name           AS rom_name,
+                roms.system_id      AS system_id,
+                systems.name        AS system_name,
+                links.server_name   AS server,
+                links.fmt           AS fmt,
+                links.size          AS size,
+                {hash_select}
+                COALESCE(GROUP_CONCAT(languages.code, ','), links.languages) AS langs,
+                links.url           AS url,
+                links.label         AS label
+            FROM links
+            JOIN roms    ON roms.id = links.rom_id
+            JOIN systems ON systems.id = roms.system_id
+            LEFT JOIN link_languages ON link_languages.link_id = links.id
+            LEFT JOIN languages      ON languages.id = link_languages.language_id
+            WHERE roms.id IN ({placeholders})
+            GROUP BY links.id
+            ORDER BY roms.id, links.id
+            """
+            rows.extend(self.conn.execute(sql, chunk).fetchall())
+        return rows
+
+    def get_links_grouped_by_rom(self, rom_ids: Sequence[int]) -> Dict[int, List[sqlite3.Row]]:
         """
-        cur = self.conn.execute(sql, (rom_id,))
-        return cur.fetchall()
+        Obtiene los links de varias ROMs agrupados por ``rom_id``.
+
+        Usa las consultas por lote de :meth:`get_links_by_roms` y recorre el
+        cursor una sola vez; las ROMs sin links no aparecen en el resultado.
+        """
+        grouped: Dict[int, List[sqlite3.Row]] = collections.defaultdict(list)
+        for row in self.get_links_by_roms(list(rom_ids)):
+            grouped[row[LINK_COL_ROM_ID]].append(row)
+        return grouped
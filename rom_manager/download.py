@@ -1,7 +1,8 @@
 """
 Módulo que gestiona las descargas concurrentes de ROMs.
 
-Incluye las clases DownloadSignals, DownloadTask, DownloadItem y DownloadManager.
+Incluye las clases DownloadSignals, DownloadTask, DownloadItem, SessionEntry,
+DownloadManager y la cola de extracciones ExtractionQueue.
 Al separar la lógica de descarga de la interfaz de usuario, el código resulta
 más limpio y fácil de mantener.
 """
@@ -11,8 +12,9 @@ import time
 import math
 import threading
 import hashlib
-from typing import Any, Dict, Optional, List
-from dataclasses import dataclass
+import queue
+from typing import Any, ClassVar, Dict, Optional, List
+from dataclasses import dataclass, field
 
 import logging
 import requests
@@ -316,10 +318,12 @@ class DownloadTask(QRunnable):
             self.signals.failed.emit(str(e))
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadItem:
     """
     Estructura que representa un elemento de la cola de descargas.
+
+    Usa ``__slots__``: cualquier atributo nuevo debe declararse como campo.
     """
 
     name: str
@@ -331,7 +335,127 @@ class DownloadItem:
     row: Optional[int] = None
     category: str = ""
     metadata: Optional[Dict[str, Any]] = None
-    extract_task: Optional['ExtractionTask'] = None
+    # Identificador del trabajo de extracción en curso en ``ExtractionQueue``
+    extract_job: Optional[int] = None
+    # Caché de (nombre saneado, ruta final); se calcula la primera vez que se necesita
+    _paths: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Tarea cuyas señales ya están enlazadas con la interfaz (evita enlaces duplicados)
+    _bound_task: Optional[DownloadTask] = field(default=None, init=False, repr=False, compare=False)
+    # Temporizador que reintenta el enlace mientras la descarga sigue en cola
+    _bind_timer: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+
+    def _resolve_paths(self) -> tuple:
+        """Calcula (una sola vez) el nombre saneado y la ruta final del fichero."""
+        paths = self._paths
+        if paths is None:
+            name = safe_filename(self.name)
+            paths = (name, os.path.join(os.path.expanduser(self.dest_dir), name))
+            self._paths = paths
+        return paths
+
+    @property
+    def safe_name(self) -> str:
+        """Nombre de fichero saneado para el sistema de archivos."""
+        return self._resolve_paths()[0]
+
+    @property
+    def final_path(self) -> str:
+        """Ruta completa del fichero descargado."""
+        return self._resolve_paths()[1]
+
+    @property
+    def part_path(self) -> str:
+        """Ruta del fichero parcial (``.part``) usado durante la descarga."""
+        return self._resolve_paths()[1] + '.part'
+
+
+@dataclass(slots=True)
+class DownloadRowInfo:
+    """Datos mostrados en la tabla de descargas para un elemento sin fila de la base de datos."""
+
+    system_name: str = ""
+    fmt: str = ""
+    size: str = ""
+    display_name: Optional[str] = None
+
+
+@dataclass(slots=True)
+class SessionEntry:
+    """
+    Entrada persistida de la sesión de descargas.
+
+    Se guarda como una fila con el orden de ``COLUMNS``; los metadatos se
+    guardan aparte porque solo los tienen algunos elementos.
+    """
+
+    COLUMNS: ClassVar[tuple] = ("name", "url", "dest", "hash", "system", "category")
+
+    name: str
+    url: str
+    dest: str
+    hash: Optional[str] = None
+    system: str = ""
+    category: str = ""
+    metadata: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_item(cls, item: DownloadItem) -> "SessionEntry":
+        return cls(
+            item.name,
+            item.url,
+            item.dest_dir,
+            item.expected_hash,
+            item.system_name,
+            item.category,
+            item.metadata if isinstance(item.metadata, dict) else None,
+        )
+
+    @classmethod
+    def from_mapping(cls, data: Dict[str, Any], default_dest: str = "") -> Optional["SessionEntry"]:
+        """Crea la entrada a partir de un diccionario; ``None`` si faltan campos obligatorios."""
+        name = data.get('name'); url = data.get('url'); dest = data.get('dest') or default_dest
+        if not (name and url and dest):
+            return None
+        metadata = data.get('metadata')
+        return cls(
+            name,
+            url,
+            dest,
+            data.get('hash'),
+            data.get('system') or "",
+            data.get('category') or "",
+            metadata if isinstance(metadata, dict) else None,
+        )
+
+    def to_row(self) -> list:
+        return [self.name, self.url, self.dest, self.hash, self.system, self.category]
+
+    def to_item(self) -> DownloadItem:
+        return DownloadItem(
+            name=self.name,
+            url=self.url,
+            dest_dir=self.dest,
+            expected_hash=self.hash,
+            system_name=self.system,
+            category=self.category,
+            metadata=self.metadata,
+        )
+
+    def row_info(self) -> DownloadRowInfo:
+        """Datos de la fila de la tabla de descargas para esta entrada."""
+        info = DownloadRowInfo(system_name=self.system)
+        metadata = self.metadata
+        if self.category == 'emulator':
+            info.fmt = 'Emulador'
+            if metadata:
+                info.display_name = metadata.get('emulator_name', self.name)
+        elif self.category == 'emulator-extra':
+            info.fmt = metadata.get('folder_name', 'Archivos extras') if metadata else 'Archivos extras'
+            if metadata:
+                extra_label = metadata.get('extra_label', self.name)
+                emulator_name = metadata.get('emulator_name', '')
+                info.display_name = f"{emulator_name} — {extra_label}".strip(" —")
+        return info
 
 
 class DownloadManager(QObject):
@@ -350,6 +474,11 @@ class DownloadManager(QObject):
         self._queue: List[DownloadItem] = []
         self._active: List[DownloadItem] = []
 
+    @property
+    def has_pending(self) -> bool:
+        """Indica si queda alguna descarga activa o en cola."""
+        return bool(self._active or self._queue)
+
     def set_max_concurrent(self, n: int) -> None:
         self.max_concurrent = max(1, min(5, int(n)))
         self.pump()
@@ -359,6 +488,13 @@ class DownloadManager(QObject):
         self.queue_changed.emit()
         self.pump()
 
+    def add_many(self, items: List[DownloadItem]) -> None:
+        """Encola varios elementos notificando y repartiendo la cola una sola vez."""
+        if not items:
+            return
+        self._queue.extend(items)
+        self.pump()
+
     def enqueue(self, item: DownloadItem) -> None:
         """Alias de :meth:`add` para compatibilidad."""
         self.add(item)
@@ -425,23 +561,143 @@ class DownloadManager(QObject):
             it.task.cancel()
 
 
-class ExtractionTask(QRunnable):
-    """Tarea que ejecuta la extracción de un archivo en segundo plano."""
+class ExtractionSignals(QObject):
+    """Señales compartidas por los workers de :class:`ExtractionQueue`.
+
+    Todas incluyen el identificador del trabajo para que la interfaz pueda
+    asociar el resultado con su elemento de descarga.
+    """
+
+    progress = pyqtSignal(int, 'qint64', 'qint64', str)  # job_id, done, total, status
+    finished_ok = pyqtSignal(int, str)  # job_id, dest_dir
+    failed = pyqtSignal(int, str)  # job_id, mensaje
+
+
+class _ExtractionWorker(QRunnable):
+    """Worker de larga duración que atiende trabajos de ``ExtractionQueue``."""
 
-    def __init__(self, archive_path: str, dest_dir: str) -> None:
+    def __init__(self, owner: 'ExtractionQueue') -> None:
         super().__init__()
-        self.archive_path = archive_path
-        self.dest_dir = dest_dir
-        self.signals = DownloadSignals()
+        self.owner = owner
 
     def run(self) -> None:  # pragma: no cover - depende de archivos externos
-        try:
-            self.signals.progress.emit(0, 1, 0.0, 0.0, 'Preparando extracción')
+        owner = self.owner
+        signals = owner.signals
+        while True:
+            try:
+                job = owner._jobs.get(timeout=owner.idle_timeout)
+            except queue.Empty:
+                # Sin trabajo: liberar el hilo del pool salvo que haya llegado algo
+                with owner._lock:
+                    if owner._jobs.empty():
+                        owner._workers -= 1
+                        return
+                continue
+            if job is None:
+                with owner._lock:
+                    owner._workers -= 1
+                return
+            job_id, archive_path, dest_dir = job
+            try:
+                signals.progress.emit(job_id, 0, 1, 'Preparando extracción')
+
+                def report(done: int, total: int, status: str, job_id: int = job_id) -> None:
+                    signals.progress.emit(job_id, done, total, status)
+
+                extract_archive(archive_path, dest_dir, progress=report)
+                signals.finished_ok.emit(job_id, dest_dir)
+            except Exception as exc:
+                signals.failed.emit(job_id, str(exc))
+
+
+class ExtractionQueue(QObject):
+    """
+    Cola de extracciones atendida por un número fijo de workers persistentes.
+
+    Los workers se reutilizan entre archivos, de modo que extraer muchos
+    archivos seguidos no crea una tarea y un juego de señales por archivo.
+    Los workers se ejecutan en un ``QThreadPool`` propio, así que una
+    extracción no ocupa hilos de las descargas ni espera detrás de ellas. Un
+    worker sin trabajo durante ``idle_timeout`` segundos termina.
+    """
 
-            def report(done: int, total: int, status: str) -> None:
-                self.signals.progress.emit(done, total, 0.0, 0.0, status)
+    def __init__(self, max_workers: Optional[int] = None, idle_timeout: float = 5.0) -> None:
+        super().__init__()
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(self.max_workers)
+        self.idle_timeout = idle_timeout
+        self.signals = ExtractionSignals()
+        self._jobs: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers = 0
+        self._next_id = 0
+
+    def submit(self, archive_path: str, dest_dir: str) -> int:
+        """Encola la extracción y devuelve el identificador del trabajo."""
+        with self._lock:
+            self._next_id += 1
+            job_id = self._next_id
+            self._jobs.put((job_id, archive_path, dest_dir))
+            if self._workers < self.max_workers:
+                self._workers += 1
+                self.pool.start(_ExtractionWorker(self))
+        return job_id
+
+    def shutdown(self) -> None:
+        """Pide a los workers activos que terminen cuando acaben su trabajo actual."""
+        with self._lock:
+            for _ in range(self._workers):
+                self._jobs.put(None)
+
+
+class UnlinkTask(QRunnable):
+    """Tarea que elimina una lista de ficheros en segundo plano.
+
+    Los ficheros se agrupan por carpeta. Donde el sistema lo permite
+    (``unlinkat`` en Linux/macOS) se abre cada carpeta una sola vez y se
+    borran sus ficheros de forma relativa a ese descriptor, evitando resolver
+    la ruta completa en cada borrado. En el resto de plataformas se usa
+    ``os.remove`` normal.
+    """
 
-            extract_archive(self.archive_path, self.dest_dir, progress=report)
-            self.signals.finished_ok.emit(self.dest_dir)
-        except Exception as exc:
-            self.signals.failed.emit(str(exc))
+    def __init__(self, paths: List[str]) -> None:
+        super().__init__()
+        self.paths = list(paths)
+
+    @staticmethod
+    def _group_by_dir(paths: List[str]) -> Dict[str, List[str]]:
+        groups: Dict[str, List[str]] = {}
+        for path in paths:
+            folder, name = os.path.split(path)
+            groups.setdefault(folder, []).append(name)
+        return groups
+
+    def run(self) -> None:  # pragma: no cover - depende del sistema de archivos
+        removed = 0
+        use_dir_fd = os.unlink in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+        for folder, names in self._group_by_dir(self.paths).items():
+            dir_fd = None
+            if use_dir_fd:
+                try:
+                    dir_fd = os.open(folder or ".", os.O_RDONLY | os.O_DIRECTORY)
+                except FileNotFoundError:
+                    continue
+                except OSError:
+                    dir_fd = None
+            try:
+                for name in names:
+                    try:
+                        if dir_fd is not None:
+                            os.unlink(name, dir_fd=dir_fd)
+                        else:
+                            os.remove(os.path.join(folder, name))
+                        removed += 1
+                    except FileNotFoundError:
+                        pass
+                    except OSError:
+                        logging.exception("Error deleting file %s", os.path.join(folder, name))
+            finally:
+                if dir_fd is not None:
+                    os.close(dir_fd)
+        logging.debug("Deleted %d of %d files in background", removed, len(self.paths))
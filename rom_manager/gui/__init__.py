@@ -1,3 +1,3 @@
-from .main_window import MainWindow
+from .main_window import MainWindow, app_icon
 
-__all__ = ["MainWindow"]
+__all__ = ["MainWindow", "app_icon"]
@@ -0,0 +1,174 @@
+"""
+Delegados de las vistas de tabla.
+
+Permiten que las tablas basadas en modelos muestren combos, botones y barras
+de progreso sin crear un widget persistente por fila: los combos solo existen
+mientras se edita la celda y los botones y barras se pintan con el estilo de
+la aplicación.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PyQt6.QtCore import Qt, QEvent, QModelIndex, QRect, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QPalette
+from PyQt6.QtWidgets import (
+    QApplication, QComboBox, QStyle, QStyledItemDelegate, QStyleOptionButton, QStyleOptionProgressBar,
+    QStyleOptionViewItem, QToolTip, QWidget
+)
+
+
+class ComboDelegate(QStyledItemDelegate):
+    """
+    Edita una celda con un ``QComboBox`` creado bajo demanda.
+
+    Las opciones se leen del rol ``options_role`` del modelo y el índice
+    elegido se escribe con ``EditRole`` en cuanto cambia la selección.
+    """
+
+    def __init__(self, options_role: int, parent=None) -> None:
+        super().__init__(parent)
+        self._options_role = options_role
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> QWidget:
+        combo = QComboBox(parent)
+        combo.currentIndexChanged.connect(lambda _=0, c=combo: self.commitData.emit(c))
+        return combo
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex) -> None:
+        values = index.data(self._options_role) or []
+        editor.blockSignals(True)
+        editor.clear()
+        editor.addItems([v or "" for v in values])
+        idx = index.data(Qt.ItemDataRole.EditRole)
+        if isinstance(idx, int) and 0 <= idx < editor.count():
+            editor.setCurrentIndex(idx)
+        editor.blockSignals(False)
+
+    def setModelData(self, editor: QWidget, model, index: QModelIndex) -> None:
+        if editor.currentIndex() >= 0:
+            model.setData(index, editor.currentIndex(), Qt.ItemDataRole.EditRole)
+
+    def updateEditorGeometry(self, editor: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        editor.setGeometry(option.rect)
+
+
+class ButtonsDelegate(QStyledItemDelegate):
+    """
+    Pinta varios botones en una celda y emite ``clicked(fila, botón)``.
+
+    Los botones no son widgets reales, así que la tabla puede tener miles de
+    filas sin coste adicional. Los textos son fijos (``labels``) o, con
+    ``buttons_role``, el modelo da por fila pares ``(icono, texto de ayuda)``.
+    """
+
+    clicked = pyqtSignal(int, int)
+
+    _ICON_BUTTON_WIDTH = 32
+
+    def __init__(self, labels: list[str], parent=None, buttons_role: Optional[int] = None) -> None:
+        super().__init__(parent)
+        self._labels = list(labels)
+        self._buttons_role = buttons_role
+        self._pressed: tuple[int, int] | None = None
+
+    def _buttons(self, index: QModelIndex) -> list[tuple]:
+        """Devuelve ``(texto, icono, ayuda)`` de cada botón de la celda."""
+        if self._buttons_role is None:
+            return [(label, None, "") for label in self._labels]
+        return [("", icon, tip) for icon, tip in (index.data(self._buttons_role) or ())]
+
+    @staticmethod
+    def _button_rects(rect: QRect, count: int) -> list[QRect]:
+        width = rect.width() // count if count else 0
+        return [
+            QRect(rect.x() + i * width, rect.y(), width, rect.height()).adjusted(2, 2, -2, -2)
+            for i in range(count)
+        ]
+
+    def _hit(self, pos, option: QStyleOptionViewItem, count: int) -> Optional[int]:
+        return next((i for i, r in enumerate(self._button_rects(option.rect, count)) if r.contains(pos)), None)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        hint = super().sizeHint(option, index)
+        if self._buttons_role is not None:
+            hint.setWidth(len(self._buttons(index)) * self._ICON_BUTTON_WIDTH)
+        return hint
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        style = option.widget.style() if option.widget is not None else QApplication.style()
+        buttons = self._buttons(index)
+        for (label, icon, _tip), rect in zip(buttons, self._button_rects(option.rect, len(buttons))):
+            opt = QStyleOptionButton()
+            opt.rect = rect
+            opt.text = label
+            if icon is not None:
+                opt.icon = icon
+                opt.iconSize = QSize(16, 16)
+            opt.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            style.drawControl(QStyle.ControlElement.CE_PushButton, opt, painter, option.widget)
+
+    def helpEvent(self, event, view, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if event.type() == QEvent.Type.ToolTip and self._buttons_role is not None:
+            buttons = self._buttons(index)
+            hit = self._hit(event.pos(), option, len(buttons))
+            if hit is not None and buttons[hit][2]:
+                QToolTip.showText(event.globalPos(), buttons[hit][2], view)
+                return True
+            QToolTip.hideText()
+            event.ignore()
+            return True
+        return super().helpEvent(event, view, option, index)
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        etype = event.type()
+        if etype not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease):
+            return False
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+        hit = self._hit(event.position().toPoint(), option, len(self._buttons(index)))
+        if etype == QEvent.Type.MouseButtonPress:
+            self._pressed = (index.row(), hit) if hit is not None else None
+            return hit is not None
+        pressed, self._pressed = self._pressed, None
+        if hit is not None and pressed == (index.row(), hit):
+            self.clicked.emit(index.row(), hit)
+            return True
+        return False
+
+
+class ProgressBarDelegate(QStyledItemDelegate):
+    """
+    Pinta una barra de progreso con los valores ``(porcentaje, extrayendo)``
+    del rol ``progress_role``; durante la extracción la barra es verde.
+    """
+
+    _EXTRACT_COLOR = QColor("#4caf50")
+
+    def __init__(self, progress_role: int, parent=None) -> None:
+        super().__init__(parent)
+        self._progress_role = progress_role
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        value = index.data(self._progress_role)
+        if value is None:
+            super().paint(painter, option, index)
+            return
+        progress, extracting = value
+        opt = QStyleOptionProgressBar()
+        opt.rect = option.rect.adjusted(2, 2, -2, -2)
+        opt.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Horizontal
+        opt.direction = option.direction
+        opt.fontMetrics = option.fontMetrics
+        opt.palette = QPalette(option.palette)
+        if extracting:
+            opt.palette.setColor(QPalette.ColorRole.Highlight, self._EXTRACT_COLOR)
+        opt.minimum = 0
+        opt.maximum = 100
+        opt.progress = progress
+        opt.text = f"{progress}%"
+        opt.textVisible = True
+        opt.textAlignment = Qt.AlignmentFlag.AlignCenter
+        style = option.widget.style() if option.widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ProgressBar, opt, painter, option.widget)
@@ -2,46 +2,486 @@
 
 from __future__ import annotations
 
+import collections
+import functools
+import heapq
 import os
 import re
 import unicodedata
 from pathlib import Path
 from urllib.parse import urlsplit, unquote
-import json
 import logging
 import sqlite3
 import math
 import subprocess
 import shutil
+import stat
+import sys
 import xml.etree.ElementTree as ET
-from typing import Optional, List, Dict, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Callable, Optional, List, Dict, Mapping, Sequence
 
 if __package__ is None or __package__ == "":
-    import sys
-
     project_root = Path(__file__).resolve().parents[2]
     if str(project_root) not in sys.path:
         sys.path.insert(0, str(project_root))
     __package__ = "rom_manager.gui"
 
-from PyQt6.QtCore import Qt, QThreadPool, QTimer, QUrl, QEvent, QObject
+from PyQt6.QtCore import Qt, QThreadPool, QTimer, QUrl, QEvent, QObject, QRunnable, pyqtSignal
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout, QLabel, QLineEdit,
     QPushButton, QFileDialog, QGroupBox, QFrame, QComboBox, QSpinBox, QTableView, QTableWidget,
-    QTableWidgetItem, QHeaderView, QMessageBox, QProgressBar, QCheckBox, QTabWidget,
+    QTableWidgetItem, QHeaderView, QMessageBox, QCheckBox, QTabWidget,
     QAbstractItemView, QListWidget, QListWidgetItem, QMenu, QStyle, QSystemTrayIcon,
     QAbstractButton, QToolButton, QDialog, QDialogButtonBox, QTextEdit
 )
 from PyQt6.QtGui import QDesktopServices, QIcon, QKeyEvent, QGuiApplication
 
-from rom_manager.database import Database
-from rom_manager.models import LinksTableModel
-from rom_manager.download import DownloadManager, DownloadItem, ExtractionTask
+from rom_manager.database import (
+    Database, LINK_COL_FMT, LINK_COL_LANGS, LINK_COL_ROM_ID, LINK_COL_ROM_NAME, LINK_COL_SERVER,
+    LINK_COL_SYSTEM_NAME,
+)
+from rom_manager.models import (
+    BasketRow, BasketTableModel, DownloadRow, DownloadsTableModel, GroupChoiceModel, GroupedResultsModel, LinksTableModel
+)
+from rom_manager.download import (
+    DownloadManager, DownloadItem, DownloadRowInfo, ExtractionQueue, SessionEntry, UnlinkTask
+)
 from rom_manager.emulators import EmulatorInfo, get_all_systems, get_emulator_catalog, get_emulators_for_system
 from rom_manager.paths import config_path, session_path
+from rom_manager.gui.delegates import ButtonsDelegate, ComboDelegate, ProgressBarDelegate
 
 from rom_manager.console_input import PygameConsoleController
-from rom_manager.utils import safe_filename, extract_archive, resource_path
+from rom_manager.utils import (
+    safe_filename, extract_archive, resource_path, json_dumps, json_loads, json_read, write_bytes_atomic
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_langs(langs: str) -> str:
+    """Normaliza una lista de idiomas separada por comas (sin espacios ni vacíos).
+
+    Muchos enlaces comparten la misma cadena de idiomas, así que el resultado
+    se memoriza. Además se interna para que las claves de los grupos
+    compartan el mismo objeto aunque la cadena original difiera en espacios.
+    """
+    return sys.intern(','.join([x.strip() for x in langs.split(',') if x.strip()]))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_eta_seconds(sec: int) -> str:
+    """Texto de tiempo restante para ``sec`` segundos enteros.
+
+    Las actualizaciones de progreso repiten a menudo el mismo segundo, así
+    que el resultado se memoriza.
+    """
+    h, rem = divmod(sec, 3600)
+    m, s = divmod(rem, 60)
+    if h:
+        return f"{h}h {m:02d}m {s:02d}s"
+    if m:
+        return f"{m}m {s:02d}s"
+    return f"{s}s"
+
+
+def _group_choices(rows: Sequence[sqlite3.Row]) -> tuple:
+    """Calcula en una sola pasada las opciones de un grupo de enlaces de una ROM.
+
+    Devuelve ``(servers, formats_by_server, langs_by_server_format,
+    link_lookup)`` con las listas ya ordenadas.
+    """
+    if len(rows) == 1:
+        # Caso más frecuente: un único enlace. Se construye el grupo directamente
+        # sin conjuntos intermedios ni ordenaciones.
+        r = rows[0]
+        srv = sys.intern(r[LINK_COL_SERVER] or "")
+        fmt_val = sys.intern(r[LINK_COL_FMT] or "")
+        lang_str = _normalize_langs(r[LINK_COL_LANGS] or "")
+        return [srv], {srv: [fmt_val]}, {(srv, fmt_val): [lang_str]}, {(srv, fmt_val, lang_str): r}
+    link_lookup: dict[tuple[str, str, str], sqlite3.Row] = {}
+    for r in rows:
+        # Internar servidor/formato: hay pocos valores distintos repetidos en
+        # miles de filas y las claves de los diccionarios comparten así el
+        # mismo objeto (y su hash ya calculado).
+        srv = sys.intern(r[LINK_COL_SERVER] or "")
+        fmt_val = sys.intern(r[LINK_COL_FMT] or "")
+        lang_str = _normalize_langs(r[LINK_COL_LANGS] or "")
+        link_lookup[(srv, fmt_val, lang_str)] = r
+    # Las claves de ``link_lookup`` ya son las combinaciones únicas: al
+    # recorrerlas ordenadas se obtienen servidores, formatos e idiomas en orden
+    # con una sola ordenación y sin conjuntos intermedios por servidor/formato.
+    servers: List[str] = []
+    formats_by_server: dict[str, List[str]] = {}
+    langs_by_server_format: dict[tuple[str, str], List[str]] = {}
+    for srv, fmt_val, lang_str in sorted(link_lookup):
+        fmts = formats_by_server.get(srv)
+        if fmts is None:
+            servers.append(srv)
+            fmts = formats_by_server[srv] = []
+        key = (srv, fmt_val)
+        langs = langs_by_server_format.get(key)
+        if langs is None:
+            fmts.append(fmt_val)
+            langs = langs_by_server_format[key] = []
+        langs.append(lang_str)
+    return servers, formats_by_server, langs_by_server_format, link_lookup
+
+
+# Extensiones de ROM/contenedor que se eliminan al normalizar nombres de archivo.
+# ``frozenset`` inmutable de cadenas internadas, compartido por todas las ventanas.
+_KNOWN_ROM_EXTENSIONS: frozenset[str] = frozenset(map(sys.intern, (
+    ".7z",
+    ".zip",
+    ".rar",
+    ".tar",
+    ".gz",
+    ".bz2",
+    ".xz",
+    ".zst",
+    ".iso",
+    ".cso",
+    ".wbfs",
+    ".wdf",
+    ".wad",
+    ".cia",
+    ".nds",
+    ".3ds",
+    ".xci",
+    ".nsp",
+    ".gba",
+    ".gbc",
+    ".gb",
+    ".nes",
+    ".sfc",
+    ".smc",
+    ".z64",
+    ".n64",
+    ".v64",
+    ".chd",
+    ".bin",
+    ".cue",
+    ".img",
+    ".mdf",
+    ".mds",
+    ".ccd",
+    ".sub",
+    ".dmg",
+    ".pkg",
+    ".apk",
+    ".pbp",
+    ".vpk",
+    ".elf",
+    ".dol",
+    ".xiso",
+    ".adf",
+    ".int",
+    ".smd",
+    ".001",
+    ".002",
+    ".003",
+)))
+
+# Tema oscuro del modo consola (se comparte entre ventanas y no se rehace en cada llamada)
+_CONSOLE_STYLESHEET = r'''
+    QMainWindow { background-color: #0b1221; color: #e5e7eb; }
+    QWidget { background-color: #0b1221; color: #e5e7eb; }
+    QLabel { color: #e5e7eb; }
+    QGroupBox { border: 1px solid #1f2937; border-radius: 8px; margin-top: 8px; }
+    QGroupBox::title { subcontrol-origin: margin; left: 12px; padding: 0 4px; color: #9ca3af; }
+    QPushButton, QToolButton, QLineEdit, QComboBox, QSpinBox, QCheckBox, QTableView, QTabWidget { border-radius: 6px; }
+    QPushButton, QToolButton, QComboBox, QLineEdit, QSpinBox { background-color: #111827; border: 1px solid #1f2937; padding: 6px 10px; color: #e5e7eb; }
+    QPushButton:hover, QToolButton:hover { border-color: #2563eb; }
+    QPushButton:pressed, QToolButton:pressed { background-color: #0f172a; }
+    QPushButton:focus, QToolButton:focus, QComboBox:focus, QLineEdit:focus, QSpinBox:focus, QTabBar::tab:focus {
+        border: 2px solid #00bfff; color: #e0f2fe; box-shadow: 0 0 8px #00bfff;
+    }
+    QTabBar::tab { background: #111827; border: 1px solid #1f2937; padding: 8px 14px; margin-right: 2px; }
+    QTabBar::tab:selected { background: #1f2937; color: #7dd3fc; }
+    QTabBar::tab:hover { color: #60a5fa; }
+    QTableView { gridline-color: #1f2937; alternate-background-color: #111827; }
+    QHeaderView::section { background-color: #0f172a; color: #cbd5e1; padding: 6px; border: 0px; }
+    QProgressBar { border: 1px solid #1f2937; border-radius: 6px; text-align: center; color: #e5e7eb; }
+    QProgressBar::chunk { background-color: #22d3ee; }
+'''
+
+_EXIT_BUTTON_STYLESHEET = (
+    "QToolButton { background: #111827; border: 1px solid #2563eb; padding: 6px 12px;"
+    " border-radius: 10px; color: #e5e7eb; font-weight: 600; }"
+    "QToolButton:hover { background: #0f172a; }"
+    "QToolButton:focus { border: 2px solid #00bfff; box-shadow: 0 0 8px #00bfff; }"
+)
+
+def _qt_key_codes(*names: str) -> tuple:
+    """Códigos de las teclas Qt indicadas que existen en la versión instalada."""
+    return tuple(int(getattr(Qt.Key, name)) for name in names if hasattr(Qt.Key, name))
+
+
+# Patrones de ``MainWindow.normalize_rom_name``, compilados una sola vez
+_RE_PARENTHESES = re.compile(r"\([^)]*\)")
+_RE_BRACKETS = re.compile(r"\[[^\]]*\]")
+_RE_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+@functools.lru_cache(maxsize=4096)
+def _download_name_from_url(url: str) -> str:
+    """Nombre de archivo saneado a partir de la ruta (decodificada) de ``url``."""
+    base = os.path.basename(urlsplit(url).path) or "archivo"
+    return safe_filename(unquote(base))
+
+
+# Ruta del icono de la aplicación, resuelta (y comprobada) una sola vez al importar
+_ICON_PATH: str = str(Path(resource_path("resources/romMan.ico")))
+_ICON_EXISTS: bool = os.path.exists(_ICON_PATH)
+
+
+@functools.lru_cache(maxsize=1)
+def app_icon() -> Optional[QIcon]:
+    """Decodifica una sola vez el icono de la aplicación (``None`` si no está)."""
+    if not _ICON_EXISTS:
+        return None
+    icon = QIcon(_ICON_PATH)
+    return None if icon.isNull() else icon
+
+
+@functools.lru_cache(maxsize=1)
+def _tray_available() -> bool:
+    """Consulta una sola vez al sistema de ventanas si hay bandeja del sistema."""
+    return QSystemTrayIcon.isSystemTrayAvailable()
+
+
+@functools.lru_cache(maxsize=1)
+def _tray_supports_messages() -> bool:
+    """Consulta una sola vez si la bandeja admite mensajes emergentes."""
+    return QSystemTrayIcon.supportsMessages()
+
+
+_RETROBAT_FOLDERS_FILE = "resources/retrobat_folders.json"
+# Caché del número de ROMs por carpeta de RetroBat (``config/retrobat_cache.sqlite``)
+_RETROBAT_CACHE_FILE = "retrobat_cache.sqlite"
+
+
+@functools.lru_cache(maxsize=None)
+def _retrobat_folders() -> Mapping[str, Mapping[str, str]]:
+    """Carga una sola vez las carpetas conocidas de RetroBat.
+
+    Devuelve vistas de solo lectura con las claves ``roms``, ``emulators`` y
+    ``bios`` (carpeta -> descripción). Se leen de un JSON la primera vez que
+    se necesitan en lugar de construirse al importar el módulo.
+    """
+    try:
+        data = json_read(resource_path(_RETROBAT_FOLDERS_FILE))
+    except Exception:
+        logging.exception("Failed to load RetroBat folder definitions")
+        data = {}
+    return MappingProxyType({
+        kind: MappingProxyType(dict(data.get(kind) or {})) for kind in ("roms", "emulators", "bios")
+    })
+
+
+def _count_files_fast(root: str) -> int:
+    """
+    Cuenta los ficheros bajo ``root`` (recursivo) con ``os.scandir``.
+
+    El tipo de cada entrada sale de la caché de ``DirEntry``, sin un
+    ``stat()`` adicional ni objetos ``Path``. Los enlaces simbólicos no se
+    siguen y las carpetas que no se pueden leer se omiten.
+    """
+    count = 0
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        count += 1
+        except OSError:
+            continue
+    return count
+
+
+_RETROBAT_CACHE_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS retrobat_cache("
+    "root TEXT NOT NULL, folder TEXT NOT NULL, roms INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+    "PRIMARY KEY (root, folder))"
+)
+
+
+def _read_retrobat_cache(cache_file: str, root: str) -> Dict[str, tuple]:
+    """Devuelve ``carpeta -> (número de ROMs, mtime_ns)`` guardado para ``root``."""
+    try:
+        conn = sqlite3.connect(cache_file)
+        try:
+            conn.execute(_RETROBAT_CACHE_SCHEMA)
+            rows = conn.execute(
+                "SELECT folder, roms, mtime_ns FROM retrobat_cache WHERE root = ?", (root,)
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        logging.exception("Failed to read RetroBat cache %s", cache_file)
+        return {}
+    return {folder: (roms, mtime_ns) for folder, roms, mtime_ns in rows}
+
+
+def _write_retrobat_cache(cache_file: str, root: str, rows: List[tuple]) -> None:
+    """Guarda ``(carpeta, número de ROMs, mtime_ns)`` de ``root`` en una sola transacción."""
+    try:
+        conn = sqlite3.connect(cache_file)
+        try:
+            with conn:
+                conn.execute(_RETROBAT_CACHE_SCHEMA)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO retrobat_cache(root, folder, roms, mtime_ns) VALUES (?, ?, ?, ?)",
+                    [(root, folder, roms, mtime_ns) for folder, roms, mtime_ns in rows],
+                )
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        logging.exception("Failed to write RetroBat cache %s", cache_file)
+
+
+def _scan_retrobat_root(
+    root: str, cache_file: Optional[str] = None, force: bool = False
+) -> List[Dict[str, object]]:
+    """
+    Inventario de ROMs, emuladores y BIOS por sistema de una carpeta RetroBat.
+
+    Con ``cache_file`` el número de ROMs de cada carpeta se reutiliza mientras
+    su ``mtime`` no cambie (``force`` lo ignora y vuelve a contar todo). El
+    ``mtime`` de una carpeta solo cambia con sus hijos directos, así que los
+    cambios en subcarpetas requieren actualizar el inventario a mano.
+    """
+    root = str(Path(root))
+    paths = _retrobat_paths(root)
+    # Carpetas de ROMs existentes con su ruta y su mtime
+    rom_dirs: Dict[str, tuple] = {}
+    for folder, _, path, _, _ in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISDIR(st.st_mode):
+            rom_dirs[folder] = (path, st.st_mtime_ns)
+    cached = _read_retrobat_cache(cache_file, root) if cache_file and not force else {}
+    counts: Dict[str, int] = {
+        folder: cached[folder][0]
+        for folder, (_, mtime_ns) in rom_dirs.items()
+        if folder in cached and cached[folder][1] == mtime_ns
+    }
+    pending = [folder for folder in rom_dirs if folder not in counts]
+    if pending:
+        # Cada carpeta se recorre por separado: repartirlas en varios hilos
+        # solapa la espera de disco
+        workers = min(8, os.cpu_count() or 4, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fresh = executor.map(_count_files_fast, [rom_dirs[folder][0] for folder in pending])
+            counts.update(zip(pending, fresh))
+        if cache_file:
+            _write_retrobat_cache(
+                cache_file, root, [(folder, counts[folder], rom_dirs[folder][1]) for folder in pending]
+            )
+    inventory: List[Dict[str, object]] = []
+    for folder, display, _, emu_dir, bios_dir in paths:
+        inventory.append(
+            {
+                "folder": folder,
+                "display": display,
+                "roms": counts.get(folder, 0),
+                "emulator": os.path.isdir(emu_dir),
+                "bios": os.path.isdir(bios_dir),
+            }
+        )
+    return inventory
+
+
+@functools.lru_cache(maxsize=None)
+def _retrobat_folder_items(kind: str) -> tuple[tuple[str, str], ...]:
+    """Pares ``(carpeta, descripción)`` de ``kind`` en el orden del JSON."""
+    return tuple(_retrobat_folders()[kind].items())
+
+
+@functools.lru_cache(maxsize=4)
+def _retrobat_paths(root: str) -> tuple[tuple[str, str, str, str, str], ...]:
+    """
+    Rutas ya unidas de cada sistema bajo ``root``.
+
+    Devuelve ``(carpeta, descripción, ruta de ROMs, ruta de emulador, ruta de
+    BIOS)``; se calcula una vez por carpeta raíz y se reutiliza en cada recorrido.
+    """
+    rom_base = os.path.join(root, "roms")
+    emu_base = os.path.join(root, "emulators")
+    bios_base = os.path.join(root, "bios")
+    return tuple(
+        (
+            folder,
+            display,
+            os.path.join(rom_base, folder),
+            os.path.join(emu_base, folder),
+            os.path.join(bios_base, folder),
+        )
+        for folder, display in _retrobat_folder_items("roms")
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _retrobat_rom_folder_keys() -> tuple[tuple[str, str, str], ...]:
+    """Ternas ``(carpeta, carpeta en minúsculas, descripción en minúsculas)`` de las ROMs."""
+    return tuple((folder, folder.lower(), display.lower()) for folder, display in _retrobat_folder_items("roms"))
+
+
+class _LoadSessionSignals(QObject):
+    """Señal con los datos de sesión ya interpretados (se emite desde el hilo de trabajo)."""
+
+    loaded = pyqtSignal(object)
+
+
+class _LoadSessionTask(QRunnable):
+    """Lee y decodifica el fichero de sesión fuera del hilo de la interfaz."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self._path = path
+        self.signals = _LoadSessionSignals()
+
+    def run(self) -> None:
+        try:
+            if not os.path.exists(self._path):
+                return
+            data = json_read(self._path)
+        except Exception:
+            logging.exception("Failed to read session file %s", self._path)
+            return
+        self.signals.loaded.emit(data)
+
+
+class _RetroBatScanSignals(QObject):
+    """Señal con ``(generación, inventario)`` al terminar un recorrido de RetroBat."""
+
+    finished = pyqtSignal(int, list)
+
+
+class _RetroBatScanTask(QRunnable):
+    """Recorre la carpeta de RetroBat fuera del hilo de la interfaz."""
+
+    def __init__(self, gen: int, root: str, cache_file: Optional[str] = None, force: bool = False) -> None:
+        super().__init__()
+        self._gen = gen
+        self._root = root
+        self._cache_file = cache_file
+        self._force = force
+        self.signals = _RetroBatScanSignals()
+
+    def run(self) -> None:
+        try:
+            inventory = _scan_retrobat_root(self._root, self._cache_file, self._force)
+        except Exception:
+            logging.exception("Failed to scan RetroBat folder %s", self._root)
+            inventory = []
+        self.signals.finished.emit(self._gen, inventory)
 
 
 # -----------------------------
@@ -53,291 +493,66 @@ class MainWindow(QMainWindow):
     Ventana principal de la aplicación. Configura todas las pestañas y
     gestiona la interacción del usuario con la base de datos, el
     gestor de descargas y la visualización de resultados.
+
+    Se espera que :func:`rom_manager.main.main` haya activado
+    ``AA_DontCreateNativeWidgetSiblings`` y ``AA_CompressHighFrequencyEvents``
+    antes de crear la aplicación, ya que la ventana crea cientos de widgets.
     """
 
-    _KNOWN_ROM_EXTENSIONS = {
-        ".7z",
-        ".zip",
-        ".rar",
-        ".tar",
-        ".gz",
-        ".bz2",
-        ".xz",
-        ".zst",
-        ".iso",
-        ".cso",
-        ".wbfs",
-        ".wdf",
-        ".wad",
-        ".cia",
-        ".nds",
-        ".3ds",
-        ".xci",
-        ".nsp",
-        ".gba",
-        ".gbc",
-        ".gb",
-        ".nes",
-        ".sfc",
-        ".smc",
-        ".z64",
-        ".n64",
-        ".v64",
-        ".chd",
-        ".bin",
-        ".cue",
-        ".img",
-        ".mdf",
-        ".mds",
-        ".ccd",
-        ".sub",
-        ".dmg",
-        ".pkg",
-        ".apk",
-        ".pbp",
-        ".vpk",
-        ".elf",
-        ".dol",
-        ".xiso",
-        ".adf",
-        ".int",
-        ".smd",
-        ".001",
-        ".002",
-        ".003",
-    }
     _ARCADE_SYSTEM_ID = 32
-
-    _RETROBAT_ROM_FOLDERS: Dict[str, str] = {
-        "3do": "3DO",
-        "3ds": "Nintendo 3DS",
-        "actionmax": "Actionmax",
-        "adam": "Coleco Adam",
-        "advision": "Adventure Vision",
-        "amiga500": "Amiga OCS/ECS",
-        "amiga1200": "Amiga AGA",
-        "amiga4000": "Amiga 4000",
-        "amigacd32": "Amiga CD32",
-        "amigacdtv": "Amiga CDTV",
-        "amstradcpc": "Amstrad CPC",
-        "apple2": "Apple II",
-        "apple2gs": "Apple IIGS",
-        "aquarius": "Mattel Aquarius",
-        "arcadia": "Arcadia 2001 (Gen 2 Arcade)",
-        "atari2600": "Atari 2600",
-        "atari5200": "Atari 5200",
-        "atari7800": "Atari 7800",
-        "atari800": "Atari 800",
-        "atarist": "Atari ST",
-        "cgenius": "C-Genie",
-        "cavestory": "Cave Story (port)",
-        "cdi": "Philips CD-i",
-        "cps1": "Capcom CPS-1 Arcade",
-        "cps2": "Capcom CPS-2 Arcade",
-        "cps3": "Capcom CPS-3 Arcade",
-        "doom3": "Doom 3 (game engine port)",
-        "dos": "MS-DOS",
-        "dreamcast": "Sega Dreamcast",
-        "fbneo": "FinalBurn Neo Arcade",
-        "fds": "Nintendo Famicom Disk System",
-        "gameandwatch": "Nintendo Game & Watch",
-        "gamegear": "Sega Game Gear",
-        "gb": "Nintendo Game Boy",
-        "gba": "Nintendo Game Boy Advance",
-        "gbc": "Nintendo Game Boy Color",
-        "gp32": "GamePark GP32",
-        "n64": "Nintendo 64",
-        "nds": "Nintendo DS",
-        "neogeo": "SNK Neo Geo",
-        "neogeocd": "SNK Neo Geo CD",
-        "nes": "Nintendo Entertainment System",
-        "psx": "Sony PlayStation (PS1)",
-        "ps2": "Sony PlayStation 2",
-        "psp": "Sony PlayStation Portable",
-        "psvita": "Sony PlayStation Vita",
-        "saturn": "Sega Saturn",
-        "snes": "Super Nintendo Entertainment System",
-        "megadrive": "Sega Mega Drive / Genesis",
-        "megacd": "Sega Mega CD (Mega-CD)",
-        "mastersystem": "Sega Master System",
-        "vectrex": "Vectrex",
-        "zx81": "Sinclair ZX81",
-        "zxspectrum": "ZX Spectrum",
+    # Textos de las columnas booleanas de la tabla de RetroBat
+    _YES_TEXT = "Sí"
+    _NO_TEXT = "No"
+    # Constantes usadas en ``eventFilter`` (se evalúan una sola vez)
+    _EV_KEYPRESS = QEvent.Type.KeyPress
+    _EV_FOCUSIN = QEvent.Type.FocusIn
+    _KEY_DELETE = Qt.Key.Key_Delete
+    # Únicos tipos de evento que interesan al filtro; el resto se descarta de inmediato
+    _EV_FILTERED = frozenset((_EV_KEYPRESS, _EV_FOCUSIN))
+    # Tecla -> acción para el modo consola (también con el foco en un campo de texto).
+    # Varias teclas equivalentes (teclado y mando) comparten la misma acción.
+    _GAMEPAD_DISPATCH: Dict[int, Callable[["MainWindow"], bool]] = {
+        code: action
+        for codes, action in (
+            (_qt_key_codes("Key_PageUp", "Key_GamepadL1", "Key_GamepadShoulderLeft"),
+             lambda w: w._switch_tab_with_delta(-1)),
+            (_qt_key_codes("Key_PageDown", "Key_GamepadR1", "Key_GamepadShoulderRight"),
+             lambda w: w._switch_tab_with_delta(1)),
+            (_qt_key_codes("Key_Guide"),
+             lambda w: w._apply_console_mode(not w.console_mode_enabled, save=True) or True),
+            (_qt_key_codes("Key_Back", "Key_Backspace", "Key_GamepadB"),
+             lambda w: w._handle_console_back_action()),
+            (_qt_key_codes("Key_Return", "Key_Enter", "Key_Select", "Key_Space", "Key_GamepadA"),
+             lambda w: w._activate_focused_control()),
+        )
+        for code in codes
     }
-
-    _RETROBAT_EMULATOR_FOLDERS: Dict[str, str] = {
-        "3dsen": "3DS Emulator (probablemente Citra o frontend)",
-        "altirra": "Altirra (Emulador Atari 8-bit)",
-        "applewin": "AppleWin (Emulador Apple II)",
-        "arcadeflashweb": "Arcade Flash Web (Flash Player Arcade)",
-        "ares": "ARES (Multisistema)",
-        "azahar": "Azahar (Frontend/Emulador)",
-        "bigpemu": "BigPEmu (Emulador portátil)",
-        "bizhawk": "BizHawk (Multisistema)",
-        "capriceforever": "Caprice Forever (Amstrad CPC)",
-        "cdogs": "cdogs SDL (Juego, no emulador)",
-        "cemu": "Cemu (Wii U emulator)",
-        "cgenius": "C-Genie Emulator",
-        "chihiro": "Chihiro (Arcade system)",
-        "citra": "Citra (Nintendo 3DS emulator)",
-        "citron": "Citron (Versión avanzada Citra)",
-        "corsixth": "CorsixTH (Theme Hospital engine)",
-        "cxbx-reloaded": "Cxbx-Reloaded (Xbox emulator)",
-        "daphne": "Daphne (Laserdisc arcade emulator)",
-        "demul": "Demul (Dreamcast/Naomi/Xbox Classic)",
-        "demul-old": "Demul (versión antigua)",
-        "devilutionx": "DevilutionX (Diablo engine)",
-        "dhewm3": "DHEWM3 (Doom 3 engine port)",
-        "dolphin-emu": "Dolphin (GameCube/Wii)",
-        "dolphin-triforce": "Dolphin-Triforce variant",
-        "dosbox": "DOSBox (DOS emulator)",
-        "duckstation": "DuckStation (PS1 emulator)",
-        "eden": "Eden (PS1/PS2 frontend)",
-        "eduke32": "EDuke32 (Duke Nukem)",
-        "eka2l1": "EKA2L1 (Symbian emulator)",
-        "fbneo": "FinalBurn Neo",
-        "flycast": "Flycast (Dreamcast/Atomiswave)",
-        "fpinball": "Future Pinball",
-        "gemrb": "GEMRB (Baldur’s Gate engine)",
-        "gopher64": "Gopher64 (C64 emulator)",
-        "gsplus": "GS+ (Apple IIgs emulator)",
-        "gzdoom": "GZDoom (Doom engine)",
-        "hatari": "Hatari (Atari ST/STE/TT/Falcon)",
-        "hbmame": "Homebrew MAME",
-        "hypseus": "Hypseus (Coleco/A7800)",
-        "jgenesis": "JGenesis (Genesis/MegaDrive)",
-        "jynx": "Jynx (Atari Lynx)",
-        "kega-fusion": "Kega Fusion (Sega)",
-        "kronos": "Kronos (Arcade)",
-        "lime3ds": "LIME3DS (3DS emulator)",
-        "love": "LÖVE (Lua game engine)",
-        "m2emulator": "M2 Emulator (Arcade)",
-        "magicengine": "MagicEngine (PC Engine/Turbografx)",
-        "mame": "MAME",
-        "mandarine": "Mandarine emu",
-        "mednafen": "Mednafen",
-        "melonds": "melonDS (Nintendo DS emulator)",
-        "mesen": "Mesen (NES/Famicom)",
-        "mgba": "mGBA (Game Boy Advance emulator)",
-        "mupen64": "Mupen64Plus (N64)",
-        "nosgba": "NO$GBA (GBA/DS emulator)",
-        "openbor": "OpenBOR (Beat-em-up engine)",
-        "opengoal": "OpenGOAL (Engine)",
-        "openjazz": "OpenJAZZ (Jazz Jackrabbit engine)",
-        "openmsx": "openMSX (MSX)",
-        "oricutron": "Oricutron (Oric emulator)",
-        "pcsx2": "PCSX2 (PS2 emulator)",
-        "pcsx2-16": "PCSX2 v1.6",
-        "pdark": "PC Dark (Engine)",
-        "phoenix": "Phoenix emu",
-        "pico8": "PICO-8 (Fantasy console)",
-        "play": "Play! (PS2 emulator)",
-        "ppsspp": "PPSSPP (PSP emulator)",
-        "project64": "Project64 (N64 emulator)",
-        "psxmame": "PSX in MAME core",
-        "raine": "Raine (Arcade emulator)",
-        "raze": "Raze (Doom/Heretic/Hexen engine)",
-        "redream": "reDream (Dreamcast)",
-        "retroarch": "RetroArch (Frontend + Cores)",
-        "rpcs3": "RPCS3 (PS3 emulator)",
-        "rpcs5": "RPCS5 (PS5 emulator)",
-        "ruffle": "Ruffle (Flash emulator)",
-        "ryujinx": "Ryujinx (Nintendo Switch)",
-        "scummvm": "ScummVM (Adventure engines)",
-        "shadps4": "ShadePS4 (PS4 emulator)",
-        "simcoupe": "SimCoupe (SPECTRUM clone)",
-        "simple64": "Simple64 (C64 emulator)",
-        "singe2": "Singe2 engine",
-        "snes9x": "Snes9x (SNES emulator)",
-        "soh": "Secrets of Harmony (mod engine)",
-        "solarus": "Solarus (Zelda engine)",
-        "sonic3air": "Sonic 3 A.I.R. engine",
-        "sonicmania": "Sonic Mania engine",
-        "sonicretro": "Sonic Retro projects",
-        "sonicretrocd": "Sonic Retro CD",
-        "ssf": "SSF (Sega Saturn emulator)",
-        "starship": "Starship (Emulator)",
-        "steam": "Steam (not an emulator)",
-        "stella": "Stella (Atari 2600 emulator)",
-        "sudachi": "Sudachi (Emulator engine)",
-        "supermodel": "Supermodel (Arcade Model3)",
-        "suyu": "Suyu emu",
-        "teknoparrot": "TeknoParrot (Arcade)",
-        "theforceengine": "The Force Engine (Star Wars)",
-        "tsugaru": "Tsugaru engine",
-        "vita3k": "Vita3K (PS Vita emulator)",
-        "vpinball": "Visual Pinball",
-        "winuae": "WinUAE (Amiga emulation)",
-        "xemu": "Xemu (Xbox emulator)",
-        "xenia": "Xenia (Xbox One emulator)",
-        "xenia-canary": "Xenia Canary",
-        "xenia-manager": "Xenia Manager",
-        "xm6pro": "XM6Pro (SharpX68000)",
-        "xroar": "XRoar (Dragon/CoCo)",
-        "yabasanshiro": "Yaba Sanshiro (Saturn emulator)",
-        "yuzu": "Yuzu (Nintendo Switch)",
-        "zesarux": "ZEsarUX (ZX Spectrum)",
-        "zinc": "Zinc (Atari ST/STE emulator)",
+    # Tecla de navegación -> sentido del foco (``True`` hacia delante). No se
+    # aplican en campos de texto, donde las flechas mueven el cursor.
+    _NAV_KEYS: Dict[int, bool] = {
+        **dict.fromkeys(_qt_key_codes("Key_Up", "Key_Left", "Key_GamepadDpadUp", "Key_GamepadLeft"), False),
+        **dict.fromkeys(_qt_key_codes("Key_Down", "Key_Right", "Key_GamepadDpadDown", "Key_GamepadRight"), True),
     }
+    # Anchos iniciales de columna: ROM, Sistema, Servidor, Formato, Idioma, Acciones
+    _CHOICE_COLUMN_WIDTHS = (200, 120, 140, 100, 100, 120)
+    # Carpeta, Sistema, ROMs, Emulador, BIOS
+    _RETROBAT_COLUMN_WIDTHS = (140, 220, 80, 90, 80)
 
-    _RETROBAT_BIOS_FOLDERS: Dict[str, str] = {
-        "cannonball": "Cannonball (engine de Out Run)",
-        "Databases": "Bases de datos internas (MAME / RetroArch)",
-        "dc": "Sega Dreamcast",
-        "dinothawr": "Dinothawr (juego homebrew)",
-        "dolphin-emu": "Nintendo GameCube / Wii (Dolphin)",
-        "dragon": "Dragon 32 / Dragon 64",
-        "eka2l1": "Symbian OS (EKA2L1)",
-        "fba": "Final Burn Alpha (Arcade)",
-        "fbalpha2012": "Final Burn Alpha 2012",
-        "fbneo": "Final Burn Neo (Arcade)",
-        "fmtowns": "Fujitsu FM Towns",
-        "fmtownsux": "Fujitsu FM Towns UX",
-        "hatari": "Atari ST / STE / TT / Falcon",
-        "hatarib": "Atari ST (variantes BIOS)",
-        "hbmame": "HB-MAME (homebrew arcade)",
-        "HdPacks": "Paquetes HD (MAME / otros)",
-        "keropi": "PC-98 (NEC)",
-        "kronos": "Sega Saturn (Kronos emulator)",
-        "Machines": "MAME (definiciones de máquinas)",
-        "mame": "MAME (Arcade)",
-        "mame2000": "MAME 2000",
-        "mame2003": "MAME 2003",
-        "mame2003-plus": "MAME 2003 Plus",
-        "mame2010": "MAME 2010",
-        "mame2014": "MAME 2014",
-        "mame2016": "MAME 2016",
-        "melonDS DS": "Nintendo DS (melonDS BIOS)",
-        "Mupen64plus": "Nintendo 64 (Mupen64Plus)",
-        "neocd": "Neo Geo CD",
-        "np2kai": "NEC PC-98 (Neko Project II Kai)",
-        "nxengine": "Cave Story (NXEngine)",
-        "openlara": "Tomb Raider (OpenLara engine)",
-        "openmsx": "MSX / MSX2 / TurboR",
-        "pcsx2": "Sony PlayStation 2",
-        "PPSSPP": "Sony PlayStation Portable",
-        "psxmame": "PlayStation 1 (PSX vía MAME)",
-        "quasi88": "NEC PC-8801",
-        "raine": "Arcade (Raine emulator)",
-        "same_cdi": "Philips CD-i",
-        "scummvm": "Motores LucasArts / aventuras gráficas",
-        "swanstation": "Sony PlayStation (DuckStation core)",
-        "vice": "Commodore (C64 / C128 / VIC-20 / PET)",
-        "xmil": "Sharp X1",
-        "xrick": "Rick Dangerous (engine)",
-    }
     def __init__(self):
         super().__init__()
-        icon_path = resource_path("resources/romMan.ico")
-        if os.path.exists(icon_path):
-            icon = QIcon(icon_path)
-            if not icon.isNull():
-                self.setWindowIcon(icon)
+        icon = app_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
         self.setWindowTitle("RomManager AB")
         self.resize(1200, 800)
         self.pool = QThreadPool.globalInstance()
         self.db: Optional[Database] = None
         self.session_file = str(self._session_storage_path())
+        # Caché de la ruta de sesión: ((session_file, carpeta de descargas), ruta)
+        self._session_path_cache: Optional[tuple] = None
+        # Huella del último contenido escrito, para no reescribir ficheros sin cambios
+        self._last_session_hash: Optional[tuple] = None
+        self._last_config_hash: Optional[int] = None
 
         # Preferencias del usuario
         # Flag para omitir la confirmación al cancelar descargas
@@ -350,32 +565,82 @@ class MainWindow(QMainWindow):
         # Estado
         self.model = LinksTableModel([])
         self.manager = DownloadManager(self.pool, 3)
-        self.manager.queue_changed.connect(self._refresh_downloads_table)
-        # Seguir descargas en segundo plano
-        self.manager.queue_changed.connect(self._check_background_downloads)
+        # Los cambios de la cola llegan en ráfagas (encolar, arrancar, terminar):
+        # se agrupan en un único refresco cada 100 ms como máximo
+        self._queue_refresh_timer = QTimer(self)
+        self._queue_refresh_timer.setSingleShot(True)
+        self._queue_refresh_timer.setInterval(100)
+        self._queue_refresh_timer.timeout.connect(self._do_refresh_downloads)
+        self.manager.queue_changed.connect(self._schedule_downloads_refresh)
+        # Extracciones: workers persistentes que atienden una cola compartida
+        self.extractor = ExtractionQueue()
+        self.extractor.signals.progress.connect(self._on_extraction_progress)
+        self.extractor.signals.finished_ok.connect(self._on_extraction_job_finished)
+        self.extractor.signals.failed.connect(self._on_extraction_job_failed)
+        # job_id -> (item, archive_path, delete_archive, success_status)
+        self._extraction_jobs: Dict[int, tuple] = {}
         self.background_downloads: bool = False
         self.items: List[DownloadItem] = []
-        self.table_dl: Optional[QTableWidget] = None
+        # Estado visible de cada descarga; la tabla solo pinta las filas a la vista
+        self.dl_model = DownloadsTableModel(self._download_action_buttons())
+        # Guardado diferido de la sesión: varias modificaciones seguidas se agrupan en una escritura
+        self._session_save_pending: bool = False
+        # Emisor de la carga de sesión en segundo plano mientras está en curso
+        self._session_load_signals: Optional[_LoadSessionSignals] = None
+        self.table_dl: Optional[QTableView] = None
+        # Menú contextual de la tabla de descargas (se crea al primer uso)
+        self._dl_context_menu: Optional[QMenu] = None
+        self._dl_context_actions: Dict[str, object] = {}
         self._emulator_catalog: List[EmulatorInfo] = []
         self._current_emulator: Optional[EmulatorInfo] = None
         self._retrobat_root: str = ""
         self._retrobat_exe: str = ""
         self._retrobat_inventory: List[Dict[str, object]] = []
+        # Inventario de RetroBat: las peticiones seguidas se agrupan en un solo
+        # recorrido y solo se muestra el resultado de la última generación
+        self._scan_gen: int = 0
+        self._scan_force: bool = False
+        self._scan_timer = QTimer(self)
+        self._scan_timer.setSingleShot(True)
+        self._scan_timer.setInterval(150)
+        self._scan_timer.timeout.connect(self._scan_retrobat_inventory_real)
+        self._retrobat_scan_signals: Optional[_RetroBatScanSignals] = None
         self.tray_icon: Optional[QSystemTrayIcon] = None
         self._tray_menu: Optional[QMenu] = None
         self._tray_show_action = None
         self._tray_exit_action = None
         self._tray_message_shown: bool = False
         self._console_controller: Optional[PygameConsoleController] = None
-        self._setup_tray_icon()
+        # El icono de bandeja se crea la primera vez que se pasa a segundo plano
 
         # Cesta de descargas (agrupa ROMs) y estructura de búsqueda
         # Es importante inicializar estos diccionarios antes de construir las pestañas,
         # ya que algunas pestañas (como el selector) pueden llamar a métodos que
         # dependen de ellos, como `_refresh_basket_table`.
-        self.basket_items: dict[int, dict] = {}
+        self.basket_items: dict[int, BasketRow] = {}
+        # Modelo compartido por las tablas de la cesta (consolas y arcades)
+        self.basket_model = BasketTableModel(self.basket_items)
+        # Refresco diferido de la cesta: las peticiones se marcan como pendientes y
+        # un único temporizador las agrupa en como mucho un refresco cada 100 ms
+        self._basket_dirty: bool = False
+        self._basket_refresh_timer = QTimer(self)
+        self._basket_refresh_timer.setSingleShot(True)
+        self._basket_refresh_timer.setInterval(100)
+        self._basket_refresh_timer.timeout.connect(self._do_refresh_basket_table)
         self.search_groups: dict[int, List[sqlite3.Row]] = {}
         self.arcades_search_groups: dict[int, dict] = {}
+        # Grupos construidos fuera de una búsqueda (selección/importación), en orden LRU
+        self._group_cache: "collections.OrderedDict[int, dict]" = collections.OrderedDict()
+        # Modelos de las tablas de resultados agrupados (consolas y arcades)
+        self.results_model = GroupedResultsModel()
+        self.arcades_results_model = GroupedResultsModel()
+        # Acciones por modelo de las vistas agrupadas: id(modelo) -> manejadores(rom_id)
+        self._choice_actions: dict[int, tuple[Callable[[int], None], ...]] = {}
+        # Carpeta de descargas ya normalizada; se actualiza con ``le_dir.textChanged``
+        self._cached_dest_dir = ""
+        # Ajustes de la pestaña de emuladores; se guardan aunque la pestaña no se haya construido
+        self._emulator_dir: str = ""
+        self._emulator_delete_archive: bool = False
 
         # Tabs: mostrar primero el selector, luego emuladores, descargas y finalmente ajustes
         tabs = QTabWidget(); self.setCentralWidget(tabs); self.tabs = tabs
@@ -398,12 +663,16 @@ class MainWindow(QMainWindow):
         if app:
             app.installEventFilter(self)
 
-        # Construir las pestañas
+        # Construir las pestañas. El selector se muestra al arrancar y los ajustes
+        # reciben la configuración guardada; el resto (incluida la subpestaña
+        # Arcades del selector) se construye la primera vez que se abre
+        self._pending_builders: dict[QWidget, Callable[[], None]] = {
+            self.tab_frontends: self._build_frontends_tab,
+            self.tab_emulators: self._build_emulators_tab,
+            self.tab_downloads: self._build_downloads_tab,
+        }
         self._build_selector_tab()
-        self._build_frontends_tab()
-        self._build_emulators_tab()
         # La cesta se construirá dentro del selector, no como pestaña aparte
-        self._build_downloads_tab()
         self._build_settings_tab()
 
         tabs.currentChanged.connect(self._on_tab_changed)
@@ -460,18 +729,20 @@ class MainWindow(QMainWindow):
     def _config_file_path(self) -> Path:
         """Ruta del fichero JSON donde se guarda la configuración."""
 
-        return config_path("settings.json")
+        path = getattr(self, "_config_path_cache", None)
+        if path is None:
+            path = config_path("settings.json")
+            self._config_path_cache = path
+        return path
 
     def _setup_tray_icon(self) -> None:
         """Configura el icono de la bandeja del sistema para el modo en segundo plano."""
-        if not QSystemTrayIcon.isSystemTrayAvailable():
+        if self.tray_icon is not None or not _tray_available():
             return
         tray = QSystemTrayIcon(self)
-        icon_path = resource_path("resources/romMan.ico")
-        if os.path.exists(icon_path):
-            icon = QIcon(icon_path)
-            if not icon.isNull():
-                tray.setIcon(icon)
+        icon = app_icon()
+        if icon is not None:
+            tray.setIcon(icon)
         tray.setToolTip("RomManager AB — Descargas en segundo plano")
         menu = QMenu(self)
         show_action = menu.addAction("Mostrar ventana")
@@ -488,6 +759,8 @@ class MainWindow(QMainWindow):
 
     def _enter_background_mode(self) -> bool:
         """Activa el modo en segundo plano mostrando el icono de bandeja."""
+        if self.tray_icon is None:
+            self._setup_tray_icon()
         if not self.tray_icon:
             QMessageBox.warning(
                 self,
@@ -498,7 +771,7 @@ class MainWindow(QMainWindow):
         self.background_downloads = True
         if not self.tray_icon.isVisible():
             self.tray_icon.show()
-        if QSystemTrayIcon.supportsMessages() and not self._tray_message_shown:
+        if _tray_supports_messages() and not self._tray_message_shown:
             self.tray_icon.showMessage(
                 'RomManager AB',
                 'Las descargas continúan en segundo plano. Haz doble clic en el icono para volver a abrir la ventana.',
@@ -539,28 +812,9 @@ class MainWindow(QMainWindow):
     # --- Modo consola / pantalla completa ---
     def _apply_console_stylesheet(self) -> None:
         """Aplica un tema oscuro con realce eléctrico para facilitar la navegación con mando."""
-        stylesheet = r'''
-            QMainWindow { background-color: #0b1221; color: #e5e7eb; }
-            QWidget { background-color: #0b1221; color: #e5e7eb; }
-            QLabel { color: #e5e7eb; }
-            QGroupBox { border: 1px solid #1f2937; border-radius: 8px; margin-top: 8px; }
-            QGroupBox::title { subcontrol-origin: margin; left: 12px; padding: 0 4px; color: #9ca3af; }
-            QPushButton, QToolButton, QLineEdit, QComboBox, QSpinBox, QCheckBox, QTableWidget, QTabWidget { border-radius: 6px; }
-            QPushButton, QToolButton, QComboBox, QLineEdit, QSpinBox { background-color: #111827; border: 1px solid #1f2937; padding: 6px 10px; color: #e5e7eb; }
-            QPushButton:hover, QToolButton:hover { border-color: #2563eb; }
-            QPushButton:pressed, QToolButton:pressed { background-color: #0f172a; }
-            QPushButton:focus, QToolButton:focus, QComboBox:focus, QLineEdit:focus, QSpinBox:focus, QTabBar::tab:focus {
-                border: 2px solid #00bfff; color: #e0f2fe; box-shadow: 0 0 8px #00bfff;
-            }
-            QTabBar::tab { background: #111827; border: 1px solid #1f2937; padding: 8px 14px; margin-right: 2px; }
-            QTabBar::tab:selected { background: #1f2937; color: #7dd3fc; }
-            QTabBar::tab:hover { color: #60a5fa; }
-            QTableWidget { gridline-color: #1f2937; alternate-background-color: #111827; }
-            QHeaderView::section { background-color: #0f172a; color: #cbd5e1; padding: 6px; border: 0px; }
-            QProgressBar { border: 1px solid #1f2937; border-radius: 6px; text-align: center; color: #e5e7eb; }
-            QProgressBar::chunk { background-color: #22d3ee; }
-        '''
-        self.setStyleSheet(stylesheet)
+        # Reaplicar la misma hoja obliga a Qt a reinterpretarla y repolir todos los widgets
+        if self.styleSheet() != _CONSOLE_STYLESHEET:
+            self.setStyleSheet(_CONSOLE_STYLESHEET)
 
     def _create_fullscreen_exit_button(self) -> None:
         """Crea un botón visible en modo pantalla completa para salir rápidamente."""
@@ -572,12 +826,7 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
         self._exit_fullscreen_button.clicked.connect(self.close)
-        self._exit_fullscreen_button.setStyleSheet(
-            "QToolButton { background: #111827; border: 1px solid #2563eb; padding: 6px 12px;"
-            " border-radius: 10px; color: #e5e7eb; font-weight: 600; }"
-            "QToolButton:hover { background: #0f172a; }"
-            "QToolButton:focus { border: 2px solid #00bfff; box-shadow: 0 0 8px #00bfff; }"
-        )
+        self._exit_fullscreen_button.setStyleSheet(_EXIT_BUTTON_STYLESHEET)
         if hasattr(self, "tabs"):
             self.tabs.setCornerWidget(self._exit_fullscreen_button, Qt.Corner.TopRightCorner)
         self._update_fullscreen_exit_button()
@@ -630,6 +879,9 @@ class MainWindow(QMainWindow):
                 self._console_controller = None
         return self._console_controller
 
+    def _on_console_mode_toggled(self, checked: bool) -> None:
+        self._apply_console_mode(checked, save=True)
+
     def _apply_console_mode(self, enabled: bool, *, save: bool = False, initial: bool = False) -> None:
         """
         Activa o desactiva el modo consola (pantalla completa + atajos de mando)
@@ -794,6 +1046,20 @@ class MainWindow(QMainWindow):
                 if button is not None:
                     button.click()
                     return True
+        if isinstance(focus_widget, QTableView) and focus_widget is self.table_dl:
+            # Descargas: la acción por defecto es el primer botón (pausar)
+            row = focus_widget.currentIndex().row()
+            if row >= 0:
+                self._on_download_action(row, 0)
+                return True
+        if isinstance(focus_widget, QTableView):
+            # Tablas de ROMs agrupadas: la acción por defecto es el primer botón
+            model = focus_widget.model()
+            handlers = self._choice_actions.get(id(model))
+            row = focus_widget.currentIndex().row()
+            if handlers and row >= 0:
+                self._dispatch_choice_action(model, handlers, row, 0)
+                return True
         if isinstance(focus_widget, QListWidget) and focus_widget is getattr(self, "list_emulator_extras", None):
             self._download_selected_extra()
             return True
@@ -831,175 +1097,120 @@ class MainWindow(QMainWindow):
         if not self.console_mode_enabled:
             return False
 
-        focus_widget = self.focusWidget()
-        is_text_input = isinstance(focus_widget, (QLineEdit, QComboBox))
-
-        if key == Qt.Key.Key_PageUp:
-            return self._switch_tab_with_delta(-1)
-        if key == Qt.Key.Key_PageDown:
-            return self._switch_tab_with_delta(1)
-        if key in (Qt.Key.Key_GamepadL1, Qt.Key.Key_GamepadShoulderLeft):
-            return self._switch_tab_with_delta(-1)
-        if key in (Qt.Key.Key_GamepadR1, Qt.Key.Key_GamepadShoulderRight):
-            return self._switch_tab_with_delta(1)
-        if key == Qt.Key.Key_Guide:
-            self._apply_console_mode(not self.console_mode_enabled, save=True)
-            return True
-        if key in (Qt.Key.Key_Back, Qt.Key.Key_Backspace):
-            return self._handle_console_back_action()
-        if key in (
-            Qt.Key.Key_Return,
-            Qt.Key.Key_Enter,
-            Qt.Key.Key_Select,
-            Qt.Key.Key_Space,
-            Qt.Key.Key_GamepadA,
-        ):
-            return self._activate_focused_control()
-        if key in (Qt.Key.Key_GamepadB,):
-            return self._handle_console_back_action()
-        if not is_text_input and key in (Qt.Key.Key_Up, Qt.Key.Key_Left):
-            return self.focusNextPrevChild(False)
-        if not is_text_input and key in (Qt.Key.Key_Down, Qt.Key.Key_Right):
-            return self.focusNextPrevChild(True)
-        if not is_text_input and key in (Qt.Key.Key_GamepadDpadUp, Qt.Key.Key_GamepadLeft):
-            return self.focusNextPrevChild(False)
-        if not is_text_input and key in (Qt.Key.Key_GamepadDpadDown, Qt.Key.Key_GamepadRight):
-            return self.focusNextPrevChild(True)
-        return False
+        forward = self._NAV_KEYS.get(key)
+        if forward is not None:
+            if isinstance(self.focusWidget(), (QLineEdit, QComboBox)):
+                # Las flechas deben mover el cursor dentro de los campos de texto
+                return False
+            return self.focusNextPrevChild(forward)
+        action = self._GAMEPAD_DISPATCH.get(key)
+        return action(self) if action is not None else False
 
     def keyPressEvent(self, event: QKeyEvent) -> None:  # type: ignore[override]
         """Soporte de teclado/mando para el modo consola."""
+        key = event.key()
+        if key == Qt.Key.Key_F11 or key == Qt.Key.Key_Guide:
+            console_mode: Optional[bool] = not self.console_mode_enabled
+        elif self.console_mode_enabled and key == Qt.Key.Key_Escape:
+            console_mode = False
+        else:
+            console_mode = None
         try:
-            if event.key() == Qt.Key.Key_F11:
-                self._apply_console_mode(not self.console_mode_enabled, save=True)
+            if console_mode is not None:
+                self._apply_console_mode(console_mode, save=True)
                 return
-            if event.key() == Qt.Key.Key_Guide:
-                self._apply_console_mode(not self.console_mode_enabled, save=True)
-                return
-            if self.console_mode_enabled and event.key() == Qt.Key.Key_Escape:
-                self._apply_console_mode(False, save=True)
-                return
-            if self._handle_gamepad_navigation(event.key()):
+            if self._handle_gamepad_navigation(key):
                 return
         except Exception:
             logging.exception("Error handling console key event")
         super().keyPressEvent(event)
 
+    def _ensure_tab_built(self, tab: QWidget) -> None:
+        """Construye la pestaña ``tab`` si aún estaba pendiente."""
+        builder = self._pending_builders.pop(tab, None)
+        if builder is not None:
+            builder()
+
     def _on_tab_changed(self, index: int) -> None:
         try:
             widget = self.tabs.widget(index)
         except Exception:
             return
+        self._ensure_tab_built(widget)
         if widget is self.tab_frontends:
             if not self._retrobat_root:
                 self._ensure_retrobat_path_configured(prompt=True)
             self._scan_retrobat_inventory()
 
-    # --- Base de datos ---
-    def _build_db_tab(self) -> None:
-        lay = QVBoxLayout(self.tab_db)
-        box = QGroupBox("Ruta de la base de datos"); g = QGridLayout(box)
+    # --- Ajustes ---
+    def _make_db_group(self) -> QGroupBox:
+        """Crea el grupo con la ruta de la base de datos (``le_db``, ``btn_db``, ``btn_connect``)."""
+        box = QGroupBox("Base de datos")
+        grid = QGridLayout(box)
         self.le_db = QLineEdit(); self.btn_db = QPushButton("Elegir…")
         self.btn_db.clicked.connect(self._choose_db)
         self.btn_connect = QPushButton("Conectar y cargar filtros")
         self.btn_connect.clicked.connect(self._connect_db)
-        g.addWidget(QLabel("SQLite:"),0,0); g.addWidget(self.le_db,0,1); g.addWidget(self.btn_db,0,2)
-        g.addWidget(self.btn_connect,1,2)
-        lay.addWidget(box)
-
-    # --- Ajustes de descarga ---
-    def _build_dl_settings_tab(self) -> None:
-        lay = QVBoxLayout(self.tab_dl_settings)
-        box = QGroupBox("Carpeta de descargas y concurrencia"); g = QGridLayout(box)
-        self.le_dir = QLineEdit(); self.btn_dir = QPushButton("Elegir…"); self.btn_dir.clicked.connect(self._choose_dir)
-        self.spin_conc = QSpinBox(); self.spin_conc.setRange(1,5); self.spin_conc.setValue(3)
-        self.spin_conc.valueChanged.connect(lambda v: self.manager.set_max_concurrent(v))
+        grid.addWidget(QLabel("SQLite:"), 0, 0)
+        grid.addWidget(self.le_db, 0, 1)
+        grid.addWidget(self.btn_db, 0, 2)
+        grid.addWidget(self.btn_connect, 1, 2)
+        return box
+
+    def _make_dl_group(self) -> QGroupBox:
+        """Crea el grupo con la carpeta de descargas, la concurrencia y la extracción."""
+        box = QGroupBox("Descargas")
+        grid = QGridLayout(box)
+        self.le_dir = QLineEdit(); self.btn_dir = QPushButton("Elegir…")
+        self.le_dir.textChanged.connect(self._on_dest_dir_changed)
+        self.btn_dir.clicked.connect(self._choose_dir)
+        self.spin_conc = QSpinBox(); self.spin_conc.setRange(1, 5); self.spin_conc.setValue(3)
+        self.spin_conc.valueChanged.connect(self._on_conc_changed)
         self.chk_extract_after = QCheckBox("Descomprimir al finalizar")
         self.chk_delete_after = QCheckBox("Eliminar archivo tras descompresión")
         self.chk_delete_after.setEnabled(False)
-        self.chk_extract_after.toggled.connect(lambda v: self.chk_delete_after.setEnabled(v))
+        self.chk_extract_after.toggled.connect(self.chk_delete_after.setEnabled)
         self.chk_create_sys_dirs = QCheckBox("Crear carpetas por sistema")
         self.btn_recommended = QPushButton("Usar ajustes recomendados para máxima velocidad")
-        self.btn_recommended.clicked.connect(lambda: (self.spin_conc.setValue(5)))
-        g.addWidget(QLabel("Carpeta descargas:"),0,0); g.addWidget(self.le_dir,0,1); g.addWidget(self.btn_dir,0,2)
-        g.addWidget(QLabel("Concurrencia (1–5):"),1,0); g.addWidget(self.spin_conc,1,1)
-        g.addWidget(self.chk_extract_after,2,0,1,3)
-        g.addWidget(self.chk_delete_after,3,0,1,3)
-        g.addWidget(self.chk_create_sys_dirs,4,0,1,3)
-        g.addWidget(self.btn_recommended,5,0,1,3)
-        lay.addWidget(box)
-        # Persistencia de sesión
-        sess = QGroupBox("Sesión de descargas"); h = QHBoxLayout(sess)
+        self.btn_recommended.clicked.connect(self._apply_recommended_settings)
+        grid.addWidget(QLabel("Carpeta descargas:"), 0, 0); grid.addWidget(self.le_dir, 0, 1); grid.addWidget(self.btn_dir, 0, 2)
+        grid.addWidget(QLabel("Concurrencia (1–5):"), 1, 0); grid.addWidget(self.spin_conc, 1, 1)
+        grid.addWidget(self.chk_extract_after, 2, 0, 1, 3)
+        grid.addWidget(self.chk_delete_after, 3, 0, 1, 3)
+        grid.addWidget(self.chk_create_sys_dirs, 4, 0, 1, 3)
+        grid.addWidget(self.btn_recommended, 5, 0, 1, 3)
+        return box
+
+    def _make_session_group(self) -> QGroupBox:
+        """Crea el grupo con los botones para guardar y cargar la sesión de descargas."""
+        box = QGroupBox("Sesión de descargas")
+        hbox = QHBoxLayout(box)
         self.btn_save_session = QPushButton("Guardar sesión")
         self.btn_load_session = QPushButton("Cargar sesión")
         self.btn_save_session.clicked.connect(self._save_session)
         self.btn_load_session.clicked.connect(self._load_session)
-        h.addWidget(self.btn_save_session); h.addWidget(self.btn_load_session)
-        lay.addWidget(sess)
+        hbox.addWidget(self.btn_save_session)
+        hbox.addWidget(self.btn_load_session)
+        return box
 
-    # --- Ajustes ---
     def _build_settings_tab(self) -> None:
         """
         Construye la pestaña de Ajustes que agrupa la configuración de la base de
-        datos y las opciones de descarga en un único panel. Este método crea
-        grupos de controles para la ruta de la base de datos, la ruta de
-        descargas, la concurrencia y las preferencias de sesión.
+        datos y las opciones de descarga en un único panel. Los grupos de la
+        base de datos, las descargas y la sesión se crean una sola vez con
+        ``_make_db_group``, ``_make_dl_group`` y ``_make_session_group``.
         """
         lay = QVBoxLayout(self.tab_settings)
         logging.debug("Building settings tab with DB and download options.")
-        # Grupo de configuración de base de datos
-        gb_db = QGroupBox("Base de datos")
-        grid_db = QGridLayout(gb_db)
-        # Reutilizar widgets existentes para la BD
-        # Entrada para ruta de la base de datos y botón para seleccionar
-        self.le_db = QLineEdit(); self.btn_db = QPushButton("Elegir…")
-        self.btn_db.clicked.connect(self._choose_db)
-        self.btn_connect = QPushButton("Conectar y cargar filtros")
-        self.btn_connect.clicked.connect(self._connect_db)
-        grid_db.addWidget(QLabel("SQLite:"), 0, 0)
-        grid_db.addWidget(self.le_db, 0, 1)
-        grid_db.addWidget(self.btn_db, 0, 2)
-        grid_db.addWidget(self.btn_connect, 1, 2)
-        lay.addWidget(gb_db)
-
-        # Grupo de configuración de descargas
-        gb_dl = QGroupBox("Descargas")
-        grid_dl = QGridLayout(gb_dl)
-        self.le_dir = QLineEdit(); self.btn_dir = QPushButton("Elegir…")
-        self.btn_dir.clicked.connect(self._choose_dir)
-        self.spin_conc = QSpinBox(); self.spin_conc.setRange(1, 5); self.spin_conc.setValue(3)
-        self.spin_conc.valueChanged.connect(lambda v: self.manager.set_max_concurrent(v))
-        self.chk_extract_after = QCheckBox("Descomprimir al finalizar")
-        self.chk_delete_after = QCheckBox("Eliminar archivo tras descompresión")
-        self.chk_delete_after.setEnabled(False)
-        self.chk_extract_after.toggled.connect(lambda v: self.chk_delete_after.setEnabled(v))
-        self.chk_create_sys_dirs = QCheckBox("Crear carpetas por sistema")
-        self.btn_recommended = QPushButton("Usar ajustes recomendados para máxima velocidad")
-        self.btn_recommended.clicked.connect(lambda: (self.spin_conc.setValue(5)))
-        grid_dl.addWidget(QLabel("Carpeta descargas:"), 0, 0); grid_dl.addWidget(self.le_dir, 0, 1); grid_dl.addWidget(self.btn_dir, 0, 2)
-        grid_dl.addWidget(QLabel("Concurrencia (1–5):"), 1, 0); grid_dl.addWidget(self.spin_conc, 1, 1)
-        grid_dl.addWidget(self.chk_extract_after, 2, 0, 1, 3)
-        grid_dl.addWidget(self.chk_delete_after, 3, 0, 1, 3)
-        grid_dl.addWidget(self.chk_create_sys_dirs, 4, 0, 1, 3)
-        grid_dl.addWidget(self.btn_recommended, 5, 0, 1, 3)
-        lay.addWidget(gb_dl)
-
-        # Grupo de sesión de descargas
-        gb_session = QGroupBox("Sesión de descargas")
-        hbox_sess = QHBoxLayout(gb_session)
-        self.btn_save_session = QPushButton("Guardar sesión")
-        self.btn_load_session = QPushButton("Cargar sesión")
-        self.btn_save_session.clicked.connect(self._save_session)
-        self.btn_load_session.clicked.connect(self._load_session)
-        hbox_sess.addWidget(self.btn_save_session)
-        hbox_sess.addWidget(self.btn_load_session)
-        lay.addWidget(gb_session)
+        lay.addWidget(self._make_db_group())
+        lay.addWidget(self._make_dl_group())
+        lay.addWidget(self._make_session_group())
 
         # Grupo de modo consola (pantalla completa + mando)
         gb_console = QGroupBox("Interfaz tipo consola")
         console_layout = QVBoxLayout(gb_console)
         self.chk_console_mode = QCheckBox("Iniciar en modo consola (pantalla completa y mando)")
-        self.chk_console_mode.toggled.connect(lambda checked: self._apply_console_mode(checked, save=True))
+        self.chk_console_mode.toggled.connect(self._on_console_mode_toggled)
         console_layout.addWidget(self.chk_console_mode)
         lbl_console_hint = QLabel(
             "Al activar este modo, la aplicación arranca en pantalla completa y habilita atajos de mando: "
@@ -1029,6 +1240,8 @@ class MainWindow(QMainWindow):
         self.selector_subtabs.addTab(self.selector_tab_consoles, "Consolas")
         self.selector_subtabs.addTab(self.selector_tab_arcades, "Arcades")
         lay.addWidget(self.selector_subtabs)
+        self._pending_builders[self.selector_tab_arcades] = self._build_arcades_selector_tab
+        self.selector_subtabs.currentChanged.connect(self._on_selector_subtab_changed)
 
         consoles_lay = QVBoxLayout(self.selector_tab_consoles)
 
@@ -1051,11 +1264,9 @@ class MainWindow(QMainWindow):
         consoles_lay.addWidget(filters)
 
         # Tabla de resultados agrupados: columnas ROM, Sistema, Servidor, Formato, Idiomas, Acciones
-        self.table_results = QTableWidget(0, 6)
-        self.table_results.setHorizontalHeaderLabels([
-            "ROM", "Sistema", "Servidor", "Formato", "Idiomas", "Acciones"
-        ])
-        self.table_results.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table_results = self._create_choice_view(
+            self.results_model, [("Añadir", self._add_group_to_basket)]
+        )
         consoles_lay.addWidget(self.table_results)
 
         # Encabezado de la cesta y tabla de la cesta: se sitúan debajo de los resultados
@@ -1074,18 +1285,12 @@ class MainWindow(QMainWindow):
         target_layout.addWidget(self.cmb_download_target, 1)
         consoles_lay.addWidget(download_target_box)
 
-        self.table_basket = QTableWidget(0, 6)
-        self.table_basket.setHorizontalHeaderLabels([
-            "ROM", "Sistema", "Servidor", "Formato", "Idioma", "Acciones"
-        ])
-        self.table_basket.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table_basket = self._create_basket_view()
         consoles_lay.addWidget(self.table_basket)
         self.btn_basket_add_all = QPushButton("Añadir todo a descargas")
         self.btn_basket_add_all.clicked.connect(self._basket_add_all_to_downloads)
         consoles_lay.addWidget(self.btn_basket_add_all)
 
-        self._build_arcades_selector_tab()
-
         # Inicializar la cesta vacía
         self._refresh_basket_table()
 
@@ -1114,11 +1319,9 @@ class MainWindow(QMainWindow):
         f.addWidget(self.btn_arcades_paste,6,0,1,3)
         lay.addWidget(filters)
 
-        self.table_arcades = QTableWidget(0, 6)
-        self.table_arcades.setHorizontalHeaderLabels([
-            "ROM", "Sistema", "Servidor", "Formato", "Idiomas", "Acciones"
-        ])
-        self.table_arcades.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table_arcades = self._create_choice_view(
+            self.arcades_results_model, [("Añadir", self._add_arcades_group_to_basket)]
+        )
         lay.addWidget(self.table_arcades)
 
         basket_label = QLabel("Cesta de descargas")
@@ -1136,16 +1339,22 @@ class MainWindow(QMainWindow):
         target_layout.addWidget(self.cmb_download_target_arcades, 1)
         lay.addWidget(download_target_box)
 
-        self.table_basket_arcades = QTableWidget(0, 6)
-        self.table_basket_arcades.setHorizontalHeaderLabels([
-            "ROM", "Sistema", "Servidor", "Formato", "Idioma", "Acciones"
-        ])
-        self.table_basket_arcades.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table_basket_arcades = self._create_basket_view()
         lay.addWidget(self.table_basket_arcades)
         self.btn_basket_add_all_arcades = QPushButton("Añadir todo a descargas")
         self.btn_basket_add_all_arcades.clicked.connect(self._basket_add_all_to_downloads)
         lay.addWidget(self.btn_basket_add_all_arcades)
 
+        # Al construirse tarde, ponerse al día con el destino y la BD ya cargados
+        self.cmb_download_target_arcades.blockSignals(True)
+        self.cmb_download_target_arcades.setCurrentIndex(self.cmb_download_target.currentIndex())
+        self.cmb_download_target_arcades.blockSignals(False)
+        if self.db:
+            self._load_arcades_filters()
+
+    def _on_selector_subtab_changed(self, index: int) -> None:
+        self._ensure_tab_built(self.selector_subtabs.widget(index))
+
     # --- Frontends (RetroBat) ---
     def _build_frontends_tab(self) -> None:
         """Construye la pestaña para gestionar frontends como RetroBat."""
@@ -1164,9 +1373,9 @@ class MainWindow(QMainWindow):
         self.le_retrobat_root.setPlaceholderText("Selecciona la carpeta raíz de RetroBat…")
         self.le_retrobat_root.setReadOnly(True)
         self.btn_retrobat_browse = QPushButton("Elegir carpeta…")
-        self.btn_retrobat_browse.clicked.connect(lambda: self._ensure_retrobat_path_configured(prompt=True))
+        self.btn_retrobat_browse.clicked.connect(self._browse_retrobat_root)
         self.btn_retrobat_scan = QPushButton("Actualizar inventario")
-        self.btn_retrobat_scan.clicked.connect(self._scan_retrobat_inventory)
+        self.btn_retrobat_scan.clicked.connect(self._rescan_retrobat_inventory)
         grid.addWidget(QLabel("Carpeta RetroBat:"), 0, 0)
         grid.addWidget(self.le_retrobat_root, 0, 1)
         grid.addWidget(self.btn_retrobat_browse, 0, 2)
@@ -1198,7 +1407,7 @@ class MainWindow(QMainWindow):
         self.table_retrobat_systems.setHorizontalHeaderLabels([
             "Carpeta", "Sistema", "ROMs", "Emulador", "BIOS"
         ])
-        self.table_retrobat_systems.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self._set_column_widths(self.table_retrobat_systems, self._RETROBAT_COLUMN_WIDTHS)
         self.table_retrobat_systems.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table_retrobat_systems.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table_retrobat_systems.itemSelectionChanged.connect(self._on_retrobat_system_selected)
@@ -1211,10 +1420,13 @@ class MainWindow(QMainWindow):
         lay.addWidget(systems_box)
 
         lay.addStretch()
+        self.le_retrobat_root.setText(self._retrobat_root)
+        self.le_retrobat_exe.setText(self._retrobat_exe)
 
     def _ensure_retrobat_path_configured(self, *, prompt: bool = False) -> bool:
         if self._retrobat_root and os.path.isdir(self._retrobat_root):
-            self.le_retrobat_root.setText(self._retrobat_root)
+            if hasattr(self, 'le_retrobat_root'):
+                self.le_retrobat_root.setText(self._retrobat_root)
             return True
 
         if not prompt:
@@ -1231,15 +1443,20 @@ class MainWindow(QMainWindow):
             return False
 
         self._retrobat_root = path
-        self.le_retrobat_root.setText(path)
+        if hasattr(self, 'le_retrobat_root'):
+            self.le_retrobat_root.setText(path)
         default_exe = os.path.join(path, "RetroBat.exe")
         if os.path.isfile(default_exe):
             self._retrobat_exe = default_exe
-            self.le_retrobat_exe.setText(default_exe)
+            if hasattr(self, 'le_retrobat_exe'):
+                self.le_retrobat_exe.setText(default_exe)
         self._scan_retrobat_inventory()
         self._save_config()
         return True
 
+    def _browse_retrobat_root(self) -> None:
+        self._ensure_retrobat_path_configured(prompt=True)
+
     def _choose_retrobat_exe(self) -> None:
         if not self._ensure_retrobat_path_configured(prompt=True):
             return
@@ -1273,27 +1490,49 @@ class MainWindow(QMainWindow):
             logging.exception("No se pudo lanzar RetroBat")
             QMessageBox.critical(self, "RetroBat", f"No se pudo ejecutar RetroBat: {exc}")
 
-    def _scan_retrobat_inventory(self) -> None:
+    def _scan_retrobat_inventory(self, force: bool = False) -> None:
+        """
+        Programa un inventario de la carpeta de RetroBat.
+
+        Las llamadas que lleguen en menos de 150 ms se agrupan en un único
+        recorrido (por ejemplo al pasar de pestaña con el mando). Salvo con
+        ``force``, las carpetas sin cambios se toman de la caché.
+        """
+        # Sin la pestaña construida no hay dónde mostrarlo; se inventaría al abrirla
+        if not self._retrobat_root or self.tab_frontends in self._pending_builders:
+            return
+        self._scan_force = self._scan_force or force
+        self._scan_timer.start()
+
+    def _scan_retrobat_inventory_real(self) -> None:
+        """
+        Inventaría la carpeta de RetroBat en el ``QThreadPool``.
+
+        El resultado llega a :meth:`_on_retrobat_scan_finished` en el hilo de
+        la interfaz; si entretanto empezó otro recorrido, se descarta.
+        """
         if not self._retrobat_root:
             return
-        rom_base = Path(self._retrobat_root) / "roms"
-        emu_base = Path(self._retrobat_root) / "emulators"
-        bios_base = Path(self._retrobat_root) / "bios"
-        inventory: List[Dict[str, object]] = []
-        for folder, display in self._RETROBAT_ROM_FOLDERS.items():
-            rom_dir = rom_base / folder
-            rom_count = sum(1 for p in rom_dir.rglob("*") if p.is_file()) if rom_dir.exists() else 0
-            has_emulator = (emu_base / folder).exists()
-            has_bios = (bios_base / folder).exists()
-            inventory.append(
-                {
-                    "folder": folder,
-                    "display": display,
-                    "roms": rom_count,
-                    "emulator": has_emulator,
-                    "bios": has_bios,
-                }
-            )
+        force, self._scan_force = self._scan_force, False
+        self._scan_gen += 1
+        task = _RetroBatScanTask(
+            self._scan_gen, self._retrobat_root, str(config_path(_RETROBAT_CACHE_FILE)), force
+        )
+        task.signals.finished.connect(self._on_retrobat_scan_finished)
+        # Mantener vivo el emisor hasta que llegue la señal
+        self._retrobat_scan_signals = task.signals
+        self.pool.start(task)
+
+    def _rescan_retrobat_inventory(self) -> None:
+        """Vuelve a contar todas las carpetas sin usar la caché."""
+        self._scan_retrobat_inventory(force=True)
+
+    def _on_retrobat_scan_finished(self, gen: int, inventory: list) -> None:
+        """Muestra el inventario calculado en segundo plano."""
+        if gen != self._scan_gen:
+            # Resultado de un recorrido ya superado (p. ej. cambió la carpeta)
+            return
+        self._retrobat_scan_signals = None
         self._retrobat_inventory = inventory
         self._populate_retrobat_table()
         self._refresh_retrobat_summary()
@@ -1301,18 +1540,30 @@ class MainWindow(QMainWindow):
     def _populate_retrobat_table(self) -> None:
         if not hasattr(self, "table_retrobat_systems"):
             return
-        self.table_retrobat_systems.setRowCount(0)
-        for entry in self._retrobat_inventory:
-            row = self.table_retrobat_systems.rowCount()
-            self.table_retrobat_systems.insertRow(row)
-            self.table_retrobat_systems.setItem(row, 0, QTableWidgetItem(str(entry["folder"])))
-            self.table_retrobat_systems.setItem(row, 1, QTableWidgetItem(str(entry["display"])))
-            self.table_retrobat_systems.setItem(row, 2, QTableWidgetItem(str(entry["roms"])))
-            self.table_retrobat_systems.setItem(row, 3, QTableWidgetItem("Sí" if entry["emulator"] else "No"))
-            self.table_retrobat_systems.setItem(row, 4, QTableWidgetItem("Sí" if entry["bios"] else "No"))
-
-        if self.table_retrobat_systems.rowCount() > 0:
-            self.table_retrobat_systems.selectRow(0)
+        t = self.table_retrobat_systems
+        sorting = t.isSortingEnabled()
+        # Rellenar de una vez: sin repintados ni ordenación por cada celda. Las
+        # columnas tienen ancho fijo inicial, así que no se recalculan al insertar
+        t.setUpdatesEnabled(False)
+        t.setSortingEnabled(False)
+        try:
+            t.clearContents()
+            t.setRowCount(len(self._retrobat_inventory))
+            for row, entry in enumerate(self._retrobat_inventory):
+                t.setItem(row, 0, QTableWidgetItem(str(entry["folder"])))
+                t.setItem(row, 1, QTableWidgetItem(str(entry["display"])))
+                # El número se guarda como entero: Qt lo formatea y ordena numéricamente
+                roms_item = QTableWidgetItem()
+                roms_item.setData(Qt.ItemDataRole.DisplayRole, int(entry["roms"]))
+                t.setItem(row, 2, roms_item)
+                t.setItem(row, 3, QTableWidgetItem(self._YES_TEXT if entry["emulator"] else self._NO_TEXT))
+                t.setItem(row, 4, QTableWidgetItem(self._YES_TEXT if entry["bios"] else self._NO_TEXT))
+        finally:
+            t.setSortingEnabled(sorting)
+            t.setUpdatesEnabled(True)
+
+        if t.rowCount() > 0:
+            t.selectRow(0)
 
     def _refresh_retrobat_summary(self) -> None:
         if not hasattr(self, "lbl_retrobat_summary"):
@@ -1342,22 +1593,29 @@ class MainWindow(QMainWindow):
         self.list_retrobat_roms.clear()
         if not self._retrobat_root:
             return
-        rom_dir = Path(self._retrobat_root) / "roms" / folder
-        if not rom_dir.exists():
+        rom_dir = os.path.join(self._retrobat_root, "roms", folder)
+        if not os.path.exists(rom_dir):
             self.list_retrobat_roms.addItem("La carpeta de ROMs no existe para este sistema.")
             return
-        files = [p for p in rom_dir.iterdir() if p.is_file()]
+        try:
+            with os.scandir(rom_dir) as it:
+                files = [entry.name for entry in it if entry.is_file(follow_symlinks=False)]
+        except OSError:
+            logging.exception("Failed to list RetroBat folder %s", rom_dir)
+            files = []
         if not files:
             self.list_retrobat_roms.addItem("No hay ROMs en esta carpeta.")
             return
-        files = sorted(files, key=lambda p: p.name.lower())
         max_items = 500
-        for idx, file in enumerate(files):
-            if idx >= max_items:
-                remaining = len(files) - max_items
-                self.list_retrobat_roms.addItem(f"… y {remaining} archivos más")
-                break
-            self.list_retrobat_roms.addItem(file.name)
+        if len(files) > max_items * 2:
+            # Solo se muestran los primeros: seleccionarlos sin ordenar toda la carpeta
+            names = heapq.nsmallest(max_items, files, key=str.lower)
+        else:
+            names = sorted(files, key=str.lower)[:max_items]
+        if len(files) > max_items:
+            names.append(f"… y {len(files) - max_items} archivos más")
+        # Una sola inserción en el modelo de la lista
+        self.list_retrobat_roms.addItems(names)
 
     # --- Emuladores ---
     def _build_emulators_tab(self) -> None:
@@ -1377,6 +1635,10 @@ class MainWindow(QMainWindow):
         path_grid.addWidget(self.btn_emulator_dir, 0, 2)
         path_grid.addWidget(self.chk_emulator_delete, 1, 0, 1, 3)
         lay.addWidget(path_box)
+        self.le_emulator_dir.setText(self._emulator_dir)
+        self.chk_emulator_delete.setChecked(self._emulator_delete_archive)
+        self.le_emulator_dir.textChanged.connect(self._on_emulator_dir_changed)
+        self.chk_emulator_delete.toggled.connect(self._on_emulator_delete_toggled)
 
         # Selector dependiente sistema -> emulador
         selector_box = QGroupBox("Catálogo de emuladores")
@@ -1416,7 +1678,7 @@ class MainWindow(QMainWindow):
         self.list_emulator_extras = QListWidget()
         self.list_emulator_extras.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.list_emulator_extras.itemSelectionChanged.connect(self._on_extra_selection_changed)
-        self.list_emulator_extras.itemDoubleClicked.connect(lambda _: self._download_selected_extra())
+        self.list_emulator_extras.itemDoubleClicked.connect(self._on_emulator_extra_double_clicked)
         form.addRow("Archivos extra:", self.list_emulator_extras)
 
         self.btn_emulator_download_extra = QPushButton("Descargar archivo extra")
@@ -1654,6 +1916,12 @@ class MainWindow(QMainWindow):
             self._emulator_feedback_icon.clear()
             self._emulator_feedback_icon.setVisible(False)
 
+    def _on_emulator_dir_changed(self, text: str) -> None:
+        self._emulator_dir = text.strip()
+
+    def _on_emulator_delete_toggled(self, checked: bool) -> None:
+        self._emulator_delete_archive = checked
+
     def _choose_emulator_dir(self) -> None:
         base = self.le_emulator_dir.text().strip() or os.getcwd()
         path = QFileDialog.getExistingDirectory(self, "Seleccionar carpeta de emuladores", base)
@@ -1719,6 +1987,9 @@ class MainWindow(QMainWindow):
         )
 
 
+    def _on_emulator_extra_double_clicked(self, _item: QListWidgetItem) -> None:
+        self._download_selected_extra()
+
     def _download_selected_extra(self) -> None:
         base_dir = self.le_emulator_dir.text().strip()
         if not base_dir:
@@ -1810,12 +2081,11 @@ class MainWindow(QMainWindow):
             )
 
     def _handle_emulator_install(self, item: DownloadItem) -> None:
-        dest_file = os.path.join(item.dest_dir, safe_filename(item.name))
+        dest_file = item.final_path
 
         if not os.path.exists(dest_file):
             logging.warning("Archivo de emulador no encontrado tras la descarga: %s", dest_file)
-            if item.row is not None and 0 <= item.row < self.table_dl.rowCount():
-                self.table_dl.item(item.row, 4).setText('Error: archivo no encontrado')
+            self._set_item_status(item, 'Error: archivo no encontrado')
             return
 
         delete_archive = False
@@ -1844,7 +2114,7 @@ class MainWindow(QMainWindow):
         return False
 
     def _handle_emulator_extra(self, item: DownloadItem) -> None:
-        dest_file = os.path.join(item.dest_dir, safe_filename(item.name))
+        dest_file = item.final_path
         if not os.path.exists(dest_file):
             logging.warning("Archivo extra no encontrado tras la descarga: %s", dest_file)
             return
@@ -1875,21 +2145,29 @@ class MainWindow(QMainWindow):
                         logging.exception("Error deleting extra archive %s", dest_file)
 
         status_text = "Extra instalado" if extracted else ("Error al descomprimir" if extraction_failed else "Extra descargado")
-        if item.row is not None and 0 <= item.row < self.table_dl.rowCount():
-            self.table_dl.item(item.row, 4).setText(status_text)
+        self._set_item_status(item, status_text)
 
     # --- Descargas ---
     def _build_downloads_tab(self) -> None:
         lay = QVBoxLayout(self.tab_downloads)
         logging.debug("Building downloads tab with progress table.")
         # Tabla con columnas: Nombre, Sistema, Formato, Tamaño, Estado, Progreso, Velocidad, ETA, Acciones
-        self.table_dl = QTableWidget(0, 9)
-        self.table_dl.setHorizontalHeaderLabels([
-            "Nombre", "Sistema", "Formato", "Tamaño", "Estado", "Progreso", "Velocidad", "ETA", "Acciones"
-        ])
+        self.table_dl = QTableView()
+        self.table_dl.setModel(self.dl_model)
+        self.table_dl.verticalHeader().setVisible(False)
+        self.table_dl.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        # La barra de progreso y los botones se pintan; no hay widgets por fila
+        self.table_dl.setItemDelegateForColumn(
+            DownloadsTableModel.COL_PROGRESS, ProgressBarDelegate(DownloadsTableModel.ProgressRole, self.table_dl)
+        )
+        actions = ButtonsDelegate([], self.table_dl, buttons_role=DownloadsTableModel.ButtonsRole)
+        actions.clicked.connect(self._on_download_action)
+        self.table_dl.setItemDelegateForColumn(DownloadsTableModel.COL_ACTIONS, actions)
         # Ajustar la anchura de las columnas de manera que la de acciones se adapte al contenido
         self.table_dl.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.table_dl.horizontalHeader().setSectionResizeMode(8, QHeaderView.ResizeMode.ResizeToContents)
+        self.table_dl.horizontalHeader().setSectionResizeMode(
+            DownloadsTableModel.COL_ACTIONS, QHeaderView.ResizeMode.ResizeToContents
+        )
         # Permitir selección múltiple por fila y capturar tecla Suprimir
         self.table_dl.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table_dl.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
@@ -1948,6 +2226,17 @@ class MainWindow(QMainWindow):
             self.le_dir.setText(d)
             self.session_file = str(self._session_storage_path(d))
 
+    def _on_conc_changed(self, value: int) -> None:
+        self.manager.set_max_concurrent(value)
+
+    def _apply_recommended_settings(self) -> None:
+        """Aplica la concurrencia máxima recomendada."""
+        self.spin_conc.setValue(5)
+
+    def _on_dest_dir_changed(self, text: str) -> None:
+        """Guarda la carpeta de descargas normalizada para no releerla del campo."""
+        self._cached_dest_dir = text.strip()
+
     def _connect_db(self) -> None:
         """Conecta a la base de datos y carga los filtros."""
         path = self.le_db.text().strip()
@@ -1960,6 +2249,7 @@ class MainWindow(QMainWindow):
                 self.db.close()
             self.db = Database(path)
             self.db.connect()
+            self._group_cache.clear()
             self._load_filters()
         except Exception as e:
             QMessageBox.critical(self, "Error BD", str(e))
@@ -1970,13 +2260,16 @@ class MainWindow(QMainWindow):
         self.cmb_system.clear(); [self.cmb_system.addItem(n, i) for i,n in self.db.get_systems()]
         self.cmb_lang.clear();   [self.cmb_lang.addItem(c, i) for i,c in self.db.get_languages()]
         self.cmb_region.clear(); [self.cmb_region.addItem(c, i) for i,c in self.db.get_regions()]
-        self.cmb_fmt.clear();    [self.cmb_fmt.addItem(x) for x in self.db.get_formats()]
-        if hasattr(self, "cmb_lang_arcades"):
-            self.cmb_lang_arcades.clear(); [self.cmb_lang_arcades.addItem(c, i) for i,c in self.db.get_languages()]
-        if hasattr(self, "cmb_region_arcades"):
-            self.cmb_region_arcades.clear(); [self.cmb_region_arcades.addItem(c, i) for i,c in self.db.get_regions()]
-        if hasattr(self, "cmb_fmt_arcades"):
-            self.cmb_fmt_arcades.clear(); [self.cmb_fmt_arcades.addItem(x) for x in self.db.get_formats()]
+        self.cmb_fmt.clear();    self.cmb_fmt.addItems(self.db.get_formats())
+        if self.selector_tab_arcades not in self._pending_builders:
+            self._load_arcades_filters()
+
+    def _load_arcades_filters(self) -> None:
+        """Carga los filtros de la subpestaña Arcades y refresca sus resultados."""
+        assert self.db
+        self.cmb_lang_arcades.clear(); [self.cmb_lang_arcades.addItem(c, i) for i,c in self.db.get_languages()]
+        self.cmb_region_arcades.clear(); [self.cmb_region_arcades.addItem(c, i) for i,c in self.db.get_regions()]
+        self.cmb_fmt_arcades.clear(); self.cmb_fmt_arcades.addItems(self.db.get_formats())
         self._refresh_arcades_roms()
 
     def _default_server_index(self, servers: List[str]) -> int:
@@ -2009,55 +2302,8 @@ class MainWindow(QMainWindow):
             logging.exception("Error during search: %s", e)
             QMessageBox.critical(self, "Búsqueda", str(e))
             return
-        # Agrupar por rom_id
-        groups: dict[int, dict] = {}
-        for r in rows:
-            rom_id = r["rom_id"]
-            group = groups.setdefault(rom_id, {"name": r["rom_name"], "rows": [], "system_name": r["system_name"]})
-            group["rows"].append(r)
-        # Para cada grupo, calcular listas de servidores, formatos y idiomas
-        for rom_id, group in groups.items():
-            rows_list = group["rows"]
-            # Servidores únicos
-            servers = sorted(set((row["server"] or "") for row in rows_list))
-            # Diccionario: servidor -> lista de formatos únicos
-            formats_by_server: dict[str, List[str]] = {}
-            for srv in servers:
-                fmts = sorted(set((row["fmt"] or "") for row in rows_list if (row["server"] or "") == srv))
-                formats_by_server[srv] = fmts
-            # Diccionario: (servidor, formato) -> lista de idiomas únicos (cadenas completas)
-            langs_by_server_format: dict[tuple[str, str], List[str]] = {}
-            for r in rows_list:
-                srv = r["server"] or ""
-                fmt_val = r["fmt"] or ""
-                key = (srv, fmt_val)
-                lang_str = r["langs"] or ""
-                # Normalizar espacios y separar por coma
-                lang_str = ','.join([x.strip() for x in lang_str.split(',') if x.strip()]) or ""
-                lst = langs_by_server_format.setdefault(key, [])
-                if lang_str not in lst:
-                    lst.append(lang_str)
-            # Ordenar cada lista de idiomas
-            for key in langs_by_server_format:
-                # mantener la cadena vacía (sin idiomas) al final
-                lst = langs_by_server_format[key]
-                lst.sort()
-                langs_by_server_format[key] = lst
-            # Diccionario de búsqueda: (servidor, formato, idiomas) -> fila
-            link_lookup: dict[tuple[str, str, str], sqlite3.Row] = {}
-            for r in rows_list:
-                srv = r["server"] or ""
-                fmt_val = r["fmt"] or ""
-                lang_str = r["langs"] or ""
-                lang_str = ','.join([x.strip() for x in lang_str.split(',') if x.strip()]) or ""
-                link_lookup[(srv, fmt_val, lang_str)] = r
-            group["servers"] = servers
-            group["formats_by_server"] = formats_by_server
-            group["langs_by_server_format"] = langs_by_server_format
-            group["link_lookup"] = link_lookup
-            group["selected_server"] = self._default_server_index(servers)
-            group["selected_format"] = 0
-            group["selected_lang"] = 0
+        # Agrupar por rom_id y calcular servidores, formatos e idiomas de cada grupo
+        groups = self._build_grouped_links(rows)
         self.search_groups = groups
         # Mostrar resultados agrupados
         self._display_grouped_results()
@@ -2290,10 +2536,10 @@ class MainWindow(QMainWindow):
         text = s.lower()
         normalized = unicodedata.normalize("NFKD", text)
         text = "".join(ch for ch in normalized if not unicodedata.combining(ch))
-        text = re.sub(r"\([^)]*\)", " ", text)
-        text = re.sub(r"\[[^\]]*\]", " ", text)
-        text = text.replace("-", " ").replace("_", " ")
-        text = re.sub(r"[^0-9a-z]+", " ", text)
+        text = _RE_PARENTHESES.sub(" ", text)
+        text = _RE_BRACKETS.sub(" ", text)
+        # Guiones y guiones bajos también caen en la clase de no alfanuméricos
+        text = _RE_NON_ALNUM.sub(" ", text)
         return " ".join(text.split())
 
     @staticmethod
@@ -2310,26 +2556,25 @@ class MainWindow(QMainWindow):
         """Añade ROMs a la cesta reutilizando la lógica existente."""
         if not self.db:
             return (0, 0)
-        added = 0
+        added: List[int] = []
         already = 0
+        links_by_rom = self._fetch_links_by_rom([r for r in rom_ids if r not in self.basket_items])
         for rom_id in rom_ids:
             if rom_id in self.basket_items:
                 already += 1
                 continue
-            links = self.db.get_links_by_rom(rom_id)
+            links = links_by_rom.get(rom_id)
             if not links:
                 continue
             rom_name = links[0]["rom_name"]
-            group = self.search_groups.get(rom_id)
-            if group is None:
-                group = self._create_group_from_links(rom_name, links)
+            group = self._group_for_rom(rom_id, rom_name, links)
             if self._add_links_to_basket(rom_id, rom_name, links, group):
-                added += 1
+                added.append(rom_id)
             else:
                 already += 1
-        if added:
-            self._refresh_basket_table()
-        return added, already
+        # Una sola inserción de filas en el modelo para todo el lote
+        self.basket_model.add_items(added)
+        return len(added), already
 
     def _refresh_arcades_roms(self) -> None:
         """Refresca Arcades reutilizando la búsqueda visual estilo Consolas."""
@@ -2349,7 +2594,7 @@ class MainWindow(QMainWindow):
             if not ext:
                 break
             ext_lower = ext.lower()
-            if ext_lower in cls._KNOWN_ROM_EXTENSIONS:
+            if ext_lower in _KNOWN_ROM_EXTENSIONS:
                 name = base
                 continue
             break
@@ -2375,14 +2620,11 @@ class MainWindow(QMainWindow):
 
     def _build_download_name(self, url: str) -> str:
         """Devuelve el nombre de archivo original decodificando la URL."""
-        path = urlsplit(url).path
-        base = os.path.basename(path) or "archivo"
-        base = unquote(base)
-        return safe_filename(base)
+        return _download_name_from_url(url)
 
     def _enqueue_selected(self) -> None:
         """Añade las filas seleccionadas en la tabla de búsqueda a la cola de descargas."""
-        save_dir = self.le_dir.text().strip()
+        save_dir = self._cached_dest_dir
         if not save_dir:
             QMessageBox.warning(self, "Descargas", "Selecciona una carpeta de descargas en la pestaña de Ajustes.")
             return
@@ -2420,18 +2662,17 @@ class MainWindow(QMainWindow):
 
     def _add_download_row(self, item: DownloadItem, src_row: sqlite3.Row, loaded: bool = False) -> None:
         """
-        Inserta una nueva fila en la tabla de descargas para el item dado y configura
-        los botones de pausa, reanudación y cancelación o reinicio.
+        Añade una fila a la tabla de descargas para el item dado. Con ``loaded``
+        el tercer botón reinicia la descarga en lugar de cancelarla.
         """
-        row = self.table_dl.rowCount(); self.table_dl.insertRow(row); item.row = row
         logging.debug("Adding download row: item=%s, dest_dir=%s", item.name, item.dest_dir)
-        def set_item(c: int, text: str) -> None:
-            self.table_dl.setItem(row, c, QTableWidgetItem(text))
         # Mostrar el nombre de la ROM si se proporciona; en su defecto usar el nombre del archivo
         display_name = None
         # src_row puede ser sqlite3.Row o un dict
         try:
-            if isinstance(src_row, dict) and 'display_name' in src_row:
+            if isinstance(src_row, DownloadRowInfo):
+                display_name = src_row.display_name
+            elif isinstance(src_row, dict) and 'display_name' in src_row:
                 display_name = src_row['display_name']
             elif isinstance(src_row, dict) and 'rom_name' in src_row:
                 display_name = src_row['rom_name']
@@ -2442,13 +2683,14 @@ class MainWindow(QMainWindow):
             display_name = None
         if not display_name:
             display_name = item.name
-        set_item(0, display_name)
         # Sistema, formato y tamaño
         # src_row puede ser dict o Row; utilizar get si es dict
         system = ''
         fmt = ''
         size = ''
-        if isinstance(src_row, dict):
+        if isinstance(src_row, DownloadRowInfo):
+            system, fmt, size = src_row.system_name, src_row.fmt, src_row.size
+        elif isinstance(src_row, dict):
             system = src_row.get('system_name', '') or ''
             fmt = src_row.get('fmt', '') or ''
             size = src_row.get('size', '') or ''
@@ -2461,142 +2703,132 @@ class MainWindow(QMainWindow):
                 pass
         if not system:
             system = getattr(item, 'system_name', '')
-        set_item(1, system)
-        set_item(2, fmt)
-        set_item(3, size)
-        set_item(4, "En cola")
-        prog = QProgressBar(); prog.setRange(0, 100); prog.setValue(0); self.table_dl.setCellWidget(row, 5, prog)
-        set_item(6, '-')
-        set_item(7, '-')
-        # Acciones: añadir botones de Pausar, Reanudar, Cancelar/Reiniciar, Eliminar y Abrir
-        w = QWidget(); h = QHBoxLayout(w); h.setContentsMargins(0, 0, 0, 0)
-        # Crear botones con iconos para una mejor distinción visual
-        b_pause = QPushButton()
-        b_res = QPushButton()
-        b_can = QPushButton()
-        b_del = QPushButton()
-        b_open = QPushButton()
+        self.dl_model.append(DownloadRow(item, display_name, system, fmt, size, loaded=loaded))
+
+    def _download_action_buttons(self) -> tuple:
+        """Iconos y ayudas de los botones de acciones (filas normales y cargadas)."""
         style = QApplication.style()
+        pixmaps = QStyle.StandardPixmap
         try:
-            b_pause.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaPause))
-            b_res.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
-            if loaded:
-                b_can.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
+            trash = style.standardIcon(pixmaps.SP_TrashIcon)
+        except Exception:
+            # Algunas distribuciones no tienen SP_TrashIcon
+            trash = style.standardIcon(pixmaps.SP_DialogDiscardButton)
+        pause = (style.standardIcon(pixmaps.SP_MediaPause), "Pausar descarga")
+        resume = (style.standardIcon(pixmaps.SP_MediaPlay), "Reanudar descarga")
+        cancel = (style.standardIcon(pixmaps.SP_DialogCancelButton), "Cancelar descarga")
+        restart = (style.standardIcon(pixmaps.SP_BrowserReload), "Reiniciar descarga")
+        delete = (trash, "Eliminar descarga")
+        open_dir = (style.standardIcon(pixmaps.SP_DirOpenIcon), "Abrir ubicación")
+        return (
+            (pause, resume, cancel, delete, open_dir),
+            (pause, resume, restart, delete, open_dir),
+        )
+
+    def _on_download_action(self, row: int, button: int) -> None:
+        """Atiende los botones pintados en la columna de acciones de descargas."""
+        entry = self.dl_model.row_at(row)
+        if entry is None:
+            return
+        it = entry.item
+        if button == 0:
+            self.manager.pause(it)
+            self._schedule_session_save()
+        elif button == 1:
+            self.manager.resume(it)
+            self._schedule_session_save()
+        elif button == 2:
+            if entry.loaded:
+                self._restart_item(it)
             else:
-                b_can.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton))
-            # Algunas distribuciones pueden no tener SP_TrashIcon, así que usar un ícono alternativo si es necesario
-            try:
-                b_del.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_TrashIcon))
-            except Exception:
-                b_del.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_DialogDiscardButton))
-            b_open.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon))
-        except Exception as e:
-            logging.exception("Error setting button icons: %s", e)
-        # Establecer tooltips para cada botón
-        b_pause.setToolTip("Pausar descarga")
-        b_res.setToolTip("Reanudar descarga")
-        b_can.setToolTip("Reiniciar descarga" if loaded else "Cancelar descarga")
-        b_del.setToolTip("Eliminar descarga")
-        b_open.setToolTip("Abrir ubicación")
-        # Añadir botones al layout
-        h.addWidget(b_pause); h.addWidget(b_res); h.addWidget(b_can)
-        h.addWidget(b_del); h.addWidget(b_open)
-        self.table_dl.setCellWidget(row, 8, w)
-        # Conectar señales a acciones apropiadas
-        b_pause.clicked.connect(lambda _=False, it=item: self.manager.pause(it))
-        b_res.clicked.connect(lambda _=False, it=item: self.manager.resume(it))
-        if loaded:
-            b_can.clicked.connect(lambda _=False, it=item, btn=b_can: self._restart_item(it, btn))
-        else:
-            b_can.clicked.connect(lambda _=False, it=item: self._cancel_item(it))
-        b_del.clicked.connect(lambda _=False, it=item: self._delete_single_item(it))
-        b_open.clicked.connect(lambda _=False, it=item: self._open_item_location(it))
+                self._cancel_item(it)
+        elif button == 3:
+            self._delete_single_item(it)
+        elif button == 4:
+            self._open_item_location(it)
+
+    def _set_item_status(self, it: DownloadItem, status: str) -> None:
+        """Cambia el texto de estado de la fila de ``it``."""
+        if it.row is not None:
+            self.dl_model.update(it.row, status=status)
 
     def _bind_item_signals(self, item: DownloadItem) -> None:
         """Enlaza las señales del ``DownloadTask`` con la interfaz."""
 
         def do_bind() -> bool:
-            if item.task is None:
+            task = item.task
+            if task is None:
                 return False
-            item.task.signals.progress.connect(
+            if item._bound_task is task:
+                # Las señales de esta tarea ya están enlazadas
+                return True
+            task.signals.progress.connect(
                 lambda d, t, s, eta, st, it=item: self._update_progress(it, d, t, s, eta, st)
             )
-            item.task.signals.finished_ok.connect(
+            task.signals.finished_ok.connect(
                 lambda p, it=item: self._on_done(it, True, p)
             )
-            item.task.signals.failed.connect(
+            task.signals.failed.connect(
                 lambda m, it=item: self._on_done(it, False, m)
             )
+            item._bound_task = task
             return True
 
-        if not do_bind():
-            tmr = QTimer(self)
-            tmr.setInterval(200)
-            tmr.timeout.connect(lambda: do_bind() and tmr.stop())
-            setattr(item, "_bind_timer", tmr)
-            tmr.start()
+        if do_bind():
+            return
+        pending = item._bind_timer
+        if pending is not None and pending.isActive():
+            # Ya hay un temporizador esperando a que arranque la tarea
+            return
+        tmr = QTimer(self)
+        tmr.setInterval(200)
+        tmr.timeout.connect(lambda: do_bind() and tmr.stop())
+        item._bind_timer = tmr
+        tmr.start()
 
-    def _restart_item(self, it: DownloadItem, btn: QPushButton) -> None:
+    def _restart_item(self, it: DownloadItem) -> None:
         """Reinicia la descarga para un elemento previamente cargado."""
-        try:
-            final_path = os.path.join(it.dest_dir, it.name)
-            part_path = final_path + '.part'
-            if os.path.exists(final_path):
-                os.remove(final_path)
-            if os.path.exists(part_path):
-                os.remove(part_path)
-        except Exception:
-            pass
-        if it.row is not None and 0 <= it.row < self.table_dl.rowCount():
-            self.table_dl.item(it.row, 4).setText('En cola')
-            prog: QProgressBar = self.table_dl.cellWidget(it.row, 5)  # type: ignore
-            prog.setValue(0)
-            prog.setStyleSheet('')
-            self.table_dl.item(it.row, 6).setText('-')
-            self.table_dl.item(it.row, 7).setText('-')
-        it.extract_task = None
-        style = QApplication.style()
-        try:
-            btn.clicked.disconnect()
-        except Exception:
-            pass
-        try:
-            btn.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton))
-        except Exception:
-            pass
-        btn.setToolTip('Cancelar descarga')
-        btn.clicked.connect(lambda _=False, it=it: self._cancel_item(it))
+        for path in (it.final_path, it.part_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        if it.row is not None:
+            # El tercer botón vuelve a ser "Cancelar"
+            self.dl_model.update(
+                it.row, status='En cola', progress=0, extracting=False, speed='-', eta='-', loaded=False
+            )
+        self._forget_extraction(it)
         self.manager.add(it)
         self._bind_item_signals(it)
 
     def _update_progress(self, it: DownloadItem, done: int, total: int, speed: float, eta: float, status: str) -> None:
         """Actualiza la fila de la tabla de descargas con los valores recibidos."""
         # Comprobar que la fila sigue siendo válida
-        if it.row is None or it.row < 0 or it.row >= self.table_dl.rowCount():
+        if it.row is None:
             return
         logging.debug("Update progress: %s done=%d total=%d speed=%.2f eta=%.2f status=%s", it.name, done, total, speed, eta, status)
-        row = it.row
-        # Estado
-        self.table_dl.item(row, 4).setText(status)
-        # Progreso
-        prog: QProgressBar = self.table_dl.cellWidget(row, 5)  # type: ignore
         percent = int(min(100, max(0, round(done * 100 / total)))) if total > 0 else 0
-        prog.setValue(percent)
-        # Velocidad y ETA
-        self.table_dl.item(row, 6).setText(self._human_size(speed) + '/s' if speed > 0 else '-')
-        self.table_dl.item(row, 7).setText(self._fmt_eta(eta) if math.isfinite(eta) and eta > 0 else '-')
+        # Progreso, estado, velocidad y ETA con un único dataChanged
+        self.dl_model.update(
+            it.row,
+            progress=percent,
+            status=status,
+            speed=self._human_size(speed) + '/s' if speed > 0 else '-',
+            eta=self._fmt_eta(eta) if math.isfinite(eta) and eta > 0 else '-',
+        )
 
     def _on_done(self, it: DownloadItem, ok: bool, msg: str) -> None:
         """Marca la descarga como completada o con error."""
-        if it.row is None or it.row < 0 or it.row >= self.table_dl.rowCount():
+        if it.row is None:
             return
 
-        current_status = self.table_dl.item(it.row, 4).text()
+        current_status = self.dl_model.status(it.row)
         if not ok:
             if current_status.startswith('Integridad'):
                 logging.debug("Download finished for %s with integrity status (error reported separately): %s", it.name, current_status)
             else:
-                self.table_dl.item(it.row, 4).setText(f"Error: {msg}")
+                self._set_item_status(it, f"Error: {msg}")
                 logging.debug("Download failed for %s: %s", it.name, msg)
             return
 
@@ -2617,10 +2849,10 @@ class MainWindow(QMainWindow):
 
         if start_rom_extraction:
             logging.debug("Download finished for %s, starting archive extraction", it.name)
-            self.table_dl.item(it.row, 4).setText('Preparando extracción')
+            self._set_item_status(it, 'Preparando extracción')
             self._start_extraction(
                 it,
-                archive_path,
+                it.final_path,
                 it.dest_dir,
                 delete_archive=self.chk_delete_after.isChecked(),
                 success_status='Extraído',
@@ -2630,7 +2862,7 @@ class MainWindow(QMainWindow):
         if current_status.startswith('Integridad'):
             logging.debug("Download finished for %s with integrity status: %s", it.name, current_status)
         else:
-            self.table_dl.item(it.row, 4).setText('Completado')
+            self._set_item_status(it, 'Completado')
             logging.debug("Download finished for %s: ok=%s, msg=%s", it.name, ok, msg)
 
     def _start_extraction(
@@ -2646,36 +2878,42 @@ class MainWindow(QMainWindow):
 
         if not os.path.exists(archive_path):
             logging.warning("Archivo para extraer no encontrado: %s", archive_path)
-            if item.row is not None and 0 <= item.row < self.table_dl.rowCount():
-                self.table_dl.item(item.row, 4).setText('Error: archivo no encontrado para extraer')
+            self._set_item_status(item, 'Error: archivo no encontrado para extraer')
             return
 
-        if item.row is None or item.row < 0 or item.row >= self.table_dl.rowCount():
+        if item.row is None:
             logging.debug("Extraction requested for %s but row is invalid", item.name)
             return
 
-        prog: QProgressBar = self.table_dl.cellWidget(item.row, 5)  # type: ignore
-        prog.setRange(0, 100)
-        prog.setValue(0)
-        prog.setStyleSheet('QProgressBar::chunk { background-color: #4caf50; }')
-        self.table_dl.item(item.row, 6).setText('-')
-        self.table_dl.item(item.row, 7).setText('-')
+        self.dl_model.update(item.row, progress=0, extracting=True, speed='-', eta='-')
 
-        task = ExtractionTask(archive_path, dest_dir)
-        item.extract_task = task
+        self._forget_extraction(item)
+        job_id = self.extractor.submit(archive_path, dest_dir)
+        item.extract_job = job_id
+        self._extraction_jobs[job_id] = (item, archive_path, delete_archive, success_status)
 
-        task.signals.progress.connect(
-            lambda done, total, _speed, _eta, status, it=item: self._update_progress(it, done, total, 0.0, 0.0, status)
-        )
-        task.signals.finished_ok.connect(
-            lambda _res, it=item, arc=archive_path, delete=delete_archive, st=success_status: self._on_extraction_finished(
-                it, arc, delete, st
-            )
-        )
-        task.signals.failed.connect(
-            lambda message, it=item, arc=archive_path: self._on_extraction_failed(it, message, arc)
-        )
-        self.pool.start(task)
+    def _forget_extraction(self, item: DownloadItem) -> None:
+        """Deja de atender los avisos de la extracción en curso de ``item``."""
+        if item.extract_job is not None:
+            self._extraction_jobs.pop(item.extract_job, None)
+            item.extract_job = None
+
+    def _on_extraction_progress(self, job_id: int, done: int, total: int, status: str) -> None:
+        job = self._extraction_jobs.get(job_id)
+        if job is not None:
+            self._update_progress(job[0], done, total, 0.0, 0.0, status)
+
+    def _on_extraction_job_finished(self, job_id: int, _dest_dir: str) -> None:
+        job = self._extraction_jobs.pop(job_id, None)
+        if job is not None:
+            item, archive_path, delete_archive, success_status = job
+            self._on_extraction_finished(item, archive_path, delete_archive, success_status)
+
+    def _on_extraction_job_failed(self, job_id: int, message: str) -> None:
+        job = self._extraction_jobs.pop(job_id, None)
+        if job is not None:
+            item, archive_path, _delete, _status = job
+            self._on_extraction_failed(item, message, archive_path)
 
     def _on_extraction_finished(
         self,
@@ -2686,32 +2924,32 @@ class MainWindow(QMainWindow):
     ) -> None:
         """Actualiza la interfaz cuando la extracción finaliza correctamente."""
 
-        item.extract_task = None
-        if item.row is not None and 0 <= item.row < self.table_dl.rowCount():
-            self.table_dl.item(item.row, 4).setText(success_status)
-            prog: QProgressBar = self.table_dl.cellWidget(item.row, 5)  # type: ignore
-            prog.setStyleSheet('')
-            prog.setValue(100)
-            self.table_dl.item(item.row, 6).setText('-')
-            self.table_dl.item(item.row, 7).setText('-')
+        item.extract_job = None
+        self._set_extraction_status(item, success_status, 100)
 
-        if delete_archive and os.path.exists(archive_path):
+        if delete_archive:
             try:
                 os.remove(archive_path)
-            except Exception:
+            except FileNotFoundError:
+                pass
+            except OSError:
                 logging.exception("Error deleting archive %s", archive_path)
 
+    def _set_extraction_status(self, item: DownloadItem, status: str, value: Optional[int]) -> None:
+        """Muestra el estado final de una extracción en la fila de ``item``."""
+        if item.row is None:
+            return
+        fields = {"status": status, "extracting": False, "speed": '-', "eta": '-'}
+        if value is not None:
+            fields["progress"] = value
+        self.dl_model.update(item.row, **fields)
+
     def _on_extraction_failed(self, item: DownloadItem, message: str, archive_path: str) -> None:
         """Muestra el error en la tabla cuando la extracción falla."""
 
-        item.extract_task = None
+        item.extract_job = None
         logging.error("Extraction failed for %s: %s", item.name, message)
-        if item.row is not None and 0 <= item.row < self.table_dl.rowCount():
-            self.table_dl.item(item.row, 4).setText(f"Error extracción: {message}")
-            prog: QProgressBar = self.table_dl.cellWidget(item.row, 5)  # type: ignore
-            prog.setStyleSheet('')
-            self.table_dl.item(item.row, 6).setText('-')
-            self.table_dl.item(item.row, 7).setText('-')
+        self._set_extraction_status(item, f"Error extracción: {message}", None)
 
         if getattr(item, 'category', '') == 'emulator':
             QMessageBox.warning(
@@ -2731,8 +2969,8 @@ class MainWindow(QMainWindow):
         logging.debug("Attempting to cancel download: %s", it.name)
         if self.no_confirm_cancel:
             self.manager.cancel(it)
-            if it.row is not None and 0 <= it.row < self.table_dl.rowCount():
-                self.table_dl.item(it.row, 4).setText("Cancelado")
+            self._set_item_status(it, "Cancelado")
+            self._schedule_session_save()
             return
         # Mostrar diálogo de confirmación
         msg_box = QMessageBox(self)
@@ -2751,20 +2989,16 @@ class MainWindow(QMainWindow):
                 self.no_confirm_cancel = True
             # Cancelar la descarga
             self.manager.cancel(it)
-            if it.row is not None and 0 <= it.row < self.table_dl.rowCount():
-                self.table_dl.item(it.row, 4).setText("Cancelado")
+            self._set_item_status(it, "Cancelado")
+            self._schedule_session_save()
         # Guardar preferencia de cancelación
         self._save_config()
 
     def _open_item_location(self, it: DownloadItem) -> None:
         """Abre la carpeta que contiene el archivo descargado o en descarga."""
-        # Construir la ruta final (sin extensión parcial)
         dest_dir = it.dest_dir
-        # Intentar obtener el nombre original sin sanitizar
-        filename = safe_filename(it.name)
-        final_path = os.path.join(dest_dir, filename)
         # Si existe un archivo parcial, se abrirá la carpeta de destino igualmente
-        dir_path = os.path.dirname(final_path)
+        dir_path = os.path.dirname(it.final_path)
         if not os.path.isdir(dir_path):
             dir_path = dest_dir
         logging.debug("Opening location for %s: %s", it.name, dir_path)
@@ -2772,17 +3006,32 @@ class MainWindow(QMainWindow):
 
     def _remove_item_files(self, it: DownloadItem) -> None:
         """Elimina el archivo final y el parcial para un item de descarga."""
-        try:
-            dest_dir = os.path.expanduser(it.dest_dir)
-            filename = safe_filename(it.name)
-            final_path = os.path.join(dest_dir, filename)
-            part_path = final_path + '.part'
-            for path in (final_path, part_path):
-                if os.path.exists(path):
-                    os.remove(path)
-            logging.debug("Deleted files for %s", it.name)
-        except Exception:
-            logging.exception("Error deleting files for %s", it.name)
+        for path in (it.final_path, it.part_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                logging.exception("Error deleting file %s for %s", path, it.name)
+        logging.debug("Deleted files for %s", it.name)
+
+    def _remove_items_files_async(self, items: Sequence[DownloadItem], delay_ms: int = 0) -> None:
+        """Elimina en segundo plano los ficheros (final y parcial) de varios items.
+
+        Se lanza una única tarea en el pool para no bloquear la interfaz con
+        llamadas de borrado. ``delay_ms`` permite esperar a que las descargas
+        canceladas liberen sus ficheros.
+        """
+        paths: List[str] = []
+        for it in items:
+            paths.append(it.final_path)
+            paths.append(it.part_path)
+        if not paths:
+            return
+        if delay_ms > 0:
+            QTimer.singleShot(delay_ms, lambda: self.pool.start(UnlinkTask(paths)))
+        else:
+            self.pool.start(UnlinkTask(paths))
 
     def _delete_single_item(self, it: DownloadItem) -> None:
         """
@@ -2839,34 +3088,17 @@ class MainWindow(QMainWindow):
                 logging.exception("Error disconnecting failed signal for %s", it.name)
             # Liberar referencia a la tarea
             it.task = None
-        if it.extract_task is not None:
-            try:
-                it.extract_task.signals.progress.disconnect()
-            except Exception:
-                logging.exception("Error disconnecting extraction progress for %s", it.name)
-            try:
-                it.extract_task.signals.finished_ok.disconnect()
-            except Exception:
-                logging.exception("Error disconnecting extraction finished for %s", it.name)
-            try:
-                it.extract_task.signals.failed.disconnect()
-            except Exception:
-                logging.exception("Error disconnecting extraction failed for %s", it.name)
-            it.extract_task = None
-        # Eliminar fila de la tabla
+        # Ignorar avisos de una extracción en curso
+        self._forget_extraction(it)
+        # Eliminar fila de la tabla (el modelo ajusta la fila de los items restantes
+        # y deja ``it.row`` a None para evitar actualizaciones posteriores)
         if it.row is not None:
             row = it.row
             logging.debug("Removing table row %s for %s", row, it.name)
             try:
-                self.table_dl.removeRow(row)
+                self.dl_model.remove_row(row)
             except Exception:
                 logging.exception("Error removing row %s for %s", row, it.name)
-            # Actualizar las filas de los items restantes
-            for other in self.items:
-                if other.row is not None and other.row > row:
-                    other.row -= 1
-            # Marcar la fila del item eliminado como None para evitar actualizaciones posteriores
-            it.row = None
         # Quitar de la lista de items
         if it in self.items:
             self.items.remove(it)
@@ -2877,16 +3109,16 @@ class MainWindow(QMainWindow):
                 QTimer.singleShot(500, lambda it=it: self._remove_item_files(it))
             else:
                 self._remove_item_files(it)
-        # Guardar sesión después de eliminar
-        logging.debug("Saving session after deleting %s", it.name)
-        self._save_session_silent()
-        logging.debug("Session saved after deleting %s", it.name)
+        # Programar el guardado de la sesión después de eliminar
+        logging.debug("Scheduling session save after deleting %s", it.name)
+        self._schedule_session_save()
 
     def _delete_selected_items(self) -> None:
         """Elimina todas las filas seleccionadas en la tabla de descargas."""
         # Obtener índices de filas seleccionadas
-        selected_rows = sorted([idx.row() for idx in self.table_dl.selectionModel().selectedRows()])
-        logging.debug("Rows selected for deletion: %s", selected_rows)
+        sorted_rows = self._selected_rows_sorted()
+        selected_rows = set(sorted_rows)
+        logging.debug("Rows selected for deletion: %s", sorted_rows)
         if not selected_rows:
             logging.debug("No rows selected for deletion")
             return
@@ -2914,6 +3146,8 @@ class MainWindow(QMainWindow):
         if res != QMessageBox.StandardButton.Yes:
             logging.debug("Batch deletion canceled by user")
             return
+        files_to_remove: List[DownloadItem] = []
+        any_had_task = False
         # Eliminar cada item
         # Procesar de mayor a menor índice para evitar problemas al actualizar filas
         for it in sorted(items_to_delete, key=lambda x: x.row if x.row is not None else -1, reverse=True):
@@ -2939,48 +3173,30 @@ class MainWindow(QMainWindow):
                 except Exception:
                     logging.exception("Error disconnecting failed signal for %s", it.name)
                 it.task = None
-            if it.extract_task is not None:
-                try:
-                    it.extract_task.signals.progress.disconnect()
-                except Exception:
-                    logging.exception("Error disconnecting extraction progress for %s", it.name)
-                try:
-                    it.extract_task.signals.finished_ok.disconnect()
-                except Exception:
-                    logging.exception("Error disconnecting extraction finished for %s", it.name)
-                try:
-                    it.extract_task.signals.failed.disconnect()
-                except Exception:
-                    logging.exception("Error disconnecting extraction failed for %s", it.name)
-                it.extract_task = None
-            # Eliminar fila de la tabla y ajustar índices
+            # Ignorar avisos de una extracción en curso
+            self._forget_extraction(it)
+            # Eliminar fila de la tabla; el modelo ajusta los índices de las demás
             if it.row is not None:
                 row_index = it.row
                 logging.debug("Removing table row %s for %s", row_index, it.name)
                 try:
-                    self.table_dl.removeRow(row_index)
+                    self.dl_model.remove_row(row_index)
                 except Exception:
                     logging.exception("Error removing row %s for %s", row_index, it.name)
-                # Actualizar filas de items restantes
-                for other in self.items:
-                    if other.row is not None and other.row > row_index:
-                        other.row -= 1
-                # Marcar la fila del item eliminado como None para evitar actualizaciones posteriores
-                it.row = None
             # Quitar de la lista de items
             if it in self.items:
                 self.items.remove(it)
                 logging.debug("Removed %s from internal items list", it.name)
-            # Eliminar archivos si procede
+            # Anotar los archivos a eliminar si procede
             if chk_del_file.isChecked():
-                if had_task:
-                    QTimer.singleShot(500, lambda it=it: self._remove_item_files(it))
-                else:
-                    self._remove_item_files(it)
-        # Guardar sesión tras eliminación múltiple
-        logging.debug("Saving session after batch deletion of %d items", len(items_to_delete))
-        self._save_session_silent()
-        logging.debug("Session saved after batch deletion")
+                files_to_remove.append(it)
+                any_had_task = any_had_task or had_task
+        # Eliminar todos los archivos en una única tarea en segundo plano
+        if files_to_remove:
+            self._remove_items_files_async(files_to_remove, delay_ms=500 if any_had_task else 0)
+        # Programar el guardado de la sesión tras eliminación múltiple
+        logging.debug("Scheduling session save after batch deletion of %d items", len(items_to_delete))
+        self._schedule_session_save()
 
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # type: ignore[override]
         """
@@ -2988,23 +3204,26 @@ class MainWindow(QMainWindow):
 
         - En modo consola, muestra teclado virtual al enfocar entradas.
         - En la tabla de descargas, maneja Suprimir para borrar filas.
+
+        Está instalado en la aplicación y recibe todos sus eventos, así que
+        cualquier tipo que no sea foco o tecla pulsada se descarta sin más.
         """
+        ev_type = event.type()
+        if ev_type not in self._EV_FILTERED:
+            return False
         try:
-            if (
-                self.console_mode_enabled
-                and event.type() == QEvent.Type.FocusIn
-                and isinstance(obj, (QLineEdit, QComboBox))
+            if ev_type == self._EV_FOCUSIN:
+                if self.console_mode_enabled and isinstance(obj, (QLineEdit, QComboBox)):
+                    self._show_virtual_keyboard()
+            elif (
+                obj is not None
+                and obj is getattr(self, "table_dl", None)
+                and event.key() == self._KEY_DELETE
             ):
-                self._show_virtual_keyboard()
-
-            table_dl = getattr(self, "table_dl", None)
-            if table_dl is not None and obj is table_dl and event.type() == QEvent.Type.KeyPress:
-                from PyQt6.QtGui import QKeyEvent
-                key_event = event  # type: QKeyEvent
-                if key_event.key() == Qt.Key.Key_Delete:
-                    logging.debug("Delete key pressed on downloads table.")
-                    self._delete_selected_items()
-                    return True
+                logging.debug("Delete key pressed on downloads table.")
+                self._delete_selected_items()
+                return True
+
         except Exception:
             logging.exception("eventFilter failed")
             return False
@@ -3024,36 +3243,60 @@ class MainWindow(QMainWindow):
             # Si no hay filas seleccionadas o la fila bajo el cursor no está seleccionada,
             # seleccionar esa fila antes de mostrar el menú
             selected = self.table_dl.selectionModel().selectedRows()
-            if not selected or (index.isValid() and index.row() not in [r.row() for r in selected]):
+            if not selected or (index.isValid() and not self.table_dl.selectionModel().isRowSelected(index.row())):
                 if index.isValid():
                     self.table_dl.selectRow(index.row())
                     selected = [index]
             if not selected:
                 return
-            # Crear menú y acciones con iconos
-            menu = QMenu(self)
-            # Iconos estándar para las acciones
-            style = self.style()
-            act_pause = menu.addAction(style.standardIcon(QStyle.StandardPixmap.SP_MediaPause), "Pausar")
-            act_resume = menu.addAction(style.standardIcon(QStyle.StandardPixmap.SP_MediaPlay), "Reanudar")
-            act_cancel = menu.addAction(style.standardIcon(QStyle.StandardPixmap.SP_BrowserStop), "Cancelar")
-            act_delete = menu.addAction(style.standardIcon(QStyle.StandardPixmap.SP_TrashIcon), "Eliminar")
-            act_open = menu.addAction(style.standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon), "Abrir ubicación")
-            # Conectar señales
-            act_pause.triggered.connect(self._pause_selected_downloads)
-            act_resume.triggered.connect(self._resume_selected_downloads)
-            act_cancel.triggered.connect(self._cancel_selected_downloads)
-            act_delete.triggered.connect(self._delete_selected_items)
-            act_open.triggered.connect(self._open_selected_locations)
-            # Mostrar el menú
+            # Mostrar el menú (se construye una sola vez)
             global_pos = self.table_dl.viewport().mapToGlobal(pos)
-            menu.exec(global_pos)
+            self._downloads_context_menu().exec(global_pos)
         except Exception:
             logging.exception("Error showing context menu")
 
+    def _downloads_context_menu(self) -> QMenu:
+        """Devuelve el menú contextual de descargas, creándolo la primera vez."""
+        menu = self._dl_context_menu
+        if menu is not None:
+            return menu
+        menu = QMenu(self)
+        # Iconos estándar para las acciones
+        style = self.style()
+        entries = (
+            ("pause", QStyle.StandardPixmap.SP_MediaPause, "Pausar", self._pause_selected_downloads),
+            ("resume", QStyle.StandardPixmap.SP_MediaPlay, "Reanudar", self._resume_selected_downloads),
+            ("cancel", QStyle.StandardPixmap.SP_BrowserStop, "Cancelar", self._cancel_selected_downloads),
+            ("delete", QStyle.StandardPixmap.SP_TrashIcon, "Eliminar", self._delete_selected_items),
+            ("open", QStyle.StandardPixmap.SP_DirOpenIcon, "Abrir ubicación", self._open_selected_locations),
+        )
+        for key, pixmap, text, slot in entries:
+            action = menu.addAction(style.standardIcon(pixmap), text)
+            action.triggered.connect(slot)
+            self._dl_context_actions[key] = action
+        self._dl_context_menu = menu
+        return menu
+
+    def _selected_rows_sorted(self) -> List[int]:
+        """Devuelve las filas seleccionadas de la tabla de descargas en orden ascendente.
+
+        Se recorren los rangos de la selección en lugar de los índices
+        individuales: seleccionar miles de filas (Ctrl+A) suele producir uno o
+        pocos rangos contiguos, que se expanden con ``range`` sin crear un
+        ``QModelIndex`` por fila.
+        """
+        ranges = self.table_dl.selectionModel().selection()
+        if len(ranges) == 1:
+            sel = ranges[0]
+            return list(range(sel.top(), sel.bottom() + 1))
+        rows: set[int] = set()
+        for sel in ranges:
+            rows.update(range(sel.top(), sel.bottom() + 1))
+        return sorted(rows)
+
     def _get_selected_download_items(self) -> List[DownloadItem]:
         """Devuelve una lista de DownloadItem para las filas actualmente seleccionadas."""
-        selected_rows = [idx.row() for idx in self.table_dl.selectionModel().selectedRows()]
+        selected_rows = set(self._selected_rows_sorted())
         items = []
         for it in list(self.items):
             if it.row in selected_rows:
@@ -3067,8 +3310,9 @@ class MainWindow(QMainWindow):
             for it in items:
                 self.manager.pause(it)
                 # Actualizar estado
-                if it.row is not None and 0 <= it.row < self.table_dl.rowCount():
-                    self.table_dl.item(it.row, 4).setText("Pausado")
+                self._set_item_status(it, "Pausado")
+            if items:
+                self._schedule_session_save()
             logging.debug("Paused %d downloads", len(items))
         except Exception:
             logging.exception("Error pausing selected downloads")
@@ -3080,8 +3324,9 @@ class MainWindow(QMainWindow):
             for it in items:
                 self.manager.resume(it)
                 # Actualizar estado
-                if it.row is not None and 0 <= it.row < self.table_dl.rowCount():
-                    self.table_dl.item(it.row, 4).setText("Descargando")
+                self._set_item_status(it, "Descargando")
+            if items:
+                self._schedule_session_save()
             logging.debug("Resumed %d downloads", len(items))
         except Exception:
             logging.exception("Error resuming selected downloads")
@@ -3100,8 +3345,8 @@ class MainWindow(QMainWindow):
             if self.no_confirm_cancel:
                 for it in items:
                     self.manager.cancel(it)
-                    if it.row is not None and 0 <= it.row < self.table_dl.rowCount():
-                        self.table_dl.item(it.row, 4).setText("Cancelado")
+                    self._set_item_status(it, "Cancelado")
+                self._schedule_session_save()
                 logging.debug("Cancelled %d downloads without confirmation", len(items))
                 return
             # Mostrar diálogo de confirmación para múltiples descargas
@@ -3122,8 +3367,8 @@ class MainWindow(QMainWindow):
                     self.no_confirm_cancel = True
                 for it in items:
                     self.manager.cancel(it)
-                    if it.row is not None and 0 <= it.row < self.table_dl.rowCount():
-                        self.table_dl.item(it.row, 4).setText("Cancelado")
+                    self._set_item_status(it, "Cancelado")
+                self._schedule_session_save()
                 # Guardar preferencia
                 self._save_config()
             else:
@@ -3141,13 +3386,20 @@ class MainWindow(QMainWindow):
         except Exception:
             logging.exception("Error opening locations for selected downloads")
 
-    def _refresh_downloads_table(self) -> None:
-        """Este slot se puede usar para actualizar contadores globales si fuera necesario."""
-        pass
+    def _schedule_downloads_refresh(self) -> None:
+        """Programa un único refresco para todos los avisos de la cola que lleguen seguidos."""
+        if not self._queue_refresh_timer.isActive():
+            self._queue_refresh_timer.start()
+
+    def _do_refresh_downloads(self) -> None:
+        # Las filas no necesitan refrescarse aquí: cada cambio de una descarga
+        # emite su propio ``dataChanged`` desde ``self.dl_model``.
+        # Seguir descargas en segundo plano
+        self._check_background_downloads()
 
     def _check_background_downloads(self) -> None:
         """Cierra la aplicación cuando las descargas en segundo plano finalizan."""
-        if self.background_downloads and not self.manager._active and not self.manager._queue:
+        if self.background_downloads and not self.manager.has_pending:
             try:
                 self._save_session_silent()
                 self._save_config()
@@ -3159,34 +3411,97 @@ class MainWindow(QMainWindow):
 
     # --- Persistencia de sesión (Ajustes de descarga) ---
     def _session_path(self) -> str:
-        """Devuelve la ruta del fichero de sesión dentro de ``sessions``."""
+        """Devuelve la ruta del fichero de sesión dentro de ``sessions``.
+
+        La ruta (y la creación de su carpeta) se reutiliza mientras no cambien
+        ``session_file`` ni, en su defecto, la carpeta de descargas.
+        """
 
+        key = (self.session_file, "" if self.session_file else self._cached_dest_dir)
+        cached = self._session_path_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         if self.session_file:
             path = Path(self.session_file)
         else:
-            path = self._session_storage_path(self.le_dir.text().strip() or None)
+            path = self._session_storage_path(key[1] or None)
         path.parent.mkdir(parents=True, exist_ok=True)
+        self._session_path_cache = (key, str(path))
         return str(path)
 
+    def _session_payload(self) -> Dict[str, object]:
+        """Serializa la cola de descargas en formato columnar.
+
+        En lugar de repetir las claves en cada elemento se guarda la lista de
+        columnas una vez y cada descarga como una fila. Los metadatos, que solo
+        tienen algunos elementos, se guardan aparte indexados por fila.
+        """
+        rows = []
+        metadata_by_row: Dict[str, dict] = {}
+        for idx, it in enumerate(self.items):
+            entry = SessionEntry.from_item(it)
+            rows.append(entry.to_row())
+            if entry.metadata is not None:
+                metadata_by_row[str(idx)] = entry.metadata
+        return {"columns": list(SessionEntry.COLUMNS), "rows": rows, "metadata": metadata_by_row}
+
+    @staticmethod
+    def _session_entries(data: object, default_dest: str = "") -> List[SessionEntry]:
+        """Devuelve las entradas válidas de una sesión.
+
+        Acepta el formato columnar actual y el antiguo (lista de diccionarios).
+        """
+        if isinstance(data, list):
+            mappings = [d for d in data if isinstance(d, dict)]
+        elif isinstance(data, dict) and "columns" in data:
+            columns = data.get("columns") or []
+            metadata_by_row = data.get("metadata") or {}
+            mappings = []
+            for idx, row in enumerate(data.get("rows") or []):
+                mapping = dict(zip(columns, row))
+                mapping["metadata"] = metadata_by_row.get(str(idx))
+                mappings.append(mapping)
+        else:
+            return []
+        entries: List[SessionEntry] = []
+        for mapping in mappings:
+            entry = SessionEntry.from_mapping(mapping, default_dest)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    def _restore_session(self, data: object, bind_signals: bool) -> None:
+        """Añade a la cola las descargas de una sesión leída de disco."""
+        # Conjunto de nombres ya presentes para detectar duplicados en O(1)
+        existing_names = {x.name for x in self.items}
+        for entry in self._session_entries(data, self._cached_dest_dir):
+            # Evitar duplicados
+            if entry.name in existing_names:
+                continue
+            existing_names.add(entry.name)
+            it = entry.to_item()
+            row_info = entry.row_info()
+            if os.path.exists(it.final_path):
+                self._add_download_row(it, row_info, loaded=True)  # type: ignore[arg-type]
+                self.items.append(it)
+                if it.row is not None:
+                    self.dl_model.update(it.row, status='Completado', progress=100)
+            elif os.path.exists(it.part_path):
+                self._add_download_row(it, row_info, loaded=False)  # type: ignore[arg-type]
+                self.items.append(it)
+                self.manager.add(it)
+                if bind_signals:
+                    self._bind_item_signals(it)
+            else:
+                self._add_download_row(it, row_info, loaded=True)  # type: ignore[arg-type]
+                self.items.append(it)
+                if it.row is not None:
+                    self._set_item_status(it, 'Error: fichero no encontrado')
+
     def _save_session(self) -> None:
         """Guarda la sesión actual de descargas a disco."""
-        data = []
-        for it in self.items:
-            entry = {
-                "name": it.name,
-                "url": it.url,
-                "dest": it.dest_dir,
-                "hash": it.expected_hash,
-                "system": getattr(it, 'system_name', ''),
-                "category": getattr(it, 'category', ''),
-            }
-            metadata = getattr(it, 'metadata', None)
-            if isinstance(metadata, dict):
-                entry["metadata"] = metadata
-            data.append(entry)
         try:
-            with open(self._session_path(), 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self._write_session_file()
             QMessageBox.information(self, 'Sesión', 'Sesión guardada')
         except Exception as e:
             QMessageBox.critical(self, 'Sesión', str(e))
@@ -3198,199 +3513,143 @@ class MainWindow(QMainWindow):
             if not os.path.exists(path):
                 QMessageBox.information(self, 'Sesión', 'No hay sesión para cargar')
                 return
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            for d in data:
-                name = d.get('name'); url = d.get('url'); dest_dir = d.get('dest') or self.le_dir.text().strip()
-                expected_hash = d.get('hash')
-                system = d.get('system', '')
-                category = d.get('category', '')
-                metadata = d.get('metadata') if isinstance(d.get('metadata'), dict) else None
-                if not (name and url and dest_dir):
-                    continue
-                it = DownloadItem(
-                    name=name,
-                    url=url,
-                    dest_dir=dest_dir,
-                    expected_hash=expected_hash,
-                    system_name=system,
-                    category=category,
-                    metadata=metadata,
-                )
-                # Evitar duplicados
-                if any(x.name == name for x in self.items):
-                    continue
-                final_path = os.path.join(dest_dir, it.name)
-                part_path = final_path + '.part'
-                dummy_row = {
-                    'system_name': system,
-                    'fmt': '',
-                    'size': '',
-                }
-                if category == 'emulator':
-                    dummy_row['fmt'] = 'Emulador'
-                    if metadata:
-                        dummy_row['display_name'] = metadata.get('emulator_name', name)
-                elif category == 'emulator-extra':
-                    folder_name = metadata.get('folder_name', 'Archivos extras') if metadata else 'Archivos extras'
-                    dummy_row['fmt'] = folder_name
-                    if metadata:
-                        extra_label = metadata.get('extra_label', name)
-                        emulator_name = metadata.get('emulator_name', '')
-                        dummy_row['display_name'] = f"{emulator_name} — {extra_label}".strip(" —")
-                if os.path.exists(final_path):
-                    self._add_download_row(it, dummy_row, loaded=True)  # type: ignore[arg-type]
-                    self.items.append(it)
-                    if it.row is not None:
-                        self.table_dl.item(it.row, 4).setText('Completado')
-                        prog: QProgressBar = self.table_dl.cellWidget(it.row, 5)  # type: ignore
-                        prog.setValue(100)
-                elif os.path.exists(part_path):
-                    self._add_download_row(it, dummy_row, loaded=False)  # type: ignore[arg-type]
-                    self.items.append(it)
-                    self.manager.add(it)
-                    self._bind_item_signals(it)
-                    self._bind_item_signals(it)
-                else:
-                    self._add_download_row(it, dummy_row, loaded=True)  # type: ignore[arg-type]
-                    self.items.append(it)
-                    if it.row is not None:
-                        self.table_dl.item(it.row, 4).setText('Error: fichero no encontrado')
-                        prog: QProgressBar = self.table_dl.cellWidget(it.row, 5)  # type: ignore
-                        prog.setValue(0)
+            data = json_read(path)
+            self._restore_session(data, bind_signals=True)
             QMessageBox.information(self, 'Sesión', 'Sesión cargada')
         except Exception as e:
             QMessageBox.critical(self, 'Sesión', str(e))
 
     # --- Carga/salva de sesión silenciosa (sin mensajes) ---
+    def _schedule_session_save(self, delay_ms: int = 500) -> None:
+        """Marca la sesión como modificada y programa un único guardado diferido.
+
+        Las llamadas que lleguen mientras hay un guardado pendiente se agrupan
+        en la misma escritura.
+        """
+        if self._session_save_pending:
+            return
+        self._session_save_pending = True
+        QTimer.singleShot(delay_ms, self._flush_session_if_dirty)
+
+    def _flush_session_if_dirty(self) -> None:
+        """Escribe la sesión si hay cambios pendientes de guardar."""
+        if not self._session_save_pending:
+            return
+        self._session_save_pending = False
+        self._save_session_silent()
+
     def _save_session_silent(self) -> None:
         """Guarda la sesión actual de descargas en el fichero sin mostrar diálogos."""
         try:
-            data = []
-            for it in self.items:
-                entry = {
-                    "name": it.name,
-                    "url": it.url,
-                    "dest": it.dest_dir,
-                    "hash": it.expected_hash,
-                    "system": getattr(it, 'system_name', ''),
-                    "category": getattr(it, 'category', ''),
-                }
-                metadata = getattr(it, 'metadata', None)
-                if isinstance(metadata, dict):
-                    entry["metadata"] = metadata
-                data.append(entry)
-            with open(self._session_path(), 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self._write_session_file()
         except Exception:
             pass
 
+    def _write_session_file(self) -> None:
+        """Serializa la sesión y la escribe solo si ha cambiado desde el último guardado."""
+        writer = self._session_writer()
+        if writer is not None:
+            writer()
+
+    def _session_writer(self) -> Optional[Callable[[], None]]:
+        """
+        Serializa la sesión en el hilo de la interfaz y devuelve la función
+        que la escribe en disco, o ``None`` si no ha cambiado.
+        """
+        path = self._session_path()
+        serialized = json_dumps(self._session_payload())
+        digest = hash(serialized)
+        if self._last_session_hash == (path, digest) and os.path.exists(path):
+            return None
+
+        def write() -> None:
+            write_bytes_atomic(path, serialized)
+            self._last_session_hash = (path, digest)
+
+        return write
+
     def _load_session_silent(self) -> None:
-        """Carga la sesión guardada sin mostrar mensajes (si existe)."""
+        """
+        Carga la sesión guardada sin mostrar mensajes (si existe).
+
+        El fichero se lee y decodifica en el ``QThreadPool``; la cola se
+        restaura después en el hilo de la interfaz con ``_apply_session_state``.
+        """
+        task = _LoadSessionTask(self._session_path())
+        task.signals.loaded.connect(self._apply_session_state)
+        # Mantener vivo el emisor hasta que llegue la señal
+        self._session_load_signals = task.signals
+        self.pool.start(task)
+
+    def _apply_session_state(self, data: object) -> None:
+        """Restaura la cola de descargas con los datos leídos en segundo plano."""
+        self._session_load_signals = None
         try:
-            path = self._session_path()
-            if not os.path.exists(path):
-                return
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            for d in data:
-                name = d.get('name'); url = d.get('url'); dest_dir = d.get('dest') or self.le_dir.text().strip()
-                expected_hash = d.get('hash')
-                system = d.get('system', '')
-                category = d.get('category', '')
-                metadata = d.get('metadata') if isinstance(d.get('metadata'), dict) else None
-                if not (name and url and dest_dir):
-                    continue
-                it = DownloadItem(
-                    name=name,
-                    url=url,
-                    dest_dir=dest_dir,
-                    expected_hash=expected_hash,
-                    system_name=system,
-                    category=category,
-                    metadata=metadata,
-                )
-                # Evitar duplicados
-                if any(x.name == name for x in self.items):
-                    continue
-                final_path = os.path.join(dest_dir, it.name)
-                part_path = final_path + '.part'
-                dummy_row = {
-                    'system_name': system,
-                    'fmt': '',
-                    'size': '',
-                }
-                if category == 'emulator':
-                    dummy_row['fmt'] = 'Emulador'
-                    if metadata:
-                        dummy_row['display_name'] = metadata.get('emulator_name', name)
-                elif category == 'emulator-extra':
-                    folder_name = metadata.get('folder_name', 'Archivos extras') if metadata else 'Archivos extras'
-                    dummy_row['fmt'] = folder_name
-                    if metadata:
-                        extra_label = metadata.get('extra_label', name)
-                        emulator_name = metadata.get('emulator_name', '')
-                        dummy_row['display_name'] = f"{emulator_name} — {extra_label}".strip(" —")
-                if os.path.exists(final_path):
-                    self._add_download_row(it, dummy_row, loaded=True)  # type: ignore[arg-type]
-                    self.items.append(it)
-                    if it.row is not None:
-                        self.table_dl.item(it.row, 4).setText('Completado')
-                        prog: QProgressBar = self.table_dl.cellWidget(it.row, 5)  # type: ignore
-                        prog.setValue(100)
-                elif os.path.exists(part_path):
-                    self._add_download_row(it, dummy_row, loaded=False)  # type: ignore[arg-type]
-                    self.items.append(it)
-                    self.manager.add(it)
-                else:
-                    self._add_download_row(it, dummy_row, loaded=True)  # type: ignore[arg-type]
-                    self.items.append(it)
-                    if it.row is not None:
-                        self.table_dl.item(it.row, 4).setText('Error: fichero no encontrado')
-                        prog: QProgressBar = self.table_dl.cellWidget(it.row, 5)  # type: ignore
-                        prog.setValue(0)
+            self._restore_session(data, bind_signals=False)
         except Exception:
-            pass
+            logging.exception("Failed to restore session")
 
     # --- Guardar/cargar configuración y cesta ---
     def _save_config(self) -> None:
         """Guarda la configuración de la aplicación en ``config/settings.json``."""
 
         try:
-            basket_data = []
-            for rom_id, item in self.basket_items.items():
-                basket_data.append({
-                    'rom_id': rom_id,
-                    'selected_server': item.get('selected_server', 0),
-                    'selected_format': item.get('selected_format', 0),
-                    'selected_lang': item.get('selected_lang', 0),
-                })
-
-            payload = {
-                'db_path': self.le_db.text().strip(),
-                'download_dir': self.le_dir.text().strip(),
-                'concurrency': self.spin_conc.value(),
-                'chk_extract_after': self.chk_extract_after.isChecked(),
-                'chk_delete_after': self.chk_delete_after.isChecked(),
-                'chk_create_sys_dirs': self.chk_create_sys_dirs.isChecked(),
-                'emulator_dir': self.le_emulator_dir.text().strip(),
-                'emulator_delete_archive': self.chk_emulator_delete.isChecked(),
-                'retrobat_root': self._retrobat_root,
-                'retrobat_exe': self._retrobat_exe,
-                'download_target': self.cmb_download_target.currentData() if hasattr(self, 'cmb_download_target') else 'windows',
-                'basket_items': basket_data,
-                'no_confirm_cancel': self.no_confirm_cancel,
-                'hide_server_warning': self.hide_server_warning,
-                'session_file': self.session_file,
-                'console_mode_enabled': self.console_mode_enabled,
+            writer = self._config_writer()
+            if writer is not None:
+                writer()
+        except Exception:
+            logging.exception('Failed to save configuration', exc_info=True)
+
+    def _config_writer(self) -> Optional[Callable[[], None]]:
+        """
+        Lee la configuración de los widgets (debe hacerse en el hilo de la
+        interfaz) y devuelve la función que la escribe en disco, o ``None``
+        si no ha cambiado desde el último guardado.
+        """
+        # La cesta se guarda dentro del mismo documento y en la misma escritura
+        # atómica que el resto de la configuración
+        basket_data = [
+            {
+                'rom_id': rom_id,
+                'selected_server': item.selected_server,
+                'selected_format': item.selected_format,
+                'selected_lang': item.selected_lang,
             }
+            for rom_id, item in self.basket_items.items()
+        ]
+
+        payload = {
+            'db_path': self.le_db.text().strip(),
+            'download_dir': self._cached_dest_dir,
+            'concurrency': self.spin_conc.value(),
+            'chk_extract_after': self.chk_extract_after.isChecked(),
+            'chk_delete_after': self.chk_delete_after.isChecked(),
+            'chk_create_sys_dirs': self.chk_create_sys_dirs.isChecked(),
+            'emulator_dir': self._emulator_dir,
+            'emulator_delete_archive': self._emulator_delete_archive,
+            'retrobat_root': self._retrobat_root,
+            'retrobat_exe': self._retrobat_exe,
+            'download_target': self.cmb_download_target.currentData() if hasattr(self, 'cmb_download_target') else 'windows',
+            'basket_items': basket_data,
+            'no_confirm_cancel': self.no_confirm_cancel,
+            'hide_server_warning': self.hide_server_warning,
+            'session_file': self.session_file,
+            'console_mode_enabled': self.console_mode_enabled,
+        }
 
-            path = self._config_file_path()
+        path = self._config_file_path()
+        serialized = json_dumps(payload)
+        digest = hash(serialized)
+        if digest == self._last_config_hash and path.exists():
+            # Nada ha cambiado desde el último guardado
+            return None
+
+        def write() -> None:
             path.parent.mkdir(parents=True, exist_ok=True)
-            with path.open('w', encoding='utf-8') as fh:
-                json.dump(payload, fh, ensure_ascii=False, indent=2)
-        except Exception:
-            logging.exception('Failed to save configuration', exc_info=True)
+            write_bytes_atomic(path, serialized)
+            self._last_config_hash = digest
+
+        return write
 
     def _load_config(self) -> None:
         """Carga la configuración desde ``config/settings.json``."""
@@ -3399,8 +3658,7 @@ class MainWindow(QMainWindow):
             data: dict = {}
             path = self._config_file_path()
             if path.exists():
-                with path.open('r', encoding='utf-8') as fh:
-                    data = json.load(fh)
+                data = json_read(path)
 
             db_path = str(data.get('db_path', '') or '')
             download_dir = str(data.get('download_dir', '') or '')
@@ -3422,8 +3680,11 @@ class MainWindow(QMainWindow):
             self.chk_delete_after.setChecked(chk_del)
             self.chk_delete_after.setEnabled(chk_extract)
             self.chk_create_sys_dirs.setChecked(chk_sys)
-            self.le_emulator_dir.setText(emulator_dir)
-            self.chk_emulator_delete.setChecked(emulator_delete)
+            self._emulator_dir = emulator_dir
+            self._emulator_delete_archive = emulator_delete
+            if hasattr(self, 'le_emulator_dir'):
+                self.le_emulator_dir.setText(emulator_dir)
+                self.chk_emulator_delete.setChecked(emulator_delete)
             self._retrobat_root = retrobat_root
             self._retrobat_exe = retrobat_exe
             if hasattr(self, 'le_retrobat_root'):
@@ -3450,7 +3711,7 @@ class MainWindow(QMainWindow):
             if isinstance(basket_data, str):
                 self._saved_basket_json = basket_data
             elif isinstance(basket_data, list):
-                self._saved_basket_json = json.dumps(basket_data)
+                self._saved_basket_json = json_dumps(basket_data)
             else:
                 self._saved_basket_json = ''
 
@@ -3469,17 +3730,18 @@ class MainWindow(QMainWindow):
         try:
             if not self._saved_basket_json:
                 return
-            data = json.loads(self._saved_basket_json)
+            data = json_loads(self._saved_basket_json)
             # data es una lista de dicts con rom_id, selected_format, selected_lang
+            entries: List[tuple[int, dict]] = []
             for d in data:
-                rom_id = d.get('rom_id')
-                if rom_id is None:
-                    continue
                 try:
-                    rom_id_int = int(rom_id)
-                    links = self.db.get_links_by_rom(rom_id_int)
-                except Exception:
+                    entries.append((int(d.get('rom_id')), d))
+                except (TypeError, ValueError):
                     continue
+            # Una consulta por lote en lugar de una por ROM de la cesta
+            links_by_rom = self._fetch_links_by_rom([rom_id for rom_id, _ in entries])
+            for rom_id_int, d in entries:
+                links = links_by_rom.get(rom_id_int)
                 if not links:
                     continue
                 # Construir estructura de grupo similar a la búsqueda
@@ -3487,35 +3749,9 @@ class MainWindow(QMainWindow):
                 group = {
                     'name': links[0]['rom_name'],
                     'rows': group_rows,
-                    'system_name': links[0].get('system_name', '')
+                    'system_name': links[0]['system_name'] or '',
                 }
-                # Servidores únicos
-                servers = sorted(set((row['server'] or '') for row in group_rows))
-                formats_by_server: dict[str, List[str]] = {}
-                for srv in servers:
-                    fmts = sorted(set((row['fmt'] or '') for row in group_rows if (row['server'] or '') == srv))
-                    formats_by_server[srv] = fmts
-                langs_by_server_format: dict[tuple[str, str], List[str]] = {}
-                for r in group_rows:
-                    srv = r['server'] or ''
-                    fmt_val = r['fmt'] or ''
-                    key = (srv, fmt_val)
-                    lang_str = r['langs'] or ''
-                    lang_str = ','.join([x.strip() for x in lang_str.split(',') if x.strip()]) or ''
-                    lst = langs_by_server_format.setdefault(key, [])
-                    if lang_str not in lst:
-                        lst.append(lang_str)
-                for key in langs_by_server_format:
-                    lst = langs_by_server_format[key]
-                    lst.sort()
-                    langs_by_server_format[key] = lst
-                link_lookup: dict[tuple[str, str, str], sqlite3.Row] = {}
-                for r in group_rows:
-                    srv = r['server'] or ''
-                    fmt_val = r['fmt'] or ''
-                    lang_str = r['langs'] or ''
-                    lang_str = ','.join([x.strip() for x in lang_str.split(',') if x.strip()]) or ''
-                    link_lookup[(srv, fmt_val, lang_str)] = r
+                servers, formats_by_server, langs_by_server_format, link_lookup = _group_choices(group_rows)
                 group['servers'] = servers
                 group['formats_by_server'] = formats_by_server
                 group['langs_by_server_format'] = langs_by_server_format
@@ -3539,14 +3775,8 @@ class MainWindow(QMainWindow):
                 if sel_lang is None or sel_lang >= len(lang_list) or sel_lang < 0:
                     sel_lang = 0
                 # Guardar item en cesta
-                self.basket_items[rom_id] = {
-                    'name': group['name'],
-                    'group': group,
-                    'selected_server': sel_srv,
-                    'selected_format': sel_fmt,
-                    'selected_lang': sel_lang,
-                }
-            self._refresh_basket_table()
+                self.basket_items[rom_id_int] = BasketRow(group['name'], group, sel_srv, sel_fmt, sel_lang)
+            self._schedule_basket_refresh()
         except Exception:
             pass
 
@@ -3554,231 +3784,120 @@ class MainWindow(QMainWindow):
     def _build_basket_tab(self) -> None:
         """Crea la interfaz de la pestaña de cesta de descargas."""
         lay = QVBoxLayout(self.tab_basket)
-        self.table_basket = QTableWidget(0, 4)
-        self.table_basket.setHorizontalHeaderLabels(["ROM", "Formato", "Idioma", "Acciones"])
-        self.table_basket.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table_basket = self._create_basket_view()
         lay.addWidget(self.table_basket)
 
+    def _create_basket_view(self) -> QTableView:
+        """Crea una vista sobre ``self.basket_model`` con los botones Añadir y Eliminar."""
+        return self._create_choice_view(
+            self.basket_model,
+            [("Añadir", self._basket_add_to_downloads), ("Eliminar", self._basket_remove_item)],
+        )
+
+    def _create_choice_view(
+        self, model: GroupChoiceModel, actions: Sequence[tuple[str, Callable[[int], None]]]
+    ) -> QTableView:
+        """
+        Crea una vista para un modelo de ROMs agrupadas.
+
+        Los combos de servidor, formato e idioma los crea el delegado solo
+        para la celda que se está editando y los botones de acción se pintan,
+        por lo que el número de widgets no depende del número de filas.
+        ``actions`` son pares ``(texto, manejador)``; el manejador recibe el
+        ``rom_id`` de la fila pulsada.
+        """
+        view = QTableView()
+        view.setModel(model)
+        view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        view.setEditTriggers(
+            QAbstractItemView.EditTrigger.CurrentChanged
+            | QAbstractItemView.EditTrigger.SelectedClicked
+            | QAbstractItemView.EditTrigger.DoubleClicked
+        )
+        view.verticalHeader().setVisible(False)
+        self._set_column_widths(view, self._CHOICE_COLUMN_WIDTHS)
+        combo_delegate = ComboDelegate(GroupChoiceModel.OptionsRole, view)
+        for col in (GroupChoiceModel.COL_SERVER, GroupChoiceModel.COL_FORMAT, GroupChoiceModel.COL_LANG):
+            view.setItemDelegateForColumn(col, combo_delegate)
+        handlers = tuple(handler for _label, handler in actions)
+        self._choice_actions[id(model)] = handlers
+        buttons = ButtonsDelegate([label for label, _handler in actions], view)
+        buttons.clicked.connect(functools.partial(self._dispatch_choice_action, model, handlers))
+        view.setItemDelegateForColumn(GroupChoiceModel.COL_ACTIONS, buttons)
+        return view
+
+    @staticmethod
+    def _set_column_widths(view: QTableView, widths: Sequence[int]) -> None:
+        """
+        Da a ``view`` columnas redimensionables con los anchos iniciales
+        ``widths``; la última ocupa el espacio sobrante.
+
+        A diferencia de ``Stretch``, no reparte el ancho de todas las columnas
+        cada vez que se insertan filas o cambia el tamaño de la vista.
+        """
+        header = view.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for col, width in enumerate(widths):
+            view.setColumnWidth(col, width)
+        header.setStretchLastSection(True)
+
+    @staticmethod
+    def _dispatch_choice_action(
+        model: GroupChoiceModel, handlers: tuple[Callable[[int], None], ...], row: int, button: int
+    ) -> None:
+        """Llama al manejador del botón pulsado con el ``rom_id`` de la fila."""
+        rom_id = model.rom_id_at(row)
+        if rom_id is not None and 0 <= button < len(handlers):
+            handlers[button](rom_id)
+
     def _refresh_basket_table(self) -> None:
         """
-        Actualiza la tabla de la cesta para reflejar las ROMs agrupadas y sus
-        opciones. Cada entrada dispone de combinaciones de servidor, formato e
-        idioma para seleccionar la variante que se descargará.
+        Actualiza las tablas de la cesta para reflejar las ROMs agrupadas y
+        sus opciones. Las vistas comparten ``self.basket_model`` y solo pintan
+        las filas visibles.
         """
-        tables: List[QTableWidget] = [self.table_basket]
-        if hasattr(self, "table_basket_arcades"):
-            tables.append(self.table_basket_arcades)
-        for table in tables:
-            table.setRowCount(0)
-        # Cada entrada en basket_items crea una fila
-        for rom_id, item in self.basket_items.items():
-            for table in tables:
-                row = table.rowCount()
-                table.insertRow(row)
-                # Columna 0: nombre de la ROM (guardar rom_id en UserRole)
-                rom_item = QTableWidgetItem(item['name'])
-                rom_item.setData(Qt.ItemDataRole.UserRole, rom_id)
-                table.setItem(row, 0, rom_item)
-                # Columna 1: sistema
-                sys_item = QTableWidgetItem(item['group'].get('system_name', '') or '')
-                table.setItem(row, 1, sys_item)
-                # Columna 2: selector de servidor
-                combo_srv = QComboBox()
-                for srv in item['group']['servers']:
-                    combo_srv.addItem(srv or "")
-                srv_idx = item.get('selected_server', 0)
-                if srv_idx is not None and srv_idx < combo_srv.count():
-                    combo_srv.setCurrentIndex(srv_idx)
-                combo_srv.setProperty('row_idx', row)
-                combo_srv.setProperty('rom_id', rom_id)
-                combo_srv.currentIndexChanged.connect(self._basket_server_changed)
-                table.setCellWidget(row, 2, combo_srv)
-                # Columna 3: selector de formato (depende del servidor)
-                combo_fmt = QComboBox()
-                srv_name = item['group']['servers'][srv_idx] if item['group']['servers'] else ""
-                fmt_list = item['group']['formats_by_server'].get(srv_name, [])
-                for fmt in fmt_list:
-                    combo_fmt.addItem(fmt or "")
-                fmt_idx = item.get('selected_format', 0)
-                if fmt_idx is not None and fmt_idx < combo_fmt.count():
-                    combo_fmt.setCurrentIndex(fmt_idx)
-                combo_fmt.setProperty('row_idx', row)
-                combo_fmt.setProperty('rom_id', rom_id)
-                combo_fmt.currentIndexChanged.connect(self._basket_format_changed)
-                table.setCellWidget(row, 3, combo_fmt)
-                # Columna 4: selector de idiomas (depende de servidor y formato)
-                combo_lang = QComboBox()
-                fmt_name = fmt_list[fmt_idx] if fmt_list and fmt_idx < len(fmt_list) else ""
-                lang_list = item['group']['langs_by_server_format'].get((srv_name, fmt_name), [])
-                for lang_str in lang_list:
-                    combo_lang.addItem(lang_str or "")
-                lang_idx = item.get('selected_lang', 0)
-                if lang_idx is not None and lang_idx < combo_lang.count():
-                    combo_lang.setCurrentIndex(lang_idx)
-                combo_lang.setProperty('row_idx', row)
-                combo_lang.setProperty('rom_id', rom_id)
-                combo_lang.currentIndexChanged.connect(self._basket_language_changed)
-                table.setCellWidget(row, 4, combo_lang)
-                # Columna 5: botones de acción (Añadir, Eliminar)
-                w = QWidget(); h = QHBoxLayout(w); h.setContentsMargins(0, 0, 0, 0)
-                btn_add = QPushButton("Añadir")
-                btn_remove = QPushButton("Eliminar")
-                btn_add.setProperty('row_idx', row)
-                btn_add.setProperty('rom_id', rom_id)
-                btn_remove.setProperty('row_idx', row)
-                btn_remove.setProperty('rom_id', rom_id)
-                btn_add.clicked.connect(self._basket_add_to_downloads)
-                btn_remove.clicked.connect(self._basket_remove_item)
-                h.addWidget(btn_add); h.addWidget(btn_remove)
-                table.setCellWidget(row, 5, w)
+        self.basket_model.refresh()
+
+    def _schedule_basket_refresh(self) -> None:
+        """Marca la cesta como modificada y programa un único refresco.
+
+        Las peticiones que lleguen antes de que venza el temporizador se
+        agrupan en el mismo refresco.
+        """
+        self._basket_dirty = True
+        if not self._basket_refresh_timer.isActive():
+            self._basket_refresh_timer.start()
+
+    def _do_refresh_basket_table(self) -> None:
+        if not self._basket_dirty:
+            return
+        self._basket_dirty = False
+        self._refresh_basket_table()
 
     # --- Resultados agrupados ---
     def _display_grouped_results(self) -> None:
         """
         Población de la tabla de resultados agrupados según los datos en
         ``self.search_groups``. Cada fila representa una ROM y dispone de
-        desplegables para servidor, formato e idioma, así como un botón para
-        añadirla a la cesta.
+        combos para seleccionar servidor, formato e idioma.
         """
         logging.debug("Displaying grouped results for %d ROMs.", len(self.search_groups))
-        # Limpiar la tabla
-        self.table_results.setRowCount(0)
-        # Ordenar por nombre de ROM para presentación consistente
-        for rom_id in sorted(self.search_groups.keys(), key=lambda x: self.search_groups[x]["name"].lower()):
-            group = self.search_groups[rom_id]
-            row = self.table_results.rowCount()
-            self.table_results.insertRow(row)
-            # Columna 0: nombre de la ROM
-            rom_item = QTableWidgetItem(group["name"])
-            rom_item.setData(Qt.ItemDataRole.UserRole, rom_id)
-            self.table_results.setItem(row, 0, rom_item)
-            # Columna 1: sistema
-            sys_item = QTableWidgetItem(group.get("system_name", "") or "")
-            self.table_results.setItem(row, 1, sys_item)
-            # Columna 2: selector de servidor
-            combo_srv = QComboBox()
-            for srv in group["servers"]:
-                combo_srv.addItem(srv or "")
-            # Selección actual
-            combo_srv.setCurrentIndex(group.get("selected_server", 0))
-            combo_srv.setProperty('rom_id', rom_id)
-            combo_srv.setProperty('row_idx', row)
-            combo_srv.currentIndexChanged.connect(self._group_server_changed)
-            self.table_results.setCellWidget(row, 2, combo_srv)
-            # Columna 3: selector de formato (depende del servidor)
-            combo_fmt = QComboBox()
-            srv_sel_index = group.get("selected_server", 0)
-            srv_name = group["servers"][srv_sel_index] if group["servers"] else ""
-            fmt_list = group["formats_by_server"].get(srv_name, [])
-            for fmt in fmt_list:
-                combo_fmt.addItem(fmt or "")
-            combo_fmt.setCurrentIndex(group.get("selected_format", 0) if fmt_list else 0)
-            combo_fmt.setProperty('rom_id', rom_id)
-            combo_fmt.setProperty('row_idx', row)
-            combo_fmt.currentIndexChanged.connect(self._group_format_changed)
-            self.table_results.setCellWidget(row, 3, combo_fmt)
-            # Columna 4: selector de idiomas (depende de servidor y formato)
-            combo_lang = QComboBox()
-            fmt_sel_index = group.get("selected_format", 0)
-            fmt_name = fmt_list[fmt_sel_index] if fmt_list and fmt_sel_index < len(fmt_list) else ""
-            lang_list = group["langs_by_server_format"].get((srv_name, fmt_name), [])
-            for lang_str in lang_list:
-                combo_lang.addItem(lang_str or "")
-            combo_lang.setCurrentIndex(group.get("selected_lang", 0) if lang_list else 0)
-            combo_lang.setProperty('rom_id', rom_id)
-            combo_lang.setProperty('row_idx', row)
-            combo_lang.currentIndexChanged.connect(self._group_language_changed)
-            self.table_results.setCellWidget(row, 4, combo_lang)
-            # Columna 5: botón para añadir a la cesta
-            btn_add = QPushButton("Añadir")
-            btn_add.setProperty('rom_id', rom_id)
-            btn_add.setProperty('row_idx', row)
-            btn_add.clicked.connect(self._add_group_to_basket)
-            self.table_results.setCellWidget(row, 5, btn_add)
+        self.results_model.set_groups(self.search_groups)
 
     def _display_arcades_grouped_results(self) -> None:
         """Pinta la tabla de resultados agrupados de Arcades."""
-        if not hasattr(self, "table_arcades"):
-            return
-        self.table_arcades.setRowCount(0)
-        for rom_id in sorted(self.arcades_search_groups.keys(), key=lambda x: self.arcades_search_groups[x]["name"].lower()):
-            group = self.arcades_search_groups[rom_id]
-            row = self.table_arcades.rowCount()
-            self.table_arcades.insertRow(row)
-            rom_item = QTableWidgetItem(group["name"])
-            rom_item.setData(Qt.ItemDataRole.UserRole, rom_id)
-            self.table_arcades.setItem(row, 0, rom_item)
-            sys_item = QTableWidgetItem(group.get("system_name", "") or "")
-            self.table_arcades.setItem(row, 1, sys_item)
-
-            combo_srv = QComboBox()
-            for srv in group["servers"]:
-                combo_srv.addItem(srv or "")
-            combo_srv.setCurrentIndex(group.get("selected_server", 0) if group["servers"] else 0)
-            combo_srv.setProperty('rom_id', rom_id)
-            combo_srv.setProperty('row_idx', row)
-            combo_srv.currentIndexChanged.connect(self._arcades_group_server_changed)
-            self.table_arcades.setCellWidget(row, 2, combo_srv)
-
-            combo_fmt = QComboBox()
-            sel_srv = group.get("selected_server", 0)
-            srv_name = group["servers"][sel_srv] if group["servers"] else ""
-            fmt_list = group["formats_by_server"].get(srv_name, [])
-            for fmt in fmt_list:
-                combo_fmt.addItem(fmt or "")
-            combo_fmt.setCurrentIndex(group.get("selected_format", 0) if fmt_list else 0)
-            combo_fmt.setProperty('rom_id', rom_id)
-            combo_fmt.setProperty('row_idx', row)
-            combo_fmt.currentIndexChanged.connect(self._arcades_group_format_changed)
-            self.table_arcades.setCellWidget(row, 3, combo_fmt)
-
-            combo_lang = QComboBox()
-            fmt_sel_index = group.get("selected_format", 0)
-            fmt_name = fmt_list[fmt_sel_index] if fmt_list and fmt_sel_index < len(fmt_list) else ""
-            lang_list = group["langs_by_server_format"].get((srv_name, fmt_name), [])
-            for lang_str in lang_list:
-                combo_lang.addItem(lang_str or "")
-            combo_lang.setCurrentIndex(group.get("selected_lang", 0) if lang_list else 0)
-            combo_lang.setProperty('rom_id', rom_id)
-            combo_lang.setProperty('row_idx', row)
-            combo_lang.currentIndexChanged.connect(self._arcades_group_language_changed)
-            self.table_arcades.setCellWidget(row, 4, combo_lang)
-
-            btn_add = QPushButton("Añadir")
-            btn_add.setProperty('rom_id', rom_id)
-            btn_add.clicked.connect(self._add_arcades_group_to_basket)
-            self.table_arcades.setCellWidget(row, 5, btn_add)
+        self.arcades_results_model.set_groups(self.arcades_search_groups)
 
     def _build_grouped_links(self, rows: Sequence[sqlite3.Row]) -> dict[int, dict]:
         groups: dict[int, dict] = {}
         for r in rows:
-            rom_id = r["rom_id"]
-            group = groups.setdefault(rom_id, {"name": r["rom_name"], "rows": [], "system_name": r["system_name"]})
+            rom_id = r[LINK_COL_ROM_ID]
+            group = groups.get(rom_id)
+            if group is None:
+                group = groups[rom_id] = {"name": r[LINK_COL_ROM_NAME], "rows": [], "system_name": r[LINK_COL_SYSTEM_NAME]}
             group["rows"].append(r)
         for group in groups.values():
-            rows_list = group["rows"]
-            servers = sorted(set((row["server"] or "") for row in rows_list))
-            formats_by_server: dict[str, List[str]] = {}
-            for srv in servers:
-                fmts = sorted(set((row["fmt"] or "") for row in rows_list if (row["server"] or "") == srv))
-                formats_by_server[srv] = fmts
-            langs_by_server_format: dict[tuple[str, str], List[str]] = {}
-            for r in rows_list:
-                srv = r["server"] or ""
-                fmt_val = r["fmt"] or ""
-                key = (srv, fmt_val)
-                lang_str = ','.join([x.strip() for x in (r["langs"] or "").split(',') if x.strip()]) or ""
-                lst = langs_by_server_format.setdefault(key, [])
-                if lang_str not in lst:
-                    lst.append(lang_str)
-            for key in langs_by_server_format:
-                langs_by_server_format[key].sort()
-            link_lookup: dict[tuple[str, str, str], sqlite3.Row] = {}
-            for r in rows_list:
-                srv = r["server"] or ""
-                fmt_val = r["fmt"] or ""
-                lang_str = ','.join([x.strip() for x in (r["langs"] or "").split(',') if x.strip()]) or ""
-                link_lookup[(srv, fmt_val, lang_str)] = r
+            servers, formats_by_server, langs_by_server_format, link_lookup = _group_choices(group["rows"])
             group["servers"] = servers
             group["formats_by_server"] = formats_by_server
             group["langs_by_server_format"] = langs_by_server_format
@@ -3788,185 +3907,12 @@ class MainWindow(QMainWindow):
             group["selected_lang"] = 0
         return groups
 
-    # --- Manejadores de cambios en los combos de resultados ---
-    def _group_server_changed(self, index: int) -> None:
-        """
-        Maneja el cambio de servidor en la tabla de resultados agrupados. Al
-        cambiar el servidor se reinician el formato e idioma seleccionados y
-        se actualizan los combos correspondientes en la fila.
-        """
-        combo = self.sender()
-        if combo is None:
-            return
-        rom_id = combo.property('rom_id')
-        row_idx = combo.property('row_idx')
-        if rom_id is None or row_idx is None:
-            return
-        group = self.search_groups.get(rom_id)
-        if not group:
-            return
-        group['selected_server'] = combo.currentIndex()
-        group['selected_format'] = 0
-        group['selected_lang'] = 0
-        # Actualizar combos de formato e idioma en la fila
-        row_idx = int(row_idx)
-        # Formato
-        srv_name = group['servers'][group['selected_server']] if group['servers'] else ""
-        fmt_combo: QComboBox = self.table_results.cellWidget(row_idx, 3)  # type: ignore
-        fmt_combo.blockSignals(True)
-        fmt_combo.clear()
-        fmt_list = group['formats_by_server'].get(srv_name, [])
-        for fmt in fmt_list:
-            fmt_combo.addItem(fmt or "")
-        fmt_combo.setCurrentIndex(0 if fmt_list else 0)
-        fmt_combo.blockSignals(False)
-        # Idiomas
-        lang_combo: QComboBox = self.table_results.cellWidget(row_idx, 4)  # type: ignore
-        lang_combo.blockSignals(True)
-        lang_combo.clear()
-        fmt_name = fmt_list[0] if fmt_list else ""
-        lang_list = group['langs_by_server_format'].get((srv_name, fmt_name), [])
-        for lang_str in lang_list:
-            lang_combo.addItem(lang_str or "")
-        lang_combo.setCurrentIndex(0 if lang_list else 0)
-        lang_combo.blockSignals(False)
-
-    def _group_format_changed(self, index: int) -> None:
-        """
-        Maneja el cambio de formato en la tabla de resultados agrupados. Al
-        cambiar el formato se reinicia el idioma seleccionado y se actualiza
-        el combo de idiomas.
-        """
-        combo = self.sender()
-        if combo is None:
-            return
-        rom_id = combo.property('rom_id')
-        row_idx = combo.property('row_idx')
-        if rom_id is None or row_idx is None:
-            return
-        group = self.search_groups.get(rom_id)
-        if not group:
-            return
-        # Actualizar índice de formato seleccionado
-        group['selected_format'] = combo.currentIndex()
-        group['selected_lang'] = 0
-        # Obtener servidor actualmente seleccionado
-        srv_idx = group.get('selected_server', 0)
-        srv_name = group['servers'][srv_idx] if group['servers'] else ""
-        fmt_list = group['formats_by_server'].get(srv_name, [])
-        fmt_name = fmt_list[combo.currentIndex()] if fmt_list and combo.currentIndex() < len(fmt_list) else ""
-        # Actualizar combo de idiomas
-        row_idx = int(row_idx)
-        lang_combo: QComboBox = self.table_results.cellWidget(row_idx, 4)  # type: ignore
-        lang_combo.blockSignals(True)
-        lang_combo.clear()
-        lang_list = group['langs_by_server_format'].get((srv_name, fmt_name), [])
-        for lang_str in lang_list:
-            lang_combo.addItem(lang_str or "")
-        lang_combo.setCurrentIndex(0 if lang_list else 0)
-        lang_combo.blockSignals(False)
-
-    def _group_language_changed(self, index: int) -> None:
-        """
-        Guarda la selección de idioma cuando cambia en la tabla de resultados agrupados.
-        """
-        combo = self.sender()
-        if combo is None:
-            return
-        rom_id = combo.property('rom_id')
-        if rom_id is None:
-            return
-        group = self.search_groups.get(rom_id)
-        if not group:
-            return
-        group['selected_lang'] = combo.currentIndex()
-
-    def _arcades_group_server_changed(self, index: int) -> None:
-        combo = self.sender()
-        if combo is None:
-            return
-        rom_id = combo.property('rom_id')
-        row_idx = combo.property('row_idx')
-        if rom_id is None or row_idx is None:
-            return
-        group = self.arcades_search_groups.get(rom_id)
-        if not group:
-            return
-        group['selected_server'] = combo.currentIndex()
-        group['selected_format'] = 0
-        group['selected_lang'] = 0
-        row_idx = int(row_idx)
-        srv_name = group['servers'][group['selected_server']] if group['servers'] else ""
-        fmt_combo: QComboBox = self.table_arcades.cellWidget(row_idx, 3)  # type: ignore
-        fmt_combo.blockSignals(True)
-        fmt_combo.clear()
-        fmt_list = group['formats_by_server'].get(srv_name, [])
-        for fmt in fmt_list:
-            fmt_combo.addItem(fmt or "")
-        fmt_combo.setCurrentIndex(0)
-        fmt_combo.blockSignals(False)
-
-        lang_combo: QComboBox = self.table_arcades.cellWidget(row_idx, 4)  # type: ignore
-        lang_combo.blockSignals(True)
-        lang_combo.clear()
-        fmt_name = fmt_list[0] if fmt_list else ""
-        lang_list = group['langs_by_server_format'].get((srv_name, fmt_name), [])
-        for lang_str in lang_list:
-            lang_combo.addItem(lang_str or "")
-        lang_combo.setCurrentIndex(0)
-        lang_combo.blockSignals(False)
-
-    def _arcades_group_format_changed(self, index: int) -> None:
-        combo = self.sender()
-        if combo is None:
-            return
-        rom_id = combo.property('rom_id')
-        row_idx = combo.property('row_idx')
-        if rom_id is None or row_idx is None:
-            return
-        group = self.arcades_search_groups.get(rom_id)
-        if not group:
-            return
-        group['selected_format'] = combo.currentIndex()
-        group['selected_lang'] = 0
-        srv_idx = group.get('selected_server', 0)
-        srv_name = group['servers'][srv_idx] if group['servers'] else ""
-        fmt_list = group['formats_by_server'].get(srv_name, [])
-        fmt_name = fmt_list[combo.currentIndex()] if fmt_list and combo.currentIndex() < len(fmt_list) else ""
-        row_idx = int(row_idx)
-        lang_combo: QComboBox = self.table_arcades.cellWidget(row_idx, 4)  # type: ignore
-        lang_combo.blockSignals(True)
-        lang_combo.clear()
-        lang_list = group['langs_by_server_format'].get((srv_name, fmt_name), [])
-        for lang_str in lang_list:
-            lang_combo.addItem(lang_str or "")
-        lang_combo.setCurrentIndex(0 if lang_list else 0)
-        lang_combo.blockSignals(False)
-
-    def _arcades_group_language_changed(self, index: int) -> None:
-        combo = self.sender()
-        if combo is None:
-            return
-        rom_id = combo.property('rom_id')
-        if rom_id is None:
-            return
-        group = self.arcades_search_groups.get(rom_id)
-        if not group:
-            return
-        group['selected_lang'] = combo.currentIndex()
-
-    def _add_group_to_basket(self) -> None:
+    def _add_group_to_basket(self, rom_id: int) -> None:
         """
         Añade la selección actual de una ROM desde la tabla de resultados a la
         cesta. Se basa en la combinación de servidor, formato e idioma
         seleccionados en la fila correspondiente.
         """
-        btn = self.sender()
-        if btn is None:
-            return
-        rom_id = btn.property('rom_id')
-        if rom_id is None:
-            return
         group = self.search_groups.get(rom_id)
         if not group:
             return
@@ -3980,96 +3926,20 @@ class MainWindow(QMainWindow):
         lang_list = group['langs_by_server_format'].get((srv_name, fmt_name), [])
         lang_name = lang_list[lang_idx] if lang_list and lang_idx < len(lang_list) else ""
         # Crear/actualizar entrada en la cesta
-        self.basket_items[rom_id] = {
-            'name': group['name'],
-            'group': group,
-            'selected_server': srv_idx,
-            'selected_format': fmt_idx,
-            'selected_lang': lang_idx,
-        }
+        self.basket_items[rom_id] = BasketRow(group['name'], group, srv_idx, fmt_idx, lang_idx)
         logging.debug("Added ROM %s to basket with server=%s, fmt=%s, lang=%s", group['name'], srv_name, fmt_name, lang_name)
-        # Refrescar la tabla de la cesta
-        self._refresh_basket_table()
+        # Insertar (o repintar) solo la fila afectada de la cesta
+        self.basket_model.add_item(rom_id)
 
-    def _add_arcades_group_to_basket(self) -> None:
-        btn = self.sender()
-        if btn is None:
-            return
-        rom_id = btn.property('rom_id')
-        if rom_id is None:
-            return
+    def _add_arcades_group_to_basket(self, rom_id: int) -> None:
         group = self.arcades_search_groups.get(rom_id)
         if not group:
             return
         srv_idx = group.get('selected_server', 0)
         fmt_idx = group.get('selected_format', 0)
         lang_idx = group.get('selected_lang', 0)
-        self.basket_items[rom_id] = {
-            'name': group['name'],
-            'group': group,
-            'selected_server': srv_idx,
-            'selected_format': fmt_idx,
-            'selected_lang': lang_idx,
-        }
-        self._refresh_basket_table()
-
-    def _basket_server_changed(self, index: int) -> None:
-        """
-        Cuando se cambia el servidor en la cesta, reinicia las selecciones de
-        formato e idioma y actualiza la tabla.
-        """
-        combo = self.sender()
-        if combo is None:
-            return
-        row = combo.property('row_idx')
-        rom_id = combo.property('rom_id')
-        if rom_id is None:
-            return
-        # Actualizar el índice de servidor en el item de la cesta
-        item = self.basket_items.get(rom_id)
-        if not item:
-            return
-        item['selected_server'] = combo.currentIndex()
-        # Reiniciar formato e idioma
-        item['selected_format'] = 0
-        item['selected_lang'] = 0
-        # Refrescar la tabla completa para actualizar los combos
-        self._refresh_basket_table()
-
-    def _basket_format_changed(self, index: int) -> None:
-        """
-        Actualiza la lista de idiomas cuando cambia el formato seleccionado en
-        la cesta. Reinicia el idioma y refresca la tabla.
-        """
-        combo = self.sender()
-        if combo is None:
-            return
-        row = combo.property('row_idx')
-        rom_id = combo.property('rom_id')
-        if rom_id is None:
-            return
-        item = self.basket_items.get(rom_id)
-        if not item:
-            return
-        item['selected_format'] = combo.currentIndex()
-        item['selected_lang'] = 0
-        # Refrescar la tabla para actualizar combo de idiomas
-        self._refresh_basket_table()
-
-    def _basket_language_changed(self, index: int) -> None:
-        """
-        Guarda la selección de idioma cuando cambia en la cesta.
-        """
-        combo = self.sender()
-        if combo is None:
-            return
-        rom_id = combo.property('rom_id')
-        if rom_id is None:
-            return
-        item = self.basket_items.get(rom_id)
-        if not item:
-            return
-        item['selected_lang'] = combo.currentIndex()
+        self.basket_items[rom_id] = BasketRow(group['name'], group, srv_idx, fmt_idx, lang_idx)
+        self.basket_model.add_item(rom_id)
 
     def _on_download_target_changed(self, _: int) -> None:
         target = self.cmb_download_target.currentData()
@@ -4107,7 +3977,7 @@ class MainWindow(QMainWindow):
                 )
                 return target, None
         else:
-            base_dir = self.le_dir.text().strip()
+            base_dir = self._cached_dest_dir
             if not base_dir:
                 QMessageBox.warning(self, "Descargas", "Selecciona una carpeta de descargas en la pestaña de Ajustes.")
                 return target, None
@@ -4115,30 +3985,36 @@ class MainWindow(QMainWindow):
 
     def _retrobat_folder_for_system(self, system_name: str) -> str:
         target = system_name.strip().lower()
-        for folder, display in self._RETROBAT_ROM_FOLDERS.items():
-            if target == display.lower() or target == folder.lower():
+        for folder, folder_key, display_key in _retrobat_rom_folder_keys():
+            if target == display_key or target == folder_key:
                 return folder
-            if target and target in display.lower():
+            if target and target in display_key:
                 return folder
         return safe_filename(system_name) or "roms"
 
-    def _process_basket_item_to_downloads(self, rom_id: int, base_dir: str, target: str = "windows") -> None:
-        """Convierte un elemento de la cesta en una descarga."""
+    def _process_basket_item_to_downloads(
+        self, rom_id: int, base_dir: str, target: str = "windows", enqueue: bool = True
+    ) -> Optional[DownloadItem]:
+        """Convierte un elemento de la cesta en una descarga.
+
+        Con ``enqueue=False`` la descarga se añade a la tabla pero no al gestor;
+        el llamador debe encolarla (por ejemplo con ``DownloadManager.add_many``).
+        """
         if rom_id not in self.basket_items:
-            return
+            return None
         item = self.basket_items[rom_id]
-        group = item['group']
-        srv_idx = item.get('selected_server', 0)
+        group = item.group
+        srv_idx = item.selected_server
         srv_name = group['servers'][srv_idx] if group['servers'] else ""
-        fmt_idx = item.get('selected_format', 0)
+        fmt_idx = item.selected_format
         fmt_list = group['formats_by_server'].get(srv_name, [])
         fmt_name = fmt_list[fmt_idx] if fmt_list and fmt_idx < len(fmt_list) else ""
-        lang_idx = item.get('selected_lang', 0)
+        lang_idx = item.selected_lang
         lang_list = group['langs_by_server_format'].get((srv_name, fmt_name), [])
         lang_name = lang_list[lang_idx] if lang_list and lang_idx < len(lang_list) else ""
         row_data = group['link_lookup'].get((srv_name, fmt_name, lang_name))
         if not row_data:
-            return
+            return None
         logging.debug(
             "Adding from basket to downloads: ROM %s, server=%s, fmt=%s, lang=%s",
             group['name'], srv_name, fmt_name, lang_name,
@@ -4165,83 +4041,62 @@ class MainWindow(QMainWindow):
             'rom_name': row_data['rom_name'] or group['name'],
         }
         self._add_download_row(download_item, src_row)  # type: ignore[arg-type]
-        self.manager.add(download_item)
-        self._bind_item_signals(download_item)
+        if enqueue:
+            self.manager.add(download_item)
+            self._bind_item_signals(download_item)
         self.items.append(download_item)
         del self.basket_items[rom_id]
+        return download_item
 
-    def _basket_add_to_downloads(self) -> None:
+    def _basket_add_to_downloads(self, rom_id: int) -> None:
         """
-        Añade la ROM seleccionada desde la cesta a la cola de descargas y la
+        Añade la ROM indicada desde la cesta a la cola de descargas y la
         elimina de la cesta. Se utiliza la combinación de servidor, formato e
         idioma actualmente seleccionada para obtener la URL correcta.
         """
-        btn = self.sender()
-        if btn is None:
-            return
-        rom_id = btn.property('rom_id')
-        if rom_id is None:
-            return
         target, dest_dir = self._resolve_download_destination()
         if not dest_dir:
             return
-        self._process_basket_item_to_downloads(int(rom_id), dest_dir, target)
-        self._refresh_basket_table()
+        rom_id = int(rom_id)
+        self._process_basket_item_to_downloads(rom_id, dest_dir, target)
+        if rom_id not in self.basket_items:
+            self.basket_model.remove_item(rom_id)
 
     def _basket_add_all_to_downloads(self) -> None:
-        """Añade todas las ROM de la cesta a la cola de descargas."""
+        """Añade todas las ROM de la cesta a la cola de descargas.
+
+        ``_process_basket_item_to_downloads`` elimina cada ROM de
+        ``basket_items``, por eso se recorre una instantánea (``tuple``) de las
+        claves y no el diccionario directamente.
+        """
         target, dest_dir = self._resolve_download_destination()
         if not dest_dir:
             return
-        for rom_id in list(self.basket_items.keys()):
-            self._process_basket_item_to_downloads(rom_id, dest_dir, target)
-        self._refresh_basket_table()
+        # Crear todas las filas y encolar las descargas de una vez: el gestor
+        # notifica y reparte la cola una sola vez en lugar de dos por elemento.
+        batch: List[DownloadItem] = []
+        for rom_id in tuple(self.basket_items):
+            download_item = self._process_basket_item_to_downloads(rom_id, dest_dir, target, enqueue=False)
+            if download_item is not None:
+                batch.append(download_item)
+        self.manager.add_many(batch)
+        for download_item in batch:
+            self._bind_item_signals(download_item)
+        self._schedule_basket_refresh()
 
-    def _basket_remove_item(self) -> None:
+    def _basket_remove_item(self, rom_id: int) -> None:
         """Elimina una ROM de la cesta sin descargarla."""
-        btn = self.sender()
-        if btn is None:
-            return
-        rom_id = btn.property('rom_id')
-        if rom_id is None:
-            return
         if rom_id in self.basket_items:
             removed = self.basket_items.pop(rom_id)
-            logging.debug("Removed ROM %s from basket", removed['name'])
-            self._refresh_basket_table()
+            logging.debug("Removed ROM %s from basket", removed.name)
+            self.basket_model.remove_item(rom_id)
 
     def _create_group_from_links(self, rom_name: str, links: Sequence[sqlite3.Row]) -> Optional[dict]:
         """Construye la estructura de agrupación para una ROM a partir de sus enlaces."""
         rows_list = list(links)
         if not rows_list:
             return None
-        servers = sorted(set((row["server"] or "") for row in rows_list))
-        formats_by_server: dict[str, List[str]] = {}
-        for srv in servers:
-            fmts = sorted(
-                set((row["fmt"] or "") for row in rows_list if (row["server"] or "") == srv)
-            )
-            formats_by_server[srv] = fmts
-        langs_by_server_format: dict[tuple[str, str], List[str]] = {}
-        for rlink in rows_list:
-            srv = rlink["server"] or ""
-            fmt_val = rlink["fmt"] or ""
-            key = (srv, fmt_val)
-            lang_str = rlink["langs"] or ""
-            lang_str = ','.join([x.strip() for x in lang_str.split(',') if x.strip()]) or ""
-            lst = langs_by_server_format.setdefault(key, [])
-            if lang_str not in lst:
-                lst.append(lang_str)
-        for key, lst in langs_by_server_format.items():
-            lst.sort()
-            langs_by_server_format[key] = lst
-        link_lookup: dict[tuple[str, str, str], sqlite3.Row] = {}
-        for rlink in rows_list:
-            srv = rlink["server"] or ""
-            fmt_val = rlink["fmt"] or ""
-            lang_str = rlink["langs"] or ""
-            lang_str = ','.join([x.strip() for x in lang_str.split(',') if x.strip()]) or ""
-            link_lookup[(srv, fmt_val, lang_str)] = rlink
+        servers, formats_by_server, langs_by_server_format, link_lookup = _group_choices(rows_list)
         group = {
             "name": rom_name,
             "rows": rows_list,
@@ -4249,13 +4104,38 @@ class MainWindow(QMainWindow):
             "formats_by_server": formats_by_server,
             "langs_by_server_format": langs_by_server_format,
             "link_lookup": link_lookup,
-            "selected_server": self._default_server_index(servers),
+            "selected_server": self._default_server_index(servers) if len(servers) > 1 else 0,
             "selected_format": 0,
             "selected_lang": 0,
             "system_name": self._row_get(rows_list[0], "system_name", ""),
         }
         return group
 
+    # Máximo de grupos memorizados en ``_group_cache``
+    _GROUP_CACHE_SIZE = 4096
+
+    def _group_for_rom(self, rom_id: int, rom_name: str, links: Sequence[sqlite3.Row]) -> Optional[dict]:
+        """
+        Devuelve la estructura de grupo de una ROM.
+
+        Usa la de la búsqueda actual si existe; si no, la construye una vez y
+        la memoriza para selecciones posteriores de la misma ROM.
+        """
+        group = self.search_groups.get(rom_id)
+        if group is not None:
+            return group
+        cache = self._group_cache
+        group = cache.get(rom_id)
+        if group is not None:
+            cache.move_to_end(rom_id)
+            return group
+        group = self._create_group_from_links(rom_name, links)
+        if group is not None:
+            cache[rom_id] = group
+            if len(cache) > self._GROUP_CACHE_SIZE:
+                cache.popitem(last=False)
+        return group
+
     @staticmethod
     def _row_get(row: object, key: str, default: str = "") -> str:
         try:
@@ -4268,6 +4148,12 @@ class MainWindow(QMainWindow):
         except Exception:
             return default
 
+    def _fetch_links_by_rom(self, rom_ids: Sequence[int]) -> Dict[int, List[sqlite3.Row]]:
+        """Obtiene los links de varias ROMs con consultas por lote, agrupados por ``rom_id``."""
+        if not rom_ids:
+            return collections.defaultdict(list)
+        return self.db.get_links_grouped_by_rom(rom_ids)
+
     def _add_links_to_basket(
         self,
         rom_id: int,
@@ -4290,14 +4176,7 @@ class MainWindow(QMainWindow):
         sel_srv = group.get("selected_server", 0)
         sel_fmt = group.get("selected_format", 0)
         sel_lang = group.get("selected_lang", 0)
-        self.basket_items[rom_id] = {
-            'name': rom_name,
-            'links': list(links),
-            'group': group,
-            'selected_server': sel_srv,
-            'selected_format': sel_fmt,
-            'selected_lang': sel_lang,
-        }
+        self.basket_items[rom_id] = BasketRow(rom_name, group, sel_srv, sel_fmt, sel_lang, list(links))
         return True
 
     def _add_selected_to_basket(self) -> None:
@@ -4306,7 +4185,7 @@ class MainWindow(QMainWindow):
 
         Esta implementación utiliza la tabla de resultados agrupados (``self.table_results``)
         en lugar de la antigua ``self.table_links``. Cada fila seleccionada se corresponde
-        con un rom_id almacenado en el ``UserRole`` del primer elemento de la fila. Si la
+        con un rom_id que se obtiene de ``self.results_model``. Si la
         ROM ya existe en la cesta, se ignora. Las opciones de servidor, formato e idioma
         predeterminadas se inicializan a 0. La estructura de grupo necesaria para las
         listas desplegables se copia de ``self.search_groups`` cuando está disponible.
@@ -4319,39 +4198,45 @@ class MainWindow(QMainWindow):
         if not indexes:
             QMessageBox.information(self, "Cesta", "No hay filas seleccionadas.")
             return
+        rom_ids: List[int] = []
         for idx in indexes:
-            row = idx.row()
-            rom_item = self.table_results.item(row, 0)
-            if rom_item is None:
-                continue
-            rom_id = rom_item.data(Qt.ItemDataRole.UserRole)
-            if rom_id is None:
-                continue
+            rom_id = self.results_model.rom_id_at(idx.row())
             # Evitar duplicados
-            if rom_id in self.basket_items:
+            if rom_id is None or rom_id in self.basket_items:
                 continue
-            # Obtener filas de links de la BD
-            try:
-                links = self.db.get_links_by_rom(int(rom_id))
-            except Exception:
+            rom_ids.append(int(rom_id))
+        # Los grupos de la búsqueda ya traen sus enlaces y opciones calculados al
+        # recibir los resultados; solo se consulta la BD (en lote) por el resto.
+        search_groups = self.search_groups
+        missing = [rom_id for rom_id in rom_ids if rom_id not in search_groups]
+        try:
+            links_by_rom = self._fetch_links_by_rom(missing) if missing else {}
+        except Exception:
+            logging.exception("Failed to fetch links for selected ROMs")
+            return
+        added: List[int] = []
+        for rom_id in rom_ids:
+            group = search_groups.get(rom_id)
+            if group is not None:
+                if self._add_links_to_basket(rom_id, group["name"], group["rows"], group):
+                    added.append(rom_id)
                 continue
+            links = links_by_rom.get(rom_id)
             if not links:
                 continue
             rom_name = links[0]['rom_name']
-            # Copiar la estructura de grupo si existe para mantener servidores, formatos e idiomas
-            group = self.search_groups.get(rom_id)
-            if group is None:
-                group = self._create_group_from_links(rom_name, links)
+            group = self._group_for_rom(rom_id, rom_name, links)
             if not group:
                 continue
-            self._add_links_to_basket(int(rom_id), rom_name, links, group)
-        # Actualizar la tabla de la cesta después de añadir los elementos
-        self._refresh_basket_table()
+            if self._add_links_to_basket(rom_id, rom_name, links, group):
+                added.append(rom_id)
+        # Insertar en la tabla de la cesta todas las filas nuevas de una vez
+        self.basket_model.add_items(added)
 
     # --- Evento de cierre ---
     def closeEvent(self, event) -> None:
         """Pregunta al usuario si desea salir cuando hay descargas activas."""
-        if self.manager._active or self.manager._queue:
+        if self.manager.has_pending:
             box = QMessageBox(self)
             box.setWindowTitle("Descargas en curso")
             box.setText("Hay descargas en curso. ¿Quieres salir?")
@@ -4370,13 +4255,17 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
         try:
-            # Guardar sesión y configuración de manera silenciosa
-            self._save_session_silent()
+            # Guardar sesión y configuración de manera silenciosa y síncrona: son
+            # escrituras atómicas pequeñas y no deben quedar en cola detrás de las
+            # descargas del pool. Cubren cualquier guardado diferido pendiente.
+            self._session_save_pending = False
+            self._write_session_file()
             self._save_config()
         except Exception:
-            pass
+            logging.exception("Failed to save session on close")
         if self._console_controller:
             self._console_controller.stop()
+        self.extractor.shutdown()
         if self.tray_icon and self.tray_icon.isVisible():
             self.tray_icon.hide()
         self.background_downloads = False
@@ -4385,17 +4274,13 @@ class MainWindow(QMainWindow):
     @staticmethod
     def _human_size(nbytes: float) -> str:
         """Convierte bytes a una representación legible (B, KB, MB…)."""
-        units = ['B', 'KB', 'MB', 'GB', 'TB']; i = 0
-        while nbytes >= 1024 and i < len(units) - 1:
-            nbytes /= 1024.0; i += 1
-        return f"{int(nbytes)} {units[i]}" if i == 0 else f"{nbytes:.2f} {units[i]}"
+        units = ('B', 'KB', 'MB', 'GB', 'TB')
+        # La unidad sale del número de bits: cada 10 bits es un factor 1024
+        i = min((max(int(nbytes), 1).bit_length() - 1) // 10, len(units) - 1)
+        value = nbytes / (1 << (i * 10))
+        return f"{int(value)} {units[i]}" if i == 0 else f"{value:.2f} {units[i]}"
 
     @staticmethod
     def _fmt_eta(sec: float) -> str:
         """Convierte un número de segundos a un formato HH:MM:SS."""
-        sec = int(sec); h = sec // 3600; m = (sec % 3600) // 60; s = sec % 60
-        if h > 0:
-            return f"{h}h {m:02d}m {s:02d}s"
-        if m > 0:
-            return f"{m}m {s:02d}s"
-        return f"{s}s"
+        return _format_eta_seconds(int(sec))
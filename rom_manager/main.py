@@ -9,12 +9,10 @@ aplicación de inmediato.
 
 from __future__ import annotations
 
-import os
 import sys
 import logging
 
 from rom_manager.paths import ensure_app_directories, log_path
-from rom_manager.utils import resource_path
 
 
 def _setup_logging() -> None:
@@ -51,9 +49,9 @@ def _setup_logging() -> None:
 
 def main() -> None:
     _setup_logging()
+    from PyQt6.QtCore import QCoreApplication, Qt
     from PyQt6.QtWidgets import QApplication  # Importar tras configurar logging
-    from PyQt6.QtGui import QIcon
-    from rom_manager.gui import MainWindow
+    from rom_manager.gui import MainWindow, app_icon
 
     class Application(QApplication):
         """Subclase que captura excepciones en el bucle de eventos de Qt."""
@@ -65,12 +63,15 @@ def main() -> None:
                 logging.exception("Unhandled exception in Qt event loop")
                 return False
 
+    # Deben fijarse antes de crear la aplicación: evitan crear ventanas nativas
+    # para los hermanos de un widget nativo y agrupan los eventos de alta frecuencia
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings)
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents)
     app = Application(sys.argv)
-    icon_path = resource_path(os.path.join("resources", "romMan.ico"))
-    if os.path.exists(icon_path):
-        icon = QIcon(icon_path)
-        if not icon.isNull():
-            app.setWindowIcon(icon)
+    # Mismo icono (ya decodificado) que usa la ventana principal
+    icon = app_icon()
+    if icon is not None:
+        app.setWindowIcon(icon)
     win = MainWindow()
     if getattr(win, "console_mode_enabled", False):
         win.showFullScreen()
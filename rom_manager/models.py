@@ -1,12 +1,14 @@
 """
 Modelos de datos utilizados por la interfaz gráfica.
 
-En este módulo se define el modelo de tabla para los resultados de búsqueda
-de enlaces. Se separa en un módulo independiente para que el código de la
+En este módulo se definen el modelo de tabla para los resultados de búsqueda
+de enlaces, el de los resultados agrupados por ROM, el de la cesta de
+descargas y el de la tabla de descargas. Se separa en un módulo independiente para que el código de la
 interfaz principal sea más conciso y modular.
 """
 
-from typing import Optional, List
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, List, Sequence
 import sqlite3
 
 from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
@@ -61,3 +63,371 @@ class LinksTableModel(QAbstractTableModel):
 
     def getRow(self, i: int) -> sqlite3.Row:
         return self._rows[i]
+
+
+@dataclass(slots=True)
+class BasketRow:
+    """Elemento de la cesta: ROM, estructura de grupo y variante elegida."""
+
+    name: str
+    group: Dict[str, Any]
+    selected_server: int = 0
+    selected_format: int = 0
+    selected_lang: int = 0
+    links: Optional[List[sqlite3.Row]] = None
+
+
+class GroupChoiceModel(QAbstractTableModel):
+    """
+    Base de las tablas de ROMs agrupadas con selección de servidor, formato e
+    idioma (resultados de búsqueda y cesta).
+
+    Las columnas con combo muestran la opción elegida y exponen la lista de
+    alternativas mediante ``OptionsRole`` para que el delegado cree el combo
+    solo al editar la celda. Las subclases pueden indicar con :meth:`_entry` dónde
+    se guarda la selección y cuál es la estructura del grupo, y cómo leerla
+    y escribirla con :meth:`_get_selection` y :meth:`_set_selection`.
+    """
+
+    HEADERS = ["ROM", "Sistema", "Servidor", "Formato", "Idioma", "Acciones"]
+    COL_SERVER, COL_FORMAT, COL_LANG, COL_ACTIONS = 2, 3, 4, 5
+    # Rol con la lista de opciones de las columnas con combo
+    OptionsRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, items: Optional[Dict[int, Any]] = None) -> None:
+        super().__init__()
+        self._items: Dict[int, Any] = items if items is not None else {}
+        self._rom_ids: List[int] = list(self._items)
+
+    def _entry(self, value: Any) -> tuple:
+        """
+        Devuelve ``(selección, grupo)`` para un valor de ``self._items``. Por
+        defecto el propio diccionario del grupo guarda la selección.
+        """
+        return value, value
+
+    @staticmethod
+    def _get_selection(state: Any) -> tuple:
+        """Devuelve los índices ``(servidor, formato, idioma)`` elegidos."""
+        return (
+            state.get('selected_server', 0) or 0,
+            state.get('selected_format', 0) or 0,
+            state.get('selected_lang', 0) or 0,
+        )
+
+    @staticmethod
+    def _set_selection(state: Any, server: int, fmt: int, lang: int) -> None:
+        state['selected_server'] = server
+        state['selected_format'] = fmt
+        state['selected_lang'] = lang
+
+    def rom_id_at(self, row: int) -> Optional[int]:
+        if 0 <= row < len(self._rom_ids):
+            return self._rom_ids[row]
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rom_ids)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.HEADERS)
+
+    def _selection(self, state: Any, group: dict) -> tuple:
+        """Devuelve las listas de opciones y los índices elegidos de una fila."""
+        srv_idx, fmt_idx, lang_idx = self._get_selection(state)
+        servers = group['servers']
+        srv_name = servers[srv_idx] if srv_idx < len(servers) else ""
+        fmt_list = group['formats_by_server'].get(srv_name, [])
+        fmt_name = fmt_list[fmt_idx] if fmt_idx < len(fmt_list) else ""
+        lang_list = group['langs_by_server_format'].get((srv_name, fmt_name), [])
+        return (servers, srv_idx), (fmt_list, fmt_idx), (lang_list, lang_idx)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> QVariant:
+        if not index.isValid():
+            return QVariant()
+        value = self._items.get(self._rom_ids[index.row()])
+        if value is None:
+            return QVariant()
+        state, group = self._entry(value)
+        c = index.column()
+        if c < self.COL_SERVER:
+            if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+                if c == 0:
+                    return group['name']
+                return group.get('system_name', '') or ''
+            return QVariant()
+        if c == self.COL_ACTIONS:
+            return QVariant()
+        values, idx = self._selection(state, group)[c - self.COL_SERVER]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return (values[idx] or '') if idx < len(values) else ''
+        if role == Qt.ItemDataRole.EditRole:
+            return idx
+        if role == self.OptionsRole:
+            return values
+        return QVariant()
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        c = index.column()
+        if c not in (self.COL_SERVER, self.COL_FORMAT, self.COL_LANG):
+            return False
+        entry = self._items.get(self._rom_ids[index.row()])
+        if entry is None:
+            return False
+        state, _ = self._entry(entry)
+        value = int(value)
+        current = self._get_selection(state)
+        if current[c - self.COL_SERVER] == value:
+            return False
+        # Cambiar el servidor reinicia formato e idioma; cambiar el formato, el idioma
+        if c == self.COL_SERVER:
+            self._set_selection(state, value, 0, 0)
+        elif c == self.COL_FORMAT:
+            self._set_selection(state, current[0], value, 0)
+        else:
+            self._set_selection(state, current[0], current[1], value)
+        row = index.row()
+        self.dataChanged.emit(self.index(row, c), self.index(row, self.COL_LANG))
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.isValid() and self.COL_SERVER <= index.column() <= self.COL_LANG:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> QVariant:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return QVariant()
+
+
+class GroupedResultsModel(GroupChoiceModel):
+    """
+    Resultados de búsqueda agrupados por ROM.
+
+    Cada grupo guarda su propia selección de servidor, formato e idioma; las
+    filas se ordenan por nombre de ROM. La vista recibe las filas por lotes
+    de ``FETCH_BATCH`` (``canFetchMore``/``fetchMore``) a medida que se
+    desplaza, así que una búsqueda con miles de ROMs no las maqueta todas.
+    """
+
+    HEADERS = ["ROM", "Sistema", "Servidor", "Formato", "Idiomas", "Acciones"]
+    FETCH_BATCH = 200
+
+    def __init__(self, items: Optional[Dict[int, Any]] = None) -> None:
+        super().__init__(items)
+        # Filas ya entregadas a la vista (prefijo de ``self._rom_ids``)
+        self._loaded = len(self._rom_ids)
+
+    def set_groups(self, groups: Dict[int, dict]) -> None:
+        self.beginResetModel()
+        self._items = groups
+        self._rom_ids = sorted(groups, key=lambda rom_id: groups[rom_id]["name"].lower())
+        self._loaded = min(len(self._rom_ids), self.FETCH_BATCH)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._rom_ids)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, len(self._rom_ids) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+
+class BasketTableModel(GroupChoiceModel):
+    """
+    Modelo de la cesta de descargas para uno o varios ``QTableView``.
+
+    Trabaja directamente sobre el diccionario ``rom_id -> BasketRow`` de la
+    ventana, de modo que no duplica datos; la selección se guarda en el
+    propio elemento de la cesta.
+    """
+
+    def _entry(self, value: BasketRow) -> tuple:
+        return value, value.group
+
+    @staticmethod
+    def _get_selection(state: BasketRow) -> tuple:
+        return state.selected_server, state.selected_format, state.selected_lang
+
+    @staticmethod
+    def _set_selection(state: BasketRow, server: int, fmt: int, lang: int) -> None:
+        state.selected_server = server
+        state.selected_format = fmt
+        state.selected_lang = lang
+
+    def refresh(self) -> None:
+        """Vuelve a leer el orden de filas del diccionario de la cesta."""
+        self.beginResetModel()
+        self._rom_ids = list(self._items)
+        self.endResetModel()
+
+    def add_item(self, rom_id: int) -> None:
+        """Inserta la fila de ``rom_id`` (ya presente en el diccionario) o la repinta si existe."""
+        try:
+            row = self._rom_ids.index(rom_id)
+        except ValueError:
+            n = len(self._rom_ids)
+            self.beginInsertRows(QModelIndex(), n, n)
+            self._rom_ids.append(rom_id)
+            self.endInsertRows()
+            return
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.COL_LANG))
+
+    def add_items(self, rom_ids: Sequence[int]) -> None:
+        """Inserta de una vez las filas nuevas de ``rom_ids`` al final de la tabla."""
+        present = set(self._rom_ids)
+        new_ids = [rom_id for rom_id in dict.fromkeys(rom_ids) if rom_id not in present]
+        if not new_ids:
+            return
+        n = len(self._rom_ids)
+        self.beginInsertRows(QModelIndex(), n, n + len(new_ids) - 1)
+        self._rom_ids.extend(new_ids)
+        self.endInsertRows()
+
+    def remove_item(self, rom_id: int) -> None:
+        """Quita la fila de ``rom_id`` tras eliminarlo del diccionario."""
+        try:
+            row = self._rom_ids.index(rom_id)
+        except ValueError:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rom_ids[row]
+        self.endRemoveRows()
+
+
+@dataclass(slots=True)
+class DownloadRow:
+    """Estado visible de una fila de la tabla de descargas."""
+
+    item: Any
+    name: str
+    system: str = ""
+    fmt: str = ""
+    size: str = ""
+    status: str = "En cola"
+    progress: int = 0
+    speed: str = "-"
+    eta: str = "-"
+    # La barra de progreso se pinta en verde mientras se extrae el archivo
+    extracting: bool = False
+    # Descarga cargada de una sesión: el tercer botón reinicia en vez de cancelar
+    loaded: bool = False
+
+
+class DownloadsTableModel(QAbstractTableModel):
+    """
+    Modelo de la tabla de descargas.
+
+    Cada fila guarda su estado en un ``DownloadRow`` y mantiene ``item.row``
+    sincronizado con su posición. Las actualizaciones emiten ``dataChanged``
+    solo sobre las columnas modificadas, de modo que la vista repinta
+    únicamente las celdas visibles afectadas.
+    """
+
+    HEADERS = ["Nombre", "Sistema", "Formato", "Tamaño", "Estado", "Progreso", "Velocidad", "ETA", "Acciones"]
+    COL_STATUS = 4
+    COL_PROGRESS = 5
+    COL_ACTIONS = 8
+    # (progreso, extrayendo) para el delegado de la columna de progreso
+    ProgressRole = Qt.ItemDataRole.UserRole + 1
+    # Pares (icono, texto de ayuda) de los botones de la columna de acciones
+    ButtonsRole = Qt.ItemDataRole.UserRole + 2
+
+    # Atributo de ``DownloadRow`` -> columna que lo muestra
+    _FIELD_COLUMNS = {
+        "name": 0, "system": 1, "fmt": 2, "size": 3, "status": 4,
+        "progress": 5, "extracting": 5, "speed": 6, "eta": 7, "loaded": 8,
+    }
+
+    def __init__(self, buttons: Sequence[Sequence[tuple]] = ((), ())) -> None:
+        """``buttons`` son los botones de acciones para filas normales y cargadas."""
+        super().__init__()
+        self._rows: List[DownloadRow] = []
+        self._buttons = tuple(tuple(b) for b in buttons)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> QVariant:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return QVariant()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        r = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == self.COL_PROGRESS:
+                return f"{r.progress}%"
+            if col == self.COL_ACTIONS:
+                return None
+            return (r.name, r.system, r.fmt, r.size, r.status, None, r.speed, r.eta)[col]
+        if role == Qt.ItemDataRole.ToolTipRole and col in (0, self.COL_STATUS):
+            return r.name if col == 0 else r.status
+        if role == self.ProgressRole and col == self.COL_PROGRESS:
+            return r.progress, r.extracting
+        if role == self.ButtonsRole and col == self.COL_ACTIONS:
+            return self._buttons[1 if r.loaded else 0]
+        return None
+
+    def row_at(self, row: int) -> Optional[DownloadRow]:
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def item_at(self, row: int) -> Any:
+        r = self.row_at(row)
+        return r.item if r is not None else None
+
+    def status(self, row: int) -> str:
+        r = self.row_at(row)
+        return r.status if r is not None else ""
+
+    def append(self, row: DownloadRow) -> int:
+        """Añade una fila al final y asigna ``row.item.row``."""
+        n = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n, n)
+        self._rows.append(row)
+        row.item.row = n
+        self.endInsertRows()
+        return n
+
+    def remove_row(self, row: int) -> None:
+        """Quita una fila y desplaza ``item.row`` de las siguientes."""
+        if not 0 <= row < len(self._rows):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        removed = self._rows.pop(row)
+        for r in self._rows[row:]:
+            r.item.row -= 1
+        self.endRemoveRows()
+        removed.item.row = None
+
+    def update(self, row: int, **fields: Any) -> None:
+        """Cambia varios campos de una fila y emite un único ``dataChanged``."""
+        r = self.row_at(row)
+        if r is None:
+            return
+        cols = []
+        for name, value in fields.items():
+            if getattr(r, name) != value:
+                setattr(r, name, value)
+                cols.append(self._FIELD_COLUMNS[name])
+        if cols:
+            self.dataChanged.emit(self.index(row, min(cols)), self.index(row, max(cols)))
@@ -2,13 +2,16 @@
 Módulo de utilidades para el gestor de ROMs.
 
 Actualmente contiene funciones auxiliares que se utilizan en distintas
-partes de la aplicación, como la sanitización de nombres de archivo y la
+partes de la aplicación, como la sanitización de nombres de archivo, la
+lectura/escritura de JSON (con ``orjson`` si está disponible) y la
 extracción de archivos comprimidos con soporte para progreso.
 """
 
 from __future__ import annotations
 
+import functools
 import importlib
+import json
 import os
 import sys
 import shutil
@@ -16,14 +19,22 @@ import tarfile
 import zipfile
 from pathlib import Path
 from types import ModuleType
-from typing import Callable, Optional
+from typing import IO, Any, Callable, Optional
 
 
+# Caracteres no válidos en nombres de archivo -> ``_`` (tabla para ``str.translate``)
+_BAD_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*\n\r\t', '_'))
+
+
+@functools.lru_cache(maxsize=8192)
 def safe_filename(name: str) -> str:
-    """Sanitiza un nombre de archivo sustituyendo caracteres no válidos."""
+    """Sanitiza un nombre de archivo sustituyendo caracteres no válidos.
 
-    bad = '<>:"/\\|?*\n\r\t'
-    return ''.join('_' if c in bad else c for c in name).strip()
+    Es una función pura y se memoriza: al encolar muchos enlaces del mismo
+    origen se repiten los mismos nombres.
+    """
+
+    return name.translate(_BAD_FILENAME_CHARS).strip()
 
 
 def resource_path(relative_path: str) -> str:
@@ -37,6 +48,86 @@ def resource_path(relative_path: str) -> str:
     return str((base_path / relative_path).resolve())
 
 
+try:  # pragma: no cover - depende de la instalación de orjson
+    import orjson as _orjson  # type: ignore
+except ImportError:  # pragma: no cover - depende del entorno
+    _orjson = None
+
+# Los ficheros de sesión y configuración solo los lee la aplicación, así que se
+# escriben compactos. Para depurarlos a mano puede activarse el sangrado con
+# la variable de entorno ``ROM_MANAGER_PRETTY_JSON=1``.
+PRETTY_JSON = os.environ.get("ROM_MANAGER_PRETTY_JSON", "") not in ("", "0")
+
+
+def json_dumps(obj: Any, pretty: Optional[bool] = None) -> bytes:
+    """Serializa ``obj`` a JSON codificado en UTF-8.
+
+    Usa ``orjson`` si está instalado y, si no, el módulo estándar ``json``.
+    La salida es compacta salvo que se pida ``pretty`` (por defecto
+    ``PRETTY_JSON``).
+    """
+
+    if pretty is None:
+        pretty = PRETTY_JSON
+    if _orjson is not None:
+        option = _orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= _orjson.OPT_INDENT_2
+        return _orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Interpreta un documento JSON (``bytes`` o ``str``)."""
+
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def json_load(fh: IO[bytes]) -> Any:
+    """Lee y decodifica un documento JSON desde un fichero abierto en modo binario.
+
+    El fichero se lee de una sola vez y se decodifica en memoria, en lugar de
+    dejar que el decodificador lo consuma por bloques.
+    """
+
+    return json_loads(fh.read())
+
+
+def json_read(path: str | os.PathLike[str]) -> Any:
+    """Lee y decodifica un fichero JSON con una sola lectura de bytes.
+
+    Con ``orjson`` los bytes se interpretan directamente, sin decodificarlos
+    antes a texto.
+    """
+
+    return json_loads(Path(path).read_bytes())
+
+
+def write_bytes_atomic(path: str | os.PathLike[str], data: bytes) -> None:
+    """Escribe ``data`` en ``path`` de forma atómica.
+
+    El contenido se escribe primero en un fichero ``.tmp`` junto al destino y
+    después se sustituye con :func:`os.replace`, de modo que un cierre
+    inesperado nunca deja el fichero a medias.
+    """
+
+    tmp_path = f"{os.fspath(path)}.tmp"
+    try:
+        with open(tmp_path, 'wb') as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 _PY7ZR_MODULE: ModuleType | None = None
 _PY7ZR_IMPORT_ERROR: BaseException | None = None
 